@@ -0,0 +1,24 @@
+"Generate `scale` times 200 expenses, with one pair and one triple summing to 2020."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    # Entries below 1010 can only reach 2020 with a larger one, and entries
+    # above 1010 only with smaller ones, so a few small entries and many large
+    # ones avoiding the small entries' partners keep the answers unique.
+    while True:
+        p = rng.randint(500, 800)
+        q = rng.randint(500, 800)
+        r = 2020 - p - q
+        a = rng.randint(100, 1000)
+        smalls = [a, p, q, r]
+        if len(set(smalls)) == 4 and a not in (p + q, p + r, q + r) and r < 1010:
+            break
+    forbidden = {2020 - s for s in smalls} | {
+        2020 - s - t for i, s in enumerate(smalls) for t in smalls[i + 1 :]
+    }
+    candidates = [n for n in range(1011, 2020) if n not in forbidden]
+    entries = [rng.choice(candidates) for _ in range(200 * scale - 5)]
+    entries += [*smalls, 2020 - a]
+    rng.shuffle(entries)
+    return "".join(f"{n}\n" for n in entries)
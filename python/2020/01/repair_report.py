@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 
+from advent.registry import solution
+
+
 class ExpenseReport(list):
 
     @classmethod
     def from_list(cls, l):
         return cls(l)
 
+    @classmethod
+    def from_string(cls, s):
+        return cls([int(line) for line in s.splitlines() if line])
+
     @classmethod
     def from_file(cls, filename):
         with open(filename, "r") as f:
-            expenses = [int(line) for line in f.readlines() if line]
-            return cls(expenses)
+            return cls.from_string(f.read())
 
 
 def find_two_entries_that_sum_to_2020(expenses):
@@ -38,6 +44,16 @@ def solve_part_2(expense_report):
     return a * b * c
 
 
+@solution(2020, 1, 1)
+def part1(input):
+    return solve_part_1(ExpenseReport.from_string(input))
+
+
+@solution(2020, 1, 2)
+def part2(input):
+    return solve_part_2(ExpenseReport.from_string(input))
+
+
 def main():
     expense_report = ExpenseReport.from_file('input.txt')
     print(solve_part_1(expense_report))
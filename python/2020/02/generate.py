@@ -0,0 +1,18 @@
+"Generate password databases: `scale` times 1000 policies and passwords."
+import random
+import string
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(1000 * scale):
+        low = rng.randint(1, 10)
+        high = rng.randint(low + 1, 20)
+        char = rng.choice(string.ascii_lowercase)
+        length = rng.randint(high, high + 5)
+        password = "".join(
+            char if rng.random() < 0.3 else rng.choice(string.ascii_lowercase)
+            for _ in range(length)
+        )
+        lines.append(f"{low}-{high} {char}: {password}\n")
+    return "".join(lines)
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from advent.registry import solution
+
+
 class PasswordPolicy:
     def __init__(self, p1, p2, char):
         self.p1 = p1
@@ -39,14 +42,19 @@ class Password(str):
     def from_line(cls, line):
         return cls.parse_line(line)
 
-    
-def main():
-    lines = [line.strip() for line in open('input.txt', 'r').readlines()]
+
+@solution(2020, 2, 2)
+def part2(input):
+    lines = [line.strip() for line in input.splitlines()]
     passwords = [Password.from_line(line) for line in lines]
     policies = [PasswordPolicy.from_line(line) for line in lines]
     results = [policy.valid(password) for policy, password in zip(policies, passwords)]
-    num_valid_passwords = len([result for result in results if result])
-    print(num_valid_passwords)
+    return len([result for result in results if result])
+
+
+def main():
+    with open('input.txt', 'r') as f:
+        print(part2(f.read()))
     
 
 if __name__ == "__main__":
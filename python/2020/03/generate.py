@@ -0,0 +1,9 @@
+"Generate maps of trees: 31 columns and `scale` times 323 rows."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(
+        "".join("#" if rng.random() < 0.25 else "." for _ in range(31)) + "\n"
+        for _ in range(323 * scale)
+    )
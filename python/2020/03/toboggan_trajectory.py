@@ -3,18 +3,23 @@ from functools import reduce
 from itertools import accumulate
 import operator
 
+from advent.registry import solution
+
+
 class Map:
     TREE = '#'
     
     def __init__(self, grid):
         self.grid = grid
 
+    @classmethod
+    def from_string(cls, s):
+        return cls([list(line.strip()) for line in s.splitlines()])
+
     @classmethod
     def from_file(cls, filename):
         with open(filename, 'r') as f:
-            lines = [line.strip() for line in f.readlines()]
-            grid = [list(line) for line in lines]
-            return cls(grid)
+            return cls.from_string(f.read())
 
     def trees_for_slope(self, right, down):
         x, y = 0, 0
@@ -32,20 +37,30 @@ class Map:
         return trees
 
 
-def part1(map):
+def trees_for_part1(map):
     return map.trees_for_slope(3, 1)
 
     
-def part2(map):
+def trees_for_part2(map):
     slopes = ((1, 1), (3, 1), (5, 1), (7, 1), (1, 2))
     trees = (map.trees_for_slope(*slope) for slope in slopes)
     return reduce(operator.mul, trees)
 
+
+@solution(2020, 3, 1)
+def part1(input):
+    return trees_for_part1(Map.from_string(input))
+
+
+@solution(2020, 3, 2)
+def part2(input):
+    return trees_for_part2(Map.from_string(input))
+
     
 def main():
     map = Map.from_file('input.txt')
-    print(part1(map))
-    print(part2(map))
+    print(trees_for_part1(map))
+    print(trees_for_part2(map))
 
 
 if __name__ == '__main__':
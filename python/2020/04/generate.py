@@ -0,0 +1,43 @@
+"Generate batches of `scale` times 290 passports, some missing or with invalid fields."
+import random
+
+EYE_COLORS = ("amb", "blu", "brn", "gry", "grn", "hzl", "oth")
+
+
+def field(name: str, rng: random.Random) -> str:
+    valid = rng.random() < 0.8
+    match name:
+        case "byr":
+            return str(rng.randint(1920, 2002) if valid else rng.randint(1900, 2030))
+        case "iyr":
+            return str(rng.randint(2010, 2020) if valid else rng.randint(2000, 2030))
+        case "eyr":
+            return str(rng.randint(2020, 2030) if valid else rng.randint(2010, 2040))
+        case "hgt":
+            if rng.random() < 0.5:
+                return f"{rng.randint(150, 193) if valid else rng.randint(100, 250)}cm"
+            return f"{rng.randint(59, 76) if valid else rng.randint(30, 99)}in"
+        case "hcl":
+            digits = "0123456789abcdef" if valid else "0123456789xyz"
+            return "#" + "".join(rng.choice(digits) for _ in range(6))
+        case "ecl":
+            return rng.choice(EYE_COLORS if valid else ("xry", "zzz", "blu"))
+        case "pid":
+            return "".join(rng.choice("0123456789") for _ in range(9 if valid else 8))
+        case _:
+            return str(rng.randint(50, 350))
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    names = ["byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid", "cid"]
+    passports = []
+    for _ in range(290 * scale):
+        fields = [
+            f"{name}:{field(name, rng)}" for name in names if rng.random() < 0.9
+        ]
+        rng.shuffle(fields)
+        # Fields are separated by spaces or newlines.
+        passports.append(
+            "".join(f + rng.choice(" \n") for f in fields[:-1]) + fields[-1]
+        )
+    return "\n\n".join(passports) + "\n"
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from advent.registry import solution
+
+
 class Passport:
     properties = set((
         'byr', 'iyr', 'eyr', 'hgt',
@@ -25,20 +28,28 @@ class PassportsBatch:
     def __init__(self, passports):
         self.passports = passports
 
+    @classmethod
+    def from_string(cls, contents):
+        # Passports are separated by '\n\n'
+        passport_strings = contents.split('\n\n')
+        passports = [Passport.from_string(s) for s in passport_strings]
+        return cls(passports)
+
     @classmethod
     def from_file(cls, filename):
         with open(filename, 'r') as f:
-            contents = f.read()
-            # Passports are separated by '\n\n'
-            passport_strings = contents.split('\n\n')
-            passports = [Passport.from_string(s) for s in passport_strings]
-            return cls(passports)
+            return cls.from_string(f.read())
         
 
+@solution(2020, 4, 1)
+def part1(input):
+    batch = PassportsBatch.from_string(input)
+    return sum([passport.valid for passport in batch.passports])
+
+
 def main():
-    batch = PassportsBatch.from_file('input.txt')
-    num_valid = sum([passport.valid for passport in batch.passports])
-    print(num_valid)
+    with open('input.txt', 'r') as f:
+        print(part1(f.read()))
 
 
 if __name__ == '__main__':
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from advent.registry import solution
+
+
 class PassportField(str):
     @property
     def valid(self):
@@ -114,14 +117,17 @@ class PassportsBatch:
     def __init__(self, passports):
         self.passports = passports
 
+    @classmethod
+    def from_string(cls, contents):
+        # Passports are separated by '\n\n'
+        passport_strings = contents.split('\n\n')
+        passports = [Passport.from_string(s) for s in passport_strings]
+        return cls(passports)
+
     @classmethod
     def from_file(cls, filename):
         with open(filename, 'r') as f:
-            contents = f.read()
-            # Passports are separated by '\n\n'
-            passport_strings = contents.split('\n\n')
-            passports = [Passport.from_string(s) for s in passport_strings]
-            return cls(passports)
+            return cls.from_string(f.read())
 
     def __iter__(self):
         # Make PassportsBatch iterable with a generator expression.
@@ -129,10 +135,15 @@ class PassportsBatch:
         return (passport for passport in self.passports)
 
 
+@solution(2020, 4, 2)
+def part2(input):
+    batch = PassportsBatch.from_string(input)
+    return sum([passport.valid for passport in batch])
+
+
 def main():
-    batch = PassportsBatch.from_file('input.txt')
-    num_valid = sum([passport.valid for passport in batch])
-    print(num_valid)
+    with open('input.txt', 'r') as f:
+        print(part2(f.read()))
 
 
 if __name__ == '__main__':
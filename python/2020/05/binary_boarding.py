@@ -2,6 +2,8 @@
 
 from functools import cached_property
 
+from advent.registry import solution
+
 
 def bsp(a, b, s):
     #print(a, b, s)
@@ -37,20 +39,30 @@ class BoardingPass(str):
         return self.row * 8 + self.col
 
 
-def main():
-    with open('input.txt', 'r') as f:
-        boarding_passes = [BoardingPass(line.strip()) for line in f.readlines()]
+def seat_ids(input):
+    return [BoardingPass(line.strip()).seat_id for line in input.splitlines()]
+
+
+@solution(2020, 5, 1)
+def part1(input):
+    return max(seat_ids(input))
 
-    seat_ids = [boarding_pass.seat_id for boarding_pass in boarding_passes]
-    highest_seat_id = max(seat_ids)
 
-    sorted_seat_ids = sorted(seat_ids)
+@solution(2020, 5, 2)
+def part2(input):
+    sorted_seat_ids = sorted(seat_ids(input))
     for i, sid in enumerate(sorted_seat_ids[:-1]):
         if sorted_seat_ids[i+1] != sid + 1:
             missing_seat_id = sid + 1
+    return missing_seat_id
+
+
+def main():
+    with open('input.txt', 'r') as f:
+        input = f.read()
 
-    print(highest_seat_id)
-    print(missing_seat_id)
+    print(part1(input))
+    print(part2(input))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,17 @@
+"""Generate boarding passes for a full flight but one seat.
+
+There are only 1024 seats, so the input stops growing at `scale` 1.
+"""
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    seats = list(range(rng.randint(30, 90), rng.randint(850, 1000)))
+    seats.remove(rng.choice(seats[1:-1]))
+    rng.shuffle(seats)
+    return "".join(
+        f"{seat >> 3:07b}".translate(str.maketrans("01", "FB"))
+        + f"{seat & 7:03b}".translate(str.maketrans("01", "LR"))
+        + "\n"
+        for seat in seats
+    )
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from advent.registry import solution
+
+
 class Individual(str):
     @property
     def answered_yes_to(self):
@@ -27,15 +30,24 @@ class Groups(list):
         return cls([Group.from_string(group) for group in groups.split('\n\n')])
 
 
+@solution(2020, 6, 1)
+def part1(input):
+    groups = Groups.from_string(input)
+    return sum([len(group.questions_anyone_answered_yes_to) for group in groups])
+
+
+@solution(2020, 6, 2)
+def part2(input):
+    groups = Groups.from_string(input)
+    return sum([len(group.questions_everyone_answered_yes_to) for group in groups])
+
+
 def main():
     with open('input.txt', 'r') as f:
         input = f.read()
 
-    groups = Groups.from_string(input)
-    sum_group_anyone_counts = sum([len(group.questions_anyone_answered_yes_to) for group in groups])
-    sum_group_everyone_counts = sum([len(group.questions_everyone_answered_yes_to) for group in groups])
-    print(sum_group_anyone_counts)
-    print(sum_group_everyone_counts)
+    print(part1(input))
+    print(part2(input))
 
 
 if __name__ == '__main__':
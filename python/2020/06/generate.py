@@ -0,0 +1,16 @@
+"Generate customs declaration forms for `scale` times 490 groups."
+import random
+import string
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    groups = []
+    for _ in range(490 * scale):
+        common = set(rng.sample(string.ascii_lowercase, rng.randint(0, 5)))
+        people = []
+        for _ in range(rng.randint(1, 5)):
+            own = rng.sample(string.ascii_lowercase, rng.randint(1, 10))
+            answers = common | set(own)
+            people.append("".join(rng.sample(sorted(answers), len(answers))))
+        groups.append("\n".join(people))
+    return "\n\n".join(groups) + "\n"
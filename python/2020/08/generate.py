@@ -0,0 +1,43 @@
+"""Generate boot code of `scale` times 600 instructions.
+
+The code loops forever, unless one `jmp` on the path it takes is changed to a
+`nop`.
+"""
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    size = 600 * scale
+    code = [None] * size
+    # Lay out a path from the first instruction to the end, jumping forwards
+    # over instructions that are never run.
+    path = []
+    ip = 0
+    while ip < size:
+        path.append(ip)
+        if ip + 1 < size and rng.random() < 0.2:
+            skip = rng.randint(2, min(10, size - ip))
+            code[ip] = ("jmp", skip)
+            ip += skip
+        else:
+            if rng.random() < 0.7:
+                code[ip] = ("acc", rng.randint(-50, 50))
+            else:
+                code[ip] = ("nop", 0)
+            ip += 1
+
+    # Replace one instruction on the second half of the path that doesn't jump
+    # with a jump back to an earlier one, so the path becomes a loop.
+    broken = rng.choice([ip for ip in path[len(path) // 2 :] if code[ip][0] != "jmp"])
+    code[broken] = ("jmp", rng.choice(path[: len(path) // 2]) - broken)
+
+    # A nop's argument only matters if it's changed to a jmp, and then it
+    # should loop too.
+    for ip in path:
+        if code[ip][0] == "nop" and ip > 0:
+            code[ip] = ("nop", -rng.randint(1, ip))
+    # Instructions that are never run jump backwards as well.
+    for ip in range(1, size):
+        if code[ip] is None:
+            code[ip] = ("jmp", -rng.randint(1, ip))
+    return "".join(f"{op} {arg:+d}\n" for op, arg in code)
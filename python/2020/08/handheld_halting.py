@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from advent.registry import solution
+
+
 class InvalidOperation(Exception):
     pass
 
@@ -22,10 +25,14 @@ class Code:
     def __init__(self, instructions):
         self._instructions = instructions
 
+    @classmethod
+    def from_string(cls, s):
+        return cls([Instruction.from_string(line) for line in s.splitlines()])
+
     @classmethod
     def from_file(cls, filename):
         with open(filename, 'r') as f:
-            return cls([Instruction.from_string(line) for line in f.readlines()])
+            return cls.from_string(f.read())
 
     def __len__(self):
         return len(self._instructions)
@@ -68,8 +75,9 @@ class Interpreter:
         return (prior_state, self.state)
 
 
-def main():
-    code = Code.from_file('input.txt')
+@solution(2020, 8, 1)
+def part1(input):
+    code = Code.from_string(input)
     interpreter = Interpreter(code)
     
     ips = set()
@@ -77,7 +85,12 @@ def main():
         ips.add(interpreter.state.ip)
         interpreter.next()
 
-    print(f'{interpreter.state.acc}')
+    return interpreter.state.acc
+
+
+def main():
+    with open('input.txt', 'r') as f:
+        print(f'{part1(f.read())}')
 
 
 if __name__ == '__main__':
@@ -2,6 +2,8 @@
 
 from copy import deepcopy
 
+from advent.registry import solution
+
 
 class InvalidOperation(Exception):
     pass
@@ -39,10 +41,14 @@ class Code:
     def __init__(self, instructions):
         self._instructions = instructions
 
+    @classmethod
+    def from_string(cls, s):
+        return cls([Instruction.from_string(line) for line in s.splitlines()])
+
     @classmethod
     def from_file(cls, filename):
         with open(filename, 'r') as f:
-            return cls([Instruction.from_string(line) for line in f.readlines()])
+            return cls.from_string(f.read())
 
     def __len__(self):
         return len(self._instructions)
@@ -129,15 +135,21 @@ class Interpreter:
         return self.state
 
 
-def main():
-    code = Code.from_file('input.txt')
+@solution(2020, 8, 2)
+def part2(input):
+    code = Code.from_string(input)
     code_corrector = CodeCorrector(code)
 
     for corrected_code in code_corrector:
         interpreter = Interpreter(corrected_code)
         result = interpreter.run()
         if result:
-            print(f'{result.acc}')
+            return result.acc
+
+
+def main():
+    with open('input.txt', 'r') as f:
+        print(f'{part2(f.read())}')
 
 
 if __name__ == '__main__':
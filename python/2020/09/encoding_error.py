@@ -2,6 +2,8 @@
 
 from itertools import combinations
 
+from advent.registry import solution
+
 
 class InvalidNextNumber(Exception):
     def __init__(self, window, number):
@@ -18,11 +20,14 @@ class XmasCypher:
         self.preamble = numbers[:window_size]
         self.numbers = numbers[window_size:]
 
+    @classmethod
+    def from_string(cls, s):
+        return cls([int(line.strip()) for line in s.splitlines()])
+
     @classmethod
     def from_file(cls, filename):
         with open(filename, 'r') as f:
-            numbers = [int(line.strip()) for line in f.readlines()]
-            return cls(numbers)
+            return cls.from_string(f.read())
 
     @property
     def windows(self):
@@ -44,6 +49,15 @@ class XmasCypher:
                 raise InvalidNextNumber(window, number)
 
 
+@solution(2020, 9, 1)
+def part1(input):
+    cypher = XmasCypher.from_string(input)
+    try:
+        cypher.validate()
+    except InvalidNextNumber as e:
+        return e.number
+
+
 def main():
     cypher = XmasCypher.from_file('input.txt')
     try:
@@ -2,6 +2,8 @@
 
 from itertools import combinations
 
+from advent.registry import solution
+
 
 class XmasCypher:
     def __init__(self, numbers, window_size=25):
@@ -9,11 +11,14 @@ class XmasCypher:
         self.preamble = numbers[:window_size]
         self.numbers = numbers[window_size:]
 
+    @classmethod
+    def from_string(cls, s):
+        return cls([int(line.strip()) for line in s.splitlines()])
+
     @classmethod
     def from_file(cls, filename):
         with open(filename, 'r') as f:
-            numbers = [int(line.strip()) for line in f.readlines()]
-            return cls(numbers)
+            return cls.from_string(f.read())
 
     @property
     def windows(self):
@@ -49,6 +54,13 @@ class XmasCypher:
         return sum((f(summands) for f in (min, max)))
 
 
+@solution(2020, 9, 2)
+def part2(input):
+    cypher = XmasCypher.from_string(input)
+    validated, invalid_number = cypher.validate()
+    return cypher.find_encryption_weakness(invalid_number)
+
+
 def main():
     cypher = XmasCypher.from_file('input.txt')
     validated, invalid_number = cypher.validate()
@@ -0,0 +1,29 @@
+"""Generate XMAS-encrypted data of `scale` times 1000 numbers.
+
+After a 25 number preamble, every number is the sum of two of the 25 before
+it, except for one, which is the sum of a contiguous run of earlier numbers.
+"""
+from itertools import combinations
+import random
+
+WINDOW = 25
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    size = 1000 * scale
+    numbers = rng.sample(range(1, 50), WINDOW)
+    invalid_at = rng.randint(size // 2, size - 1)
+    for i in range(WINDOW, size):
+        window = numbers[i - WINDOW : i]
+        if i != invalid_at:
+            a, b = rng.sample(range(WINDOW), 2)
+            numbers.append(window[a] + window[b])
+            continue
+        sums = {a + b for a, b in combinations(window, 2)}
+        while True:
+            start = rng.randint(0, i - WINDOW)
+            total = sum(numbers[start : start + rng.randint(3, 17)])
+            if total not in sums:
+                break
+        numbers.append(total)
+    return "".join(f"{n}\n" for n in numbers)
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
-from itertools import pairwise
+from collections.abc import Iterable, Iterator
+from itertools import islice, pairwise, tee
 import unittest
 
-from advent import get_puzzle_input
+from advent import get_puzzle_input, iter_lines, iter_puzzle_input
+from advent.registry import solution
 
 YEAR = 2021
 DAY = 1
@@ -18,26 +20,31 @@ EXAMPLE = """199
 263"""
 
 
-def parse(input: str) -> list[int]:
-    return [int(x) for x in input.splitlines()]
+def parse(input: str | Iterable[str]) -> Iterator[int]:
+    return (int(x) for x in iter_lines(input))
 
 
-def part1(input: str):
+@solution(YEAR, DAY, 1)
+def part1(input: str | Iterable[str]):
     "Count the number of times a depth measurement increases from the previous measurement."
     return sum(x < y for (x, y) in pairwise(parse(input)))
 
 
-def part2(input: str):
+@solution(YEAR, DAY, 2)
+def part2(input: str | Iterable[str]):
     "Count the increases between sums of a three-measurement sliding window"
-    dms = parse(input)
-    windows = zip(dms, dms[1:], dms[2:])
-    return sum(x < y for (x, y) in pairwise(sum(window) for window in windows))
+    # Adjacent windows share two measurements, so comparing their sums is the
+    # same as comparing the measurements that differ: a + b + c < b + c + d
+    # exactly when a < d.
+    dms, dms_ahead = tee(parse(input))
+    return sum(x < y for (x, y) in zip(dms, islice(dms_ahead, 3, None)))
 
 
 class TestDay1(unittest.TestCase):
-    def setUp(self):
-        self.example = EXAMPLE
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = EXAMPLE
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 7)
@@ -47,6 +54,10 @@ class TestDay1(unittest.TestCase):
         self.assertEqual(part2(self.example), 5)
         self.assertEqual(part2(self.input), 1743)
 
+    def test_streaming(self):
+        self.assertEqual(part1(iter_puzzle_input(YEAR, DAY)), 1711)
+        self.assertEqual(part2(iter_puzzle_input(YEAR, DAY)), 1743)
+
 
 if __name__ == "__main__":
     unittest.main()
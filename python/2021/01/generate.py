@@ -0,0 +1,11 @@
+"Generate sonar sweeps of `scale` times 2000 depths drifting deeper."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    depth = rng.randint(100, 200)
+    lines = []
+    for _ in range(2000 * scale):
+        depth = max(1, depth + rng.randint(-8, 12))
+        lines.append(f"{depth}\n")
+    return "".join(lines)
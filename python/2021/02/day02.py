@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 from collections import defaultdict
+from collections.abc import Iterable
 import unittest
 
-from advent import get_puzzle_input
+from advent import get_puzzle_input, iter_lines, iter_puzzle_input
+from advent.registry import solution
 
 YEAR = 2021
 DAY = 2
@@ -14,24 +16,26 @@ down 8
 forward 2"""
 
 
-def parse(input: str) -> dict[str, int]:
+def parse(input: str | Iterable[str]) -> dict[str, int]:
     commands = defaultdict(int)
-    for line in input.strip().split("\n"):
+    for line in iter_lines(input):
         action, value = line.split()
         commands[action] += int(value)
     return commands
 
 
-def part1(input: str):
+@solution(YEAR, DAY, 1)
+def part1(input: str | Iterable[str]):
     commands = parse(input)
     horizontal_position = commands["forward"]
     depth = commands["down"] - commands["up"]
     return horizontal_position * depth
 
 
-def part2(input: str):
+@solution(YEAR, DAY, 2)
+def part2(input: str | Iterable[str]):
     horizontal_position = depth = aim = 0
-    for line in input.strip().split("\n"):
+    for line in iter_lines(input):
         action, value = line.split()
         value = int(value)
         match action:
@@ -46,9 +50,10 @@ def part2(input: str):
 
 
 class TestDay2(unittest.TestCase):
-    def setUp(self):
-        self.example = EXAMPLE
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = EXAMPLE
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 150)
@@ -58,6 +63,10 @@ class TestDay2(unittest.TestCase):
         self.assertEqual(part2(self.example), 900)
         self.assertEqual(part2(self.input), 1544000595)
 
+    def test_streaming(self):
+        self.assertEqual(part1(iter_puzzle_input(YEAR, DAY)), 1727835)
+        self.assertEqual(part2(iter_puzzle_input(YEAR, DAY)), 1544000595)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,9 @@
+"Generate `scale` times 1000 submarine commands."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(
+        f"{rng.choice(('forward', 'forward', 'down', 'up'))} {rng.randint(1, 9)}\n"
+        for _ in range(1000 * scale)
+    )
@@ -3,6 +3,7 @@ from collections import Counter
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2021
 DAY = 3
@@ -12,6 +13,7 @@ def parse(input: str) -> list[str]:
     return input.splitlines()
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     bits_by_position = zip(*parse(input))
     most_common_bits = [Counter(bits).most_common(1)[0][0] for bits in bits_by_position]
@@ -35,6 +37,7 @@ def least_common_value(values):
     return values_sorted_by_count[1][0]
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     def filter_values(values: list[int], position: int, criterion):
         if len(values) == 1:
@@ -56,9 +59,10 @@ def part2(input: str):
 
 
 class TestDay3(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 198)
@@ -0,0 +1,11 @@
+"""Generate diagnostic reports of `scale` times 1000 distinct binary numbers.
+
+Numbers are 12 bits wide, or wider if that's too few to be distinct.
+"""
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    count = 1000 * scale
+    width = max(12, (count * 4).bit_length())
+    return "".join(f"{n:0{width}b}\n" for n in rng.sample(range(2**width), count))
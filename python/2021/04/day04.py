@@ -4,6 +4,7 @@ from itertools import chain
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2021
 DAY = 4
@@ -42,6 +43,7 @@ def score(board, numbers):
     return sum(unmarked_numbers) * numbers[-1]
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     numbers, boards = parse(input)
     for i in range(5, len(numbers)):
@@ -52,6 +54,7 @@ def part1(input: str):
     raise Exception("No solution found!")
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     numbers, boards = parse(input)
     for i in range(5, len(numbers)):
@@ -64,9 +67,10 @@ def part2(input: str):
 
 
 class TestDay4(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 4512)
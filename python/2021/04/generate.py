@@ -0,0 +1,17 @@
+"Generate bingo games with `scale` times 100 boards."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    numbers = list(range(100))
+    rng.shuffle(numbers)
+    boards = []
+    for _ in range(100 * scale):
+        cells = rng.sample(range(100), 25)
+        boards.append(
+            "\n".join(
+                " ".join(f"{n:2d}" for n in cells[row * 5 : row * 5 + 5])
+                for row in range(5)
+            )
+        )
+    return ",".join(map(str, numbers)) + "\n\n" + "\n\n".join(boards) + "\n"
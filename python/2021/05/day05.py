@@ -4,6 +4,7 @@ from itertools import chain, repeat
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2021
 DAY = 5
@@ -39,6 +40,7 @@ def points_on(line) -> list[GridPoint]:
     ]
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     lines = parse(input)
     lines = [line for line in lines if is_vertical_or_horizontal_line(line)]
@@ -50,6 +52,7 @@ def part1(input: str):
     return len(points_with_two_or_more_overlapping_lines)
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     lines = parse(input)
     points = [points_on(line) for line in lines]
@@ -61,9 +64,10 @@ def part2(input: str):
 
 
 class TestDay5(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_parse(self):
         self.assertEqual(parse("0,9 -> 5,9"), [((0, 9), (5, 9))])
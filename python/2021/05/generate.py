@@ -0,0 +1,24 @@
+"Generate `scale` times 500 horizontal, vertical and diagonal lines of vents."
+import random
+
+SIZE = 1000
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    while len(lines) < 500 * scale:
+        x1, y1 = rng.randrange(SIZE), rng.randrange(SIZE)
+        dx, dy = rng.choice(DIRECTIONS)
+        # Keep the whole line on the map, so diagonals stay diagonal.
+        room = min(
+            SIZE - 1 - x1 if dx > 0 else x1 if dx < 0 else SIZE,
+            SIZE - 1 - y1 if dy > 0 else y1 if dy < 0 else SIZE,
+            SIZE // 2,
+        )
+        # Lines are at least two points long.
+        if room < 1:
+            continue
+        length = rng.randint(1, room)
+        lines.append(f"{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}\n")
+    return "".join(lines)
@@ -2,6 +2,7 @@
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2021
 DAY = 6
@@ -50,12 +51,14 @@ def simulate2(cycle: list[int], days: int):
     return cycle
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str) -> int:
     fishes = parse(input)
     simulate(fishes, 80)
     return len(fishes)
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     cycle = parse2(input)
     simulate2(cycle, 256)
@@ -63,9 +66,10 @@ def part2(input: str):
 
 
 class TestDay6(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_simulate(self):
         self.assertEqual(len(simulate(parse(self.example), 18)), 26)
@@ -0,0 +1,6 @@
+"Generate the ages of `scale` times 300 lanternfish."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return ",".join(str(rng.randint(1, 5)) for _ in range(300 * scale)) + "\n"
@@ -3,11 +3,13 @@ from functools import cache
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2021
 DAY = 7
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     crabs = [int(x) for x in input.strip().split(",")]
     fuel_costs = [
@@ -30,6 +32,7 @@ def range_sum(n: int) -> int:
     return n * (n + 1) // 2
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     crabs = [int(x) for x in input.strip().split(",")]
     fuel_costs = [
@@ -40,9 +43,10 @@ def part2(input: str):
 
 
 class TestDay7(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 37)
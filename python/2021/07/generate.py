@@ -0,0 +1,7 @@
+"Generate the positions of `scale` times 1000 crabs."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    positions = (int(rng.expovariate(1 / 400)) for _ in range(1000 * scale))
+    return ",".join(map(str, positions)) + "\n"
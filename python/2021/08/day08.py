@@ -3,6 +3,7 @@ from collections import defaultdict
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2021
 DAY = 8
@@ -15,6 +16,7 @@ def parse(input: str):
     ]
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     return sum(
         [
@@ -121,6 +123,7 @@ def decode(output_value, mapping):
     return int("".join(map(str, digits)))
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     notes = parse(input)
     mappings = [analyze(note) for note in notes]
@@ -133,9 +136,10 @@ def part2(input: str):
 
 
 class TestDay8(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 26)
@@ -0,0 +1,31 @@
+"Generate `scale` times 200 notes of scrambled seven-segment signals."
+import random
+
+DIGITS = (
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+)
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(200 * scale):
+        wires = "abcdefg"
+        mapping = str.maketrans(wires, "".join(rng.sample(wires, len(wires))))
+
+        def scramble(digit: str) -> str:
+            segments = digit.translate(mapping)
+            return "".join(rng.sample(segments, len(segments)))
+
+        patterns = [scramble(digit) for digit in rng.sample(DIGITS, len(DIGITS))]
+        output = [scramble(rng.choice(DIGITS)) for _ in range(4)]
+        lines.append(f"{' '.join(patterns)} | {' '.join(output)}\n")
+    return "".join(lines)
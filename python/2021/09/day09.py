@@ -1,62 +1,49 @@
 #!/usr/bin/env python3
 from functools import reduce
+from importlib.util import find_spec
 from operator import mul
 import unittest
 
 from advent import get_puzzle_input
+from advent.grid import Grid, Index
+from advent.registry import solution
 
 YEAR = 2021
 DAY = 9
 
-GridPoint = tuple[int, int]
-Grid = dict[GridPoint, int]
+# Surround the heightmap with 9s, which are never low points or part of a
+# basin, so every point has four neighbours.
+BORDER = 9
 
 
-def parse_grid(raw_grid: list[str]) -> Grid:
-    """
-    Returns 2-tuples of (row, col) with their value.
+def parse_grid(input: str) -> Grid:
+    return Grid.parse(input, border=BORDER, digits=True)
 
-    (0, 0) ------> (0, 9)
-      |              |
-      |              |
-      |              |
-      |              |
-      |              V
-    (9, 0) ------> (9, 9)
-    """
-    return {
-        (row, col): int(c)
-        for row, line in enumerate(raw_grid)
-        for col, c in enumerate(line)
-    }
 
-
-def find_adjacent_points(grid: Grid, point: GridPoint) -> list[GridPoint]:
-    def find_candidates(point):
-        return [
-            (point[0] + x, point[1] + y) for (x, y) in zip((-1, 1, 0, 0), (0, 0, -1, 1))
-        ]
-
-    return [candidate for candidate in find_candidates(point) if candidate in grid]
-
-
-def find_low_points(grid: Grid) -> list[GridPoint]:
+def find_low_points(grid: Grid) -> list[Index]:
     low_points = []
-    for point, height in grid.items():
-        adjacent_points = find_adjacent_points(grid, point)
-        heights = [grid[point] for point in adjacent_points]
-        if height < min(heights):
+    for point in grid.indices():
+        height = grid[point]
+        if all(height < grid[point + step] for step in grid.steps):
             low_points.append(point)
     return low_points
 
 
-def part1(input: str):
-    grid = parse_grid(input.splitlines())
+@solution(YEAR, DAY, 1)
+def part1(input: str, vectorized=False):
+    if vectorized:
+        from advent import npgrid
+
+        heights = npgrid.parse(input, digits=True)
+        low_points = heights < npgrid.neighbor_min(heights)
+        return int((heights[low_points] + 1).sum())
+
+    grid = parse_grid(input)
     low_points = find_low_points(grid)
     return sum(grid[point] + 1 for point in low_points)
 
 
-def find_basins(grid: Grid) -> list[set[GridPoint]]:
+def find_basins(grid: Grid) -> list[set[Index]]:
     basins = []
     for low_point in find_low_points(grid):
         basin = set()
@@ -65,27 +52,36 @@ def find_basins(grid: Grid) -> list[set[GridPoint]]:
             point = candidates.pop()
             if grid[point] < 9:
                 basin.add(point)
-                candidates.update(set(find_adjacent_points(grid, point)) - basin)
+                candidates.update(
+                    point + step for step in grid.steps if point + step not in basin
+                )
         basins.append(basin)
     return basins
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
-    grid = parse_grid(input.splitlines())
+    grid = parse_grid(input)
     basins = find_basins(grid)
     basins.sort(key=len, reverse=True)
     return reduce(mul, (len(basin) for basin in basins[:3]))
 
 
 class TestDay9(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 15)
         self.assertEqual(part1(self.input), 458)
 
+    @unittest.skipUnless(find_spec("numpy"), "NumPy is not installed")
+    def test_part1_vectorized(self):
+        self.assertEqual(part1(self.example, vectorized=True), 15)
+        self.assertEqual(part1(self.input, vectorized=True), 458)
+
     def test_part2(self):
         self.assertEqual(part2(self.example), 1134)
         self.assertEqual(part2(self.input), 1391940)
@@ -0,0 +1,40 @@
+"""Generate heightmaps with `scale` times the area of a 100 by 100 map.
+
+Like real inputs, the map is divided into basins by walls of 9s, and the
+height rises with the distance from each basin's lowest point.
+"""
+from collections import deque
+import math
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = round(100 * math.sqrt(scale))
+    # Grow the basins outwards from their low points all at once.
+    basin = [[-1] * side for _ in range(side)]
+    distance = [[0] * side for _ in range(side)]
+    queue = deque()
+    for i in range(side * side // 80):
+        row, col = rng.randrange(side), rng.randrange(side)
+        if basin[row][col] == -1:
+            basin[row][col] = i
+            queue.append((row, col))
+    while queue:
+        row, col = queue.popleft()
+        for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= r < side and 0 <= c < side and basin[r][c] == -1:
+                basin[r][c] = basin[row][col]
+                distance[r][c] = distance[row][col] + 1
+                queue.append((r, c))
+
+    lines = []
+    for row in range(side):
+        line = []
+        for col in range(side):
+            # Wall off each basin along its bottom and right edges.
+            edge = (row + 1 < side and basin[row + 1][col] != basin[row][col]) or (
+                col + 1 < side and basin[row][col + 1] != basin[row][col]
+            )
+            line.append("9" if edge else str(min(8, distance[row][col])))
+        lines.append("".join(line) + "\n")
+    return "".join(lines)
@@ -1,19 +1,31 @@
 #!/usr/bin/env python3
-from advent import get_puzzle_input
-
-
-# Each elf is represented by the sum of the calories they're carrying.
-elves = []
-elf = 0
-for line in get_puzzle_input(2022, 1).splitlines():
-    if line == "":
-        elves.append(elf)
-        elf = 0
-    else:
-        elf += int(line.strip())
-
-elves.sort(reverse=True)
-# Part One
-print(elves[0])
-# Part Two
-print(sum(elves[:3]))
+from advent import get_puzzle_input, iter_lines
+from advent.registry import solution
+from advent.stream import split_records
+
+
+def calories_by_elf(input):
+    "Return the calories each elf is carrying, most first."
+    # Each elf is represented by the sum of the calories they're carrying.
+    elves = [
+        sum(int(line.strip()) for line in record.splitlines())
+        for record in split_records(iter_lines(input))
+    ]
+    elves.sort(reverse=True)
+    return elves
+
+
+@solution(2022, 1, 1)
+def part1(input):
+    return calories_by_elf(input)[0]
+
+
+@solution(2022, 1, 2)
+def part2(input):
+    return sum(calories_by_elf(input)[:3])
+
+
+if __name__ == "__main__":
+    input = get_puzzle_input(2022, 1)
+    print(part1(input))
+    print(part2(input))
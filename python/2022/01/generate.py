@@ -0,0 +1,10 @@
+"Generate the calories carried by `scale` times 250 elves."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    elves = []
+    for _ in range(250 * scale):
+        items = [rng.randint(1000, 60000) for _ in range(rng.randint(1, 15))]
+        elves.append("".join(f"{item}\n" for item in items))
+    return "\n".join(elves)
@@ -20,9 +20,11 @@ class Shape(Enum):
         elif self is Shape.SCISSORS:
             return 3
 
-r = Shape.ROCK
-print(r.score)
-p = Shape.PAPER
-print(p.score)
-s = Shape.SCISSORS
-print(s.score)
+
+if __name__ == "__main__":
+    r = Shape.ROCK
+    print(r.score)
+    p = Shape.PAPER
+    print(p.score)
+    s = Shape.SCISSORS
+    print(s.score)
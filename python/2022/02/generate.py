@@ -0,0 +1,8 @@
+"Generate rock paper scissors strategy guides of `scale` times 2500 rounds."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(2500 * scale)
+    )
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 from enum import Enum
 
-from advent import get_puzzle_input
+from advent import iter_lines, iter_puzzle_input
+from advent.registry import solution
 
 
 class Hand(Enum):
@@ -33,12 +34,17 @@ def score_round(opp, you):
     return score
 
 
-def main():
+@solution(2022, 2, 1)
+def part1(input):
     total_score = 0
-    for line in get_puzzle_input(2022, 2).splitlines():
+    for line in iter_lines(input):
         opp, you = [Hand.from_str(c) for c in line.strip().split()]
         total_score += score_round(opp, you)
-    print(total_score)
+    return total_score
+
+
+def main():
+    print(part1(iter_puzzle_input(2022, 2)))
 
 
 if __name__ == "__main__":
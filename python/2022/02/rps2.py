@@ -2,6 +2,7 @@
 from enum import Enum
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 
 class Hand(Enum):
@@ -55,14 +56,19 @@ def score_round(opp_hand, outcome):
     return outcome.value + hand.value
 
 
-def main():
+@solution(2022, 2, 2)
+def part2(input):
     total_score = 0
-    for line in get_puzzle_input(2022, 2).splitlines():
+    for line in input.splitlines():
         chars = line.strip().split()
         opponent = Hand.from_char(chars[0])
         outcome = Outcome.from_char(chars[1])
         total_score += score_round(opponent, outcome)
-    print(total_score)
+    return total_score
+
+
+def main():
+    print(part2(get_puzzle_input(2022, 2)))
 
 
 if __name__ == "__main__":
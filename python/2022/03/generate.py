@@ -0,0 +1,36 @@
+"""Generate `scale` times 300 rucksacks.
+
+Each rucksack's compartments share exactly one item type, and each group of
+three rucksacks shares exactly one badge.
+"""
+import random
+import string
+
+ITEMS = string.ascii_letters
+
+
+def rucksack(badge: str, pool: list[str], rng: random.Random) -> str:
+    shared = rng.choice(pool + [badge])
+    others = [item for item in pool if item != shared]
+    rng.shuffle(others)
+    first, second = others[: len(others) // 2], others[len(others) // 2 :]
+    size = rng.randint(8, 16)
+    # The badge goes in the first compartment, unless it's the shared item.
+    first_items = [shared, badge] + rng.choices(first, k=size - 2)
+    second_items = [shared] + rng.choices(second, k=size - 1)
+    rng.shuffle(first_items)
+    rng.shuffle(second_items)
+    return "".join(first_items + second_items)
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(100 * scale):
+        badge = rng.choice(ITEMS)
+        # Split the other item types between the three elves so they have
+        # nothing else in common.
+        others = [item for item in ITEMS if item != badge]
+        rng.shuffle(others)
+        for i in range(3):
+            lines.append(rucksack(badge, others[i::3], rng) + "\n")
+    return "".join(lines)
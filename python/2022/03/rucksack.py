@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 from advent import get_puzzle_input
+from advent.registry import solution
 
 
 def priority(c):
@@ -9,10 +10,11 @@ def priority(c):
         return ord(c) - 96
 
 
-def main():
+@solution(2022, 3, 1)
+def part1(input):
     priorities_sum = 0
 
-    for line in get_puzzle_input(2022, 3).splitlines():
+    for line in input.splitlines():
         ruck_desc = line.strip()
         mid = len(ruck_desc) // 2
         c1 = set(ruck_desc[:mid])
@@ -20,7 +22,11 @@ def main():
         shared = c1.intersection(c2)
         priorities_sum += priority(shared.pop())
 
-    print(priorities_sum)
+    return priorities_sum
+
+
+def main():
+    print(part1(get_puzzle_input(2022, 3)))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3.12
 from itertools import batched
 
+from advent.registry import solution
+
 
 def priority(c):
     if c.isupper():
@@ -9,16 +11,21 @@ def priority(c):
         return ord(c) - 96
 
 
-def main():
+@solution(2022, 3, 2)
+def part2(input):
     priorities_sum = 0
 
-    with open("input.txt") as f:
-        for group in batched(f.readlines(), 3):
-            rucksacks = [set(rucksack.strip()) for rucksack in group]
-            intersection = rucksacks.pop().intersection(*rucksacks)
-            priorities_sum += priority(intersection.pop())
+    for group in batched(input.splitlines(), 3):
+        rucksacks = [set(rucksack.strip()) for rucksack in group]
+        intersection = rucksacks.pop().intersection(*rucksacks)
+        priorities_sum += priority(intersection.pop())
+
+    return priorities_sum
 
-    print(priorities_sum)
+
+def main():
+    with open("input.txt") as f:
+        print(part2(f.read()))
 
 
 if __name__ == "__main__":
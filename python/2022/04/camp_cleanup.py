@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 from advent import get_puzzle_input
+from advent.registry import solution
 
 
 def fully_contained(pair):
@@ -26,14 +27,17 @@ def parse(string):
     return pairs
 
 
-def part1(pairs):
-    return sum([fully_contained(pair) for pair in pairs])
+@solution(2022, 4, 1)
+def part1(input):
+    return sum([fully_contained(pair) for pair in parse(input)])
 
 
-def part2(pairs):
-    return sum([overlapping(pair) for pair in pairs])
+@solution(2022, 4, 2)
+def part2(input):
+    return sum([overlapping(pair) for pair in parse(input)])
 
 
-pairs = parse(get_puzzle_input(2022, 4))
-print(part1(pairs))
-print(part2(pairs))
+if __name__ == "__main__":
+    input = get_puzzle_input(2022, 4)
+    print(part1(input))
+    print(part2(input))
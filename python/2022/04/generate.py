@@ -0,0 +1,13 @@
+"Generate `scale` times 1000 pairs of section assignments."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(1000 * scale):
+        pair = []
+        for _ in range(2):
+            start = rng.randint(1, 99)
+            pair.append(f"{start}-{rng.randint(start, 99)}")
+        lines.append(",".join(pair) + "\n")
+    return "".join(lines)
@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 from collections import namedtuple
-import os
-import sys
 
 from advent import get_puzzle_input
+from advent.registry import parser, solution
 
 Move = namedtuple("Move", "count src dst")
 
@@ -53,33 +52,27 @@ class Crates:
         return [stack[-1] for stack in self.crates]
 
 
-def part1(crates, moves):
+@parser(2022, 5)
+def parse(input):
+    crates_desc, moves_desc = input.split("\n\n")
+    return Crates.from_str(crates_desc), Moves.from_str(moves_desc)
+
+
+@solution(2022, 5, 1)
+def part1(model):
+    crates, moves = model
     crates.rearrange(moves)
     return "".join(crates.tops)
 
 
-def part2(crates, moves):
+@solution(2022, 5, 2)
+def part2(model):
+    crates, moves = model
     crates.rearrange(moves, crane_model_no="9001")
     return "".join(crates.tops)
 
 
-# if __name__ == "__main__":
-#     input_path = (
-#         sys.argv[1]
-#         if len(sys.argv) > 1
-#         else os.path.join(os.path.dirname(__file__), "input.txt")
-#     )
-#     with open(input_path) as input_file:
-#         crates_desc, moves_desc = input_file.read().split("\n\n")
-#         moves = Moves.from_str(moves_desc)
-#         crates = Crates.from_str(crates_desc)
-#         print(part1(crates, moves))
-#         crates = Crates.from_str(crates_desc)
-#         print(part2(crates, moves))
-
-crates_desc, moves_desc = get_puzzle_input(2022, 5).split("\n\n")
-moves = Moves.from_str(moves_desc)
-crates = Crates.from_str(crates_desc)
-print(part1(crates, moves))
-crates = Crates.from_str(crates_desc)
-print(part2(crates, moves))
+if __name__ == "__main__":
+    input = get_puzzle_input(2022, 5)
+    print(part1(parse(input)))
+    print(part2(parse(input)))
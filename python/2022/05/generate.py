@@ -0,0 +1,32 @@
+"Generate nine stacks of crates and `scale` times 500 moves that never empty a stack."
+import random
+import string
+
+STACKS = 9
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(2, 8)) for _ in range(STACKS)
+    ]
+    drawing = []
+    for height in range(max(map(len, stacks)) - 1, -1, -1):
+        drawing.append(
+            " ".join(
+                f"[{stack[height]}]" if height < len(stack) else "   "
+                for stack in stacks
+            )
+        )
+    drawing.append(" ".join(f" {i} " for i in range(1, STACKS + 1)))
+
+    moves = []
+    sizes = [len(stack) for stack in stacks]
+    while len(moves) < 500 * scale:
+        src, dst = rng.sample(range(STACKS), 2)
+        if sizes[src] < 2:
+            continue
+        count = rng.randint(1, min(sizes[src] - 1, 20))
+        sizes[src] -= count
+        sizes[dst] += count
+        moves.append(f"move {count} from {src + 1} to {dst + 1}\n")
+    return "\n".join(drawing) + "\n\n" + "".join(moves)
@@ -2,8 +2,10 @@
 from collections import deque
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 
+@solution(2022, 6, 1)
 def part1(datastream, marker_len=4):
     sliding_window = deque(maxlen=marker_len)
     for i, c in enumerate(datastream):
@@ -12,12 +14,14 @@ def part1(datastream, marker_len=4):
             return i + 1
 
 
+@solution(2022, 6, 2)
 def part2(datastream):
     return part1(datastream, 14)
 
 
-input = get_puzzle_input(2022, 6)
-for line in input.splitlines():
-    datastream = line.strip()
-    print(part1(datastream))
-    print(part2(datastream))
+if __name__ == "__main__":
+    input = get_puzzle_input(2022, 6)
+    for line in input.splitlines():
+        datastream = line.strip()
+        print(part1(datastream))
+        print(part2(datastream))
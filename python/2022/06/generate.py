@@ -0,0 +1,18 @@
+"""Generate a datastream of `scale` times 4096 characters.
+
+The start-of-packet marker comes a third of the way in and the
+start-of-message marker comes at the very end, so both parts read most of the
+stream.
+"""
+import random
+import string
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    size = 4096 * scale
+    # Three letters can't form either marker, and thirteen can't form a
+    # start-of-message marker.
+    stream = rng.choices("abc", k=size // 3)
+    stream += rng.choices(string.ascii_lowercase[:13], k=size - len(stream) - 14)
+    stream += rng.sample(string.ascii_lowercase[12:], 14)
+    return "".join(stream) + "\n"
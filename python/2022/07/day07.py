@@ -2,6 +2,7 @@
 from dataclasses import dataclass, field
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 
 @dataclass
@@ -88,11 +89,15 @@ class Filesystem:
         return sizes
 
 
-def part1(fs):
+@solution(2022, 7, 1)
+def part1(input):
+    fs = Filesystem.from_str(input)
     return sum([size for size in fs.dir_sizes() if size <= 100000])
 
 
-def part2(fs):
+@solution(2022, 7, 2)
+def part2(input):
+    fs = Filesystem.from_str(input)
     total = 70000000
     unused_target = 30000000
 
@@ -107,6 +112,7 @@ def part2(fs):
             return size
 
 
-fs = Filesystem.from_str(get_puzzle_input(2022, 7))
-print(part1(fs))
-print(part2(fs))
+if __name__ == "__main__":
+    input = get_puzzle_input(2022, 7)
+    print(part1(input))
+    print(part2(input))
@@ -0,0 +1,56 @@
+"""Generate terminal output exploring a filesystem of `scale` times 300 files.
+
+However many files there are, they use 40-65 million bytes of the 70 million
+byte disk, so there's always a directory worth deleting.
+"""
+import random
+import string
+
+
+def name(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    files = 300 * scale
+    dirs = 180 * scale
+    mean_size = rng.randint(40_000_000, 65_000_000) // files
+
+    # Build a random tree: each new directory goes in an existing one.
+    children: list[list[int]] = [[] for _ in range(dirs)]
+    for d in range(1, dirs):
+        children[rng.randrange(d)].append(d)
+    contents: list[list[int]] = [[] for _ in range(dirs)]
+    for _ in range(files):
+        contents[rng.randrange(dirs)].append(rng.randint(1, 2 * mean_size))
+
+    lines = ["$ cd /"]
+    # Walk the tree depth first without recursion, which deep trees would
+    # overflow.
+    stack: list[tuple[int, str] | None] = [(0, "/")]
+    while stack:
+        entry = stack.pop()
+        if entry is None:
+            lines.append("$ cd ..")
+            continue
+        d, dirname = entry
+        if d != 0:
+            lines.append(f"$ cd {dirname}")
+        lines.append("$ ls")
+        used = set()
+        subdirs = []
+        for child in children[d]:
+            while (child_name := name(rng)) in used:
+                pass
+            used.add(child_name)
+            subdirs.append((child, child_name))
+            lines.append(f"dir {child_name}")
+        for size in contents[d]:
+            while (file_name := f"{name(rng)}.{name(rng)[:3]}") in used:
+                pass
+            used.add(file_name)
+            lines.append(f"{size} {file_name}")
+        for subdir in reversed(subdirs):
+            stack.append(None)
+            stack.append(subdir)
+    return "\n".join(lines) + "\n"
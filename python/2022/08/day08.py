@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
+from functools import cached_property
+from importlib.util import find_spec
 from pprint import pprint
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
+# The registered parts use NumPy when it's installed.
+VECTORIZED = find_spec("numpy") is not None
 
 TEST = """30373
 25512
@@ -12,22 +17,28 @@ TEST = """30373
 
 
 class Map:
-    def __init__(self, trees):
+    def __init__(self, trees, vectorized=False):
         self.trees = trees
         self.rows = len(trees)
         self.cols = len(trees[0])
-
-        self.visibilities = [
-            [set() for _ in range(self.cols)] for _ in range(self.rows)
-        ]
-        self.compute_visibilities()
-
-        self.scenic_scores = [[0] * self.cols for _ in range(self.rows)]
-        self.compute_scenic_scores()
+        self.vectorized = vectorized
+
+        if vectorized:
+            # Only the directions each tree is visible from are left out.
+            self.visibilities = None
+            self.compute_visibilities_vectorized()
+        else:
+            self.visibilities = [
+                [set() for _ in range(self.cols)] for _ in range(self.rows)
+            ]
+            self.compute_visibilities()
+            self.visible_trees = [
+                [bool(tree) for tree in row] for row in self.visibilities
+            ]
 
     @classmethod
-    def from_string(cls, map):
-        return cls([[int(h) for h in line] for line in map.splitlines()])
+    def from_string(cls, map, vectorized=False):
+        return cls([[int(h) for h in line] for line in map.splitlines()], vectorized)
 
     def __str__(self):
         return "\n".join("".join(str(h) for h in line) for line in self.trees)
@@ -63,7 +74,40 @@ class Map:
                 ):
                     self.visibilities[r][c].add("B")
 
+    def compute_visibilities_vectorized(self):
+        "Like `compute_visibilities`, but only records whether each tree is visible."
+        import numpy as np
+
+        from advent import npgrid
+
+        trees = np.array(self.trees, dtype=np.uint8)
+        self.visible_trees = np.zeros(trees.shape, dtype=bool)
+        for axis in (0, 1):
+            for reverse in (False, True):
+                self.visible_trees |= trees > npgrid.cummax_before(trees, axis, reverse)
+
+    @cached_property
+    def scenic_scores(self):
+        "The scenic score of each tree, computed the first time it's needed."
+        if self.vectorized:
+            return self.compute_scenic_scores_vectorized()
+        return self.compute_scenic_scores()
+
+    def compute_scenic_scores_vectorized(self):
+        "Like `compute_scenic_scores`, as an array."
+        import numpy as np
+
+        from advent import npgrid
+
+        trees = np.array(self.trees, dtype=np.uint8)
+        scores = np.ones(trees.shape, dtype=np.int64)
+        for axis in (0, 1):
+            for reverse in (False, True):
+                scores *= npgrid.view_distance(trees, axis, reverse)
+        return scores
+
     def compute_scenic_scores(self):
+        scenic_scores = [[0] * self.cols for _ in range(self.rows)]
         for r in range(self.rows):
             for c in range(self.cols):
                 tree = self.trees[r][c]
@@ -96,18 +140,23 @@ class Map:
                     if self.trees[r][i] >= tree:
                         break
 
-                self.scenic_scores[r][c] = up * down * left * right
+                scenic_scores[r][c] = up * down * left * right
+        return scenic_scores
 
     @property
     def visible(self) -> int:
-        return sum(1 for row in self.visibilities for tree in row if tree)
+        if self.vectorized:
+            return int(self.visible_trees.sum())
+        return sum(sum(row) for row in self.visible_trees)
 
     @property
     def invisible(self) -> int:
-        return sum(1 for row in self.visibilities for tree in row if not tree)
+        return self.rows * self.cols - self.visible
 
     @property
     def highest_scenic_score(self) -> int:
+        if self.vectorized:
+            return int(self.scenic_scores.max())
         return max(max(row) for row in self.scenic_scores)
 
 
@@ -117,10 +166,23 @@ def test():
     pprint(m.visibilities)
     assert m.visible == 21
     assert m.highest_scenic_score == 8
+    if VECTORIZED:
+        m = Map.from_string(TEST, vectorized=True)
+        assert m.visible == 21
+        assert m.highest_scenic_score == 8
+
+
+@solution(2022, 8, 1)
+def part1(input, vectorized=VECTORIZED):
+    return Map.from_string(input, vectorized).visible
+
+
+@solution(2022, 8, 2)
+def part2(input, vectorized=VECTORIZED):
+    return Map.from_string(input, vectorized).highest_scenic_score
 
 
-m = Map.from_string(get_puzzle_input(2022, 8))
-# Part 1
-print(m.visible)
-# Part 2
-print(m.highest_scenic_score)
+if __name__ == "__main__":
+    input = get_puzzle_input(2022, 8)
+    print(part1(input))
+    print(part2(input))
@@ -0,0 +1,10 @@
+"Generate forests of tree heights with `scale` times the area of a 99 by 99 map."
+import math
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = round(99 * math.sqrt(scale))
+    return "".join(
+        "".join(str(rng.randint(0, 9)) for _ in range(side)) + "\n" for _ in range(side)
+    )
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 from advent import get_puzzle_input
+from advent.registry import solution
 
 
 TEST = """R 4
@@ -79,11 +80,12 @@ def simulate_rope(motions):
     return T_history
 
 
+@solution(2022, 9, 1)
 def part1(input):
     motions = parse(input)
     T_history = simulate_rope(motions)
     T_uniques = set(T_history)
-    print(len(T_uniques))
+    return len(T_uniques)
 
 
 class Rope:
@@ -160,17 +162,19 @@ class Rope:
                 # print(f"\n{self}\n")
 
 
+@solution(2022, 9, 2)
 def part2(input):
     motions = parse(input)
     r = Rope(10)
     r.simulate(motions)
-    print(len(set(r.knot_histories[-1])))
+    return len(set(r.knot_histories[-1]))
 
 
-# part1(TEST)
-# part2(TEST)
-# part2(TEST2)
+if __name__ == "__main__":
+    # print(part1(TEST))
+    # print(part2(TEST))
+    # print(part2(TEST2))
 
-input = get_puzzle_input(2022, 9)
-part1(input)
-part2(input)
+    input = get_puzzle_input(2022, 9)
+    print(part1(input))
+    print(part2(input))
@@ -0,0 +1,8 @@
+"Generate `scale` times 2000 motions of the head of a rope."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "".join(
+        f"{rng.choice('LRUD')} {rng.randint(1, 20)}\n" for _ in range(2000 * scale)
+    )
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 from advent import get_puzzle_input
+from advent.registry import solution
 
 TINY_TEST = """noop
 addx 3
@@ -55,18 +56,21 @@ class CPU:
         return "\n".join("".join(row) for row in self.CRT)
 
 
-def part1(instructions):
+@solution(2022, 10, 1)
+def part1(input):
     cpu = CPU()
-    cpu.execute(instructions)
+    cpu.execute(parse_instructions(input))
     return sum(cpu.signal_strengths[i] for i in range(20, 220 + 1, 40))
 
 
-def part2(instructions):
+@solution(2022, 10, 2)
+def part2(input):
     cpu = CPU()
-    cpu.execute(instructions)
+    cpu.execute(parse_instructions(input))
     return cpu.CRT_as_str()
 
 
-instructions = parse_instructions(get_puzzle_input(2022, 10))
-print(part1(instructions))
-print(part2(instructions))
+if __name__ == "__main__":
+    input = get_puzzle_input(2022, 10)
+    print(part1(input))
+    print(part2(input))
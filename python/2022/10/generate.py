@@ -0,0 +1,24 @@
+"""Generate programs that run for the CRT's 240 cycles.
+
+The CRT only has 240 pixels, so the input stops growing at `scale` 1.
+"""
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    cycles = 0
+    x = 1
+    while cycles < 240:
+        if cycles == 239 or rng.random() < 0.3:
+            lines.append("noop\n")
+            cycles += 1
+        else:
+            # Keep the sprite on the screen, mostly.
+            value = rng.randint(-5, 5) or 1
+            if not -1 <= x + value <= 40:
+                value = -value
+            x += value
+            lines.append(f"addx {value}\n")
+            cycles += 2
+    return "".join(lines)
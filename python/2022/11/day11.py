@@ -4,7 +4,8 @@ from functools import reduce
 from operator import mul
 from typing import NamedTuple
 
-from advent import get_puzzle_input
+from advent import get_puzzle_input, metrics
+from advent.registry import solution
 
 
 class Test(NamedTuple):
@@ -86,6 +87,7 @@ def simulate_monkey_business(monkeys, rounds=1, verbose=False):
 
                 monkey.inspections += 1
 
+            metrics.count("items thrown", len(thrown))
             for j, (src, item, dst) in enumerate(thrown):
                 monkey.items.pop(src - j)
                 monkeys[dst].items.append(item)
@@ -97,6 +99,7 @@ def simulate_monkey_business(monkeys, rounds=1, verbose=False):
     return monkeys
 
 
+@solution(2022, 11, 1)
 def part1(input):
     monkeys = parse(input)
     simulate_monkey_business(monkeys, 20)
@@ -0,0 +1,31 @@
+"Generate notes on `scale` times eight monkeys throwing items to each other."
+import random
+
+PRIMES = [
+    n for n in range(2, 10_000) if all(n % d for d in range(2, int(n**0.5) + 1))
+]
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    count = 8 * scale
+    divisors = rng.sample(PRIMES[: max(20, count)], count)
+    monkeys = []
+    for i in range(count):
+        items = [rng.randint(50, 99) for _ in range(rng.randint(1, 8))]
+        # Like real notes, one monkey in eight squares worry levels.
+        if i % 8 == 7:
+            operation = "old * old"
+        elif rng.random() < 0.3:
+            operation = f"old * {rng.randint(2, 19)}"
+        else:
+            operation = f"old + {rng.randint(1, 8)}"
+        if_true, if_false = rng.sample([m for m in range(count) if m != i], 2)
+        monkeys.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {', '.join(map(str, items))}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {divisors[i]}\n"
+            f"    If true: throw to monkey {if_true}\n"
+            f"    If false: throw to monkey {if_false}\n"
+        )
+    return "\n".join(monkeys)
@@ -6,9 +6,10 @@ from day11 import part1
 
 
 class TestDay11(unittest.TestCase):
-    def setUp(self):
-        self.test  = get_puzzle_input(2022, 11, "test.txt")
-        self.input = get_puzzle_input(2022, 11)
+    @classmethod
+    def setUpClass(cls):
+        cls.test  = get_puzzle_input(2022, 11, "test.txt")
+        cls.input = get_puzzle_input(2022, 11)
 
     def test_part1(self):
         self.assertEqual(part1(self.test), 10605)
@@ -2,6 +2,7 @@
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 1
@@ -12,6 +13,7 @@ def calibration_value(line: str) -> int:
     return int(digits[0] + digits[-1])
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str) -> int:
     return sum(calibration_value(line) for line in input.splitlines())
 
@@ -40,15 +42,17 @@ def calibration_value2(line: str) -> int:
     return 10 * digit_value(first) + digit_value(last)
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str) -> int:
     return sum(calibration_value2(line) for line in input.splitlines())
 
 
 class TestDay01(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(2023, 1, "example.txt")
-        self.example2 = get_puzzle_input(2023, 1, "example2.txt")
-        self.input = get_puzzle_input(2023, 1)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(2023, 1, "example.txt")
+        cls.example2 = get_puzzle_input(2023, 1, "example2.txt")
+        cls.input = get_puzzle_input(2023, 1)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 142)
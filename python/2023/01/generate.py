@@ -0,0 +1,23 @@
+"Generate calibration documents of `scale` times 1000 lines, with spelled out digits."
+import random
+import string
+
+SPELLED_DIGITS = "one two three four five six seven eight nine".split()
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(1000 * scale):
+        pieces = [rng.choice("123456789")]
+        for _ in range(rng.randint(1, 8)):
+            match rng.randrange(3):
+                case 0:
+                    pieces.append(rng.choice("123456789"))
+                case 1:
+                    pieces.append(rng.choice(SPELLED_DIGITS))
+                case _:
+                    letters = rng.choices(string.ascii_lowercase, k=rng.randint(1, 4))
+                    pieces.append("".join(letters))
+        rng.shuffle(pieces)
+        lines.append("".join(pieces) + "\n")
+    return "".join(lines)
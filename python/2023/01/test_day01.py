@@ -6,10 +6,11 @@ from day01 import part1, part2
 
 
 class TestDay01(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(2023, 1, "example.txt")
-        self.example2 = get_puzzle_input(2023, 1, "example2.txt")
-        self.input = get_puzzle_input(2023, 1)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(2023, 1, "example.txt")
+        cls.example2 = get_puzzle_input(2023, 1, "example2.txt")
+        cls.input = get_puzzle_input(2023, 1)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 142)
@@ -5,6 +5,7 @@ from pprint import pprint
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 2
@@ -30,21 +31,24 @@ def is_game_possible(game: Game, totals: Game) -> bool:
     return all(totals.get(color, 0) >= n for color, n in game.items())
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str) -> int:
     games = parse(input)
     totals = {"red": 12, "green": 13, "blue": 14}
     return sum(i + 1 for i, game in enumerate(games) if is_game_possible(game, totals))
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str) -> int:
     games = parse(input)
     return sum(reduce(mul, game.values()) for game in games)
 
 
 class TestDay02(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 8)
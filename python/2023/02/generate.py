@@ -0,0 +1,14 @@
+"Generate records of `scale` times 100 games of cubes."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for game in range(1, 100 * scale + 1):
+        handfuls = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            cubes = (f"{rng.randint(1, 20)} {color}" for color in colors)
+            handfuls.append(", ".join(cubes))
+        lines.append(f"Game {game}: {'; '.join(handfuls)}\n")
+    return "".join(lines)
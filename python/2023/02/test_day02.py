@@ -6,9 +6,10 @@ from day02 import part1, part2
 
 
 class TestDay02(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(2023, 2, "example.txt")
-        self.input = get_puzzle_input(2023, 2)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(2023, 2, "example.txt")
+        cls.input = get_puzzle_input(2023, 2)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 8)
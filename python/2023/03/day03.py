@@ -1,4 +1,5 @@
 from advent import get_puzzle_input
+from advent.registry import solution
 
 
 def find_overlapping_part(row: str, col: int) -> int:
@@ -40,6 +41,7 @@ def parse_engine_schematic(input: str):
     return parts
 
 
+@solution(2023, 3, 1)
 def part1(input: str):
     parts = parse_engine_schematic(input)
     return sum(parts)
@@ -60,6 +62,7 @@ def gear_ratios(parts):
     ]
 
 
+@solution(2023, 3, 2)
 def part2(input: str):
     parts = parse_engine_schematic2(input)
     return sum(gear_ratios(parts))
@@ -0,0 +1,22 @@
+"Generate engine schematics with `scale` times the area of a 140 by 140 schematic."
+import math
+import random
+
+SYMBOLS = "*#+$/@%=&-"
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = round(140 * math.sqrt(scale))
+    rows = []
+    for _ in range(side):
+        row = []
+        while len(row) < side:
+            gap = rng.randint(1, 6)
+            row.extend("." * gap)
+            if rng.random() < 0.2:
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.extend(str(rng.randint(1, 999)))
+            row.append(".")
+        rows.append("".join(row[:side]) + "\n")
+    return "".join(rows)
@@ -4,6 +4,7 @@ from pprint import pprint
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 4
@@ -37,10 +38,12 @@ def parse_cards(input: str) -> list[ScratchCard]:
     return [ScratchCard.from_str(line) for line in input.splitlines()]
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     return sum(card.score for card in parse_cards(input))
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     cards = parse_cards(input)
     card_counts = [1] * len(cards)
@@ -51,9 +54,10 @@ def part2(input: str):
 
 
 class TestDay04(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 13)
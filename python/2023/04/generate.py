@@ -0,0 +1,21 @@
+"""Generate `scale` times 200 scratchcards.
+
+No card wins copies of cards past the end of the table.
+"""
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    count = 200 * scale
+    lines = []
+    for card in range(1, count + 1):
+        winning = rng.sample(range(1, 100), 10)
+        matches = min(rng.choice([0, 0, 0, 1, 2, 3, 4, 5, 10]), count - card)
+        others = [n for n in range(1, 100) if n not in winning]
+        have = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(have)
+        lines.append(
+            f"Card {card:3d}: {' '.join(f'{n:2d}' for n in winning)}"
+            f" | {' '.join(f'{n:2d}' for n in have)}\n"
+        )
+    return "".join(lines)
@@ -6,9 +6,10 @@ from day04 import part1, part2
 
 
 class TestDay04(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(2023, 4, "example.txt")
-        self.input = get_puzzle_input(2023, 4)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(2023, 4, "example.txt")
+        cls.input = get_puzzle_input(2023, 4)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 13)
@@ -4,6 +4,7 @@ from pprint import pprint
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 
 @dataclass
@@ -60,6 +61,7 @@ class Almanac:
         return self.find(map.dst, map.find(src_num), dst)
 
 
+@solution(2023, 5, 1)
 def part1(input: str):
     almanac = Almanac.from_str(input)
     return min(
@@ -67,14 +69,16 @@ def part1(input: str):
     )
 
 
+@solution(2023, 5, 2)
 def part2(input: str):
     pass
 
 
 class TestDay05(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(2023, 5, "example.txt")
-        self.input = get_puzzle_input(2023, 5)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(2023, 5, "example.txt")
+        cls.input = get_puzzle_input(2023, 5)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 35)
@@ -0,0 +1,40 @@
+"Generate almanacs with `scale` times 20 seeds and 30 ranges per map."
+import random
+
+CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+LIMIT = 2**32
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    seeds = [rng.randrange(LIMIT) for _ in range(20 * scale)]
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+    for src, dst in zip(CATEGORIES, CATEGORIES[1:]):
+        # Split the source numbers into ranges, and map them to shuffled
+        # destinations.
+        cuts = sorted(rng.sample(range(1, LIMIT), 30 * scale - 1))
+        starts = [0, *cuts]
+        lengths = [b - a for a, b in zip(starts, [*cuts, LIMIT])]
+        order = list(range(len(starts)))
+        rng.shuffle(order)
+        dst_starts = {}
+        position = 0
+        for i in order:
+            dst_starts[i] = position
+            position += lengths[i]
+        lines = [f"{src}-to-{dst} map:"]
+        lines.extend(
+            f"{dst_starts[i]} {starts[i]} {lengths[i]}" for i in range(len(starts))
+        )
+        sections.append("\n".join(lines))
+    # The solution reads the last map up to the end of the input, so there's
+    # no final newline.
+    return "\n\n".join(sections)
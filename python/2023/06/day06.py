@@ -7,6 +7,7 @@ import math
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 6
@@ -48,6 +49,7 @@ def number_of_ways_to_beat2(race: Race) -> int:
     return int(hi) - int(lo)
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str) -> int:
     races = parse(input)
     return reduce(mul, (number_of_ways_to_beat(race) for race in races))
@@ -61,15 +63,17 @@ def parse2(input: str) -> Race:
     return Race(time, distance)
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     race = parse2(input)
     return number_of_ways_to_beat2(race)
 
 
 class TestDay(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 288)
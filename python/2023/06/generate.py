@@ -0,0 +1,15 @@
+"Generate four boat races lasting about `scale` times as long as real ones."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    times = [rng.randint(40, 99) * scale for _ in range(4)]
+    distances = []
+    for time in times:
+        hold = rng.randint(1, time // 3)
+        distances.append(hold * (time - hold))
+    width = max(len(str(n)) for n in times + distances)
+    return (
+        "Time:    " + "".join(f" {n:>{width}}" for n in times) + "\n"
+        "Distance:" + "".join(f" {n:>{width}}" for n in distances) + "\n"
+    )
@@ -8,6 +8,7 @@ from pprint import pprint
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import parser, solution
 
 YEAR = 2023
 DAY = 7
@@ -81,36 +82,38 @@ class Hand:
         )
 
 
+@parser(YEAR, DAY, mutable=False)
 def parse_hands(s: str) -> list[Hand]:
     return [
         Hand(hand, int(bid)) for hand, bid in (line.split() for line in s.splitlines())
     ]
 
 
-def part1(input: str):
-    hands = parse_hands(input)
-    hands.sort(key=methodcaller('sort_key'))
-    return sum(hand.bid * (i + 1) for i, hand in enumerate(hands))
+@solution(YEAR, DAY, 1)
+def part1(hands: list[Hand]):
+    ranked = sorted(hands, key=methodcaller('sort_key'))
+    return sum(hand.bid * (i + 1) for i, hand in enumerate(ranked))
 
 
-def part2(input: str):
-    hands = parse_hands(input)
-    hands.sort(key=lambda hand: hand.sort_key(jokers_wild=True))
-    return sum(hand.bid * (i + 1) for i, hand in enumerate(hands))
+@solution(YEAR, DAY, 2)
+def part2(hands: list[Hand]):
+    ranked = sorted(hands, key=lambda hand: hand.sort_key(jokers_wild=True))
+    return sum(hand.bid * (i + 1) for i, hand in enumerate(ranked))
 
 
 class TestDay(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
-        self.assertEqual(part1(self.example), 6440)
-        self.assertEqual(part1(self.input), 247815719)
+        self.assertEqual(part1(parse_hands(self.example)), 6440)
+        self.assertEqual(part1(parse_hands(self.input)), 247815719)
 
     def test_part2(self):
-        self.assertEqual(part2(self.example), 5905)
-        self.assertEqual(part2(self.input), 248747492)
+        self.assertEqual(part2(parse_hands(self.example)), 5905)
+        self.assertEqual(part2(parse_hands(self.input)), 248747492)
 
 
 if __name__ == "__main__":
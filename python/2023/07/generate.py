@@ -0,0 +1,14 @@
+"Generate `scale` times 1000 Camel Cards hands and bids."
+import random
+
+CARDS = "23456789TJQKA"
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(1000 * scale):
+        # Draw from a few labels to get a realistic mix of hand types.
+        labels = rng.sample(CARDS, rng.randint(1, 5))
+        hand = "".join(rng.choice(labels) for _ in range(5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}\n")
+    return "".join(lines)
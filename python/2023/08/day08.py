@@ -7,6 +7,7 @@ import re
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import parser, solution
 
 YEAR = 2023
 DAY = 8
@@ -30,6 +31,7 @@ class Map:
         return math.lcm(*path_lens)
 
 
+@parser(YEAR, DAY, mutable=False)
 def parse(input: str) -> Map:
     instructions, node_definitions = input.split("\n\n")
     node_re = re.compile(r"([A-Z0-9]{3}) = \(([A-Z0-9]{3}), ([A-Z0-9]{3})\)")
@@ -40,31 +42,32 @@ def parse(input: str) -> Map:
     return Map(instructions, nodes)
 
 
-def part1(input: str) -> int:
-    map = parse(input)
+@solution(YEAR, DAY, 1)
+def part1(map: Map) -> int:
     return map.navigate()
 
 
-def part2(input: str):
-    map = parse(input)
+@solution(YEAR, DAY, 2)
+def part2(map: Map):
     return map.navigate2()
 
 
 class TestDay(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.example2 = get_puzzle_input(YEAR, DAY, "example2.txt")
-        self.example3 = get_puzzle_input(YEAR, DAY, "example3.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.example2 = get_puzzle_input(YEAR, DAY, "example2.txt")
+        cls.example3 = get_puzzle_input(YEAR, DAY, "example3.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
-        self.assertEqual(part1(self.example), 2)
-        self.assertEqual(part1(self.example2), 6)
-        self.assertEqual(part1(self.input), 19667)
+        self.assertEqual(part1(parse(self.example)), 2)
+        self.assertEqual(part1(parse(self.example2)), 6)
+        self.assertEqual(part1(parse(self.input)), 19667)
 
     def test_part2(self):
-        self.assertEqual(part2(self.example3), 6)
-        self.assertEqual(part2(self.input), 19185263738117)
+        self.assertEqual(part2(parse(self.example3)), 6)
+        self.assertEqual(part2(parse(self.input)), 19185263738117)
 
 
 if __name__ == "__main__":
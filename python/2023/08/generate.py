@@ -0,0 +1,55 @@
+"""Generate maps whose ghosts take about `scale` times as many steps as in real ones.
+
+Each ghost walks a ring of nodes in two lanes, one reached by going left and
+one by going right. Its Z node is at the end of the left lane, and the
+instructions turn left only once, so a ghost has to line up the end of its
+ring with that instruction, like the cycles of real inputs.
+"""
+import itertools
+import random
+import string
+
+GHOSTS = 6
+SYMBOLS = string.ascii_uppercase + string.digits
+
+
+def is_prime(n: int) -> bool:
+    return n > 1 and all(n % d for d in range(2, int(n**0.5) + 1))
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lengths = itertools.count(rng.randint(260, 300) * scale)
+    length = next(n for n in lengths if is_prime(n))
+    left = rng.randrange(length)
+    instructions = "R" * left + "L" + "R" * (length - left - 1)
+
+    names = [
+        "".join(p) for p in itertools.product(SYMBOLS, repeat=3) if p[2] not in "AZ"
+    ]
+    rng.shuffle(names)
+    ends = ["".join(p) for p in itertools.product(SYMBOLS, repeat=2)]
+    rng.shuffle(ends)
+    ends.remove("AA")
+    ends.remove("ZZ")
+    ends = ["AA", "ZZ", *ends]
+
+    nodes = {}
+    ring_lengths = rng.sample([n for n in range(41, 80) if is_prime(n)], GHOSTS)
+    for ghost, ring_length in enumerate(ring_lengths):
+        lefts = [names.pop() for _ in range(ring_length)]
+        rights = [names.pop() for _ in range(ring_length)]
+        lefts[-1] = (ends[1] if ghost == 0 else ends[2 * ghost + 1]) + "Z"
+        start = (ends[0] if ghost == 0 else ends[2 * ghost]) + "A"
+        nodes[start] = (lefts[0], rights[0])
+        for position in range(ring_length):
+            successor = (position + 1) % ring_length
+            nodes[lefts[position]] = nodes[rights[position]] = (
+                lefts[successor],
+                rights[successor],
+            )
+
+    definitions = [
+        f"{node} = ({left}, {right})\n" for node, (left, right) in nodes.items()
+    ]
+    rng.shuffle(definitions)
+    return instructions + "\n\n" + "".join(definitions)
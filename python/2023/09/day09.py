@@ -4,17 +4,20 @@ from pprint import pprint
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import parser, solution
 
 YEAR = 2023
 DAY = 9
 
 
+@parser(YEAR, DAY, mutable=False)
 def parse(input) -> list[list[int]]:
     return [[int(n) for n in line.split()] for line in input.splitlines()]
 
 
 def next_in_seq(seq: list[int]):
-    diff_seqs = [seq]
+    # Extend a copy, so the parsed sequence can be shared.
+    diff_seqs = [list(seq)]
     while not all(n == 0 for n in diff_seqs[-1]):
         diff_seqs.append([y - x for x, y in pairwise(diff_seqs[-1])])
 
@@ -26,7 +29,8 @@ def next_in_seq(seq: list[int]):
 
 
 def prev_in_seq(seq: list[int]):
-    diff_seqs = [seq]
+    # Extend a copy, so the parsed sequence can be shared.
+    diff_seqs = [list(seq)]
     while not all(n == 0 for n in diff_seqs[-1]):
         diff_seqs.append([y - x for x, y in pairwise(diff_seqs[-1])])
 
@@ -37,26 +41,29 @@ def prev_in_seq(seq: list[int]):
     return diff_seqs[0][0]
 
 
-def part1(input: str):
-    return sum(next_in_seq(seq) for seq in parse(input))
+@solution(YEAR, DAY, 1)
+def part1(seqs: list[list[int]]):
+    return sum(next_in_seq(seq) for seq in seqs)
 
 
-def part2(input: str):
-    return sum(prev_in_seq(seq) for seq in parse(input))
+@solution(YEAR, DAY, 2)
+def part2(seqs: list[list[int]]):
+    return sum(prev_in_seq(seq) for seq in seqs)
 
 
 class TestDay(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
-        self.assertEqual(part1(self.example), 114)
-        self.assertEqual(part1(self.input), 1789635132)
+        self.assertEqual(part1(parse(self.example)), 114)
+        self.assertEqual(part1(parse(self.input)), 1789635132)
 
     def test_part2(self):
-        self.assertEqual(part2(self.example), 2)
-        self.assertEqual(part2(self.input), 913)
+        self.assertEqual(part2(parse(self.example)), 2)
+        self.assertEqual(part2(parse(self.input)), 913)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+"Generate `scale` times 200 sequences of 21 values of low-degree polynomials."
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(200 * scale):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 8))]
+        values = [
+            sum(c * x**power for power, c in enumerate(coefficients)) for x in range(21)
+        ]
+        lines.append(" ".join(map(str, values)) + "\n")
+    return "".join(lines)
@@ -5,42 +5,27 @@ from pprint import pprint
 import unittest
 
 from advent import get_puzzle_input
+from advent.grid import Grid, Index
+from advent.registry import parser, solution
 
 YEAR = 2023
 DAY = 10
 
 GridPoint = tuple[int, int]
-Grid = dict[GridPoint, str]
 
+# Ground surrounds the map, so every tile has four neighbours.
+BORDER = "."
 
-def parse_grid(raw_grid: list[str]) -> Grid:
-    """
-    Returns 2-tuples of (row, col) with their value.
 
-    (0, 0) ------> (0, 9)
-      |              |
-      |              |
-      |              |
-      |              |
-      |              V
-    (9, 0) ------> (9, 9)
-    """
-    result = {}
-
-    for row, line in enumerate(raw_grid):
-        for col, c in enumerate(line):
-            result[row, col] = c
-
-    return result
+def parse_grid(input: str) -> Grid:
+    return Grid.parse(input, border=BORDER)
 
 
 START = "S"
 
 
-def find_start(grid: Grid) -> GridPoint:
-    starts = [point for point, value in grid.items() if value == START]
-    assert len(starts) == 1
-    return starts[0]
+def find_start(grid: Grid) -> Index:
+    return grid.find(START)
 
 
 class Direction(Enum):
@@ -54,18 +39,6 @@ class Direction(Enum):
         return Direction((self.value + 2) % 4)
 
 
-DIRECTION_OFFSETS: dict[Direction, GridPoint] = {
-    Direction.NORTH: (-1, 0),
-    Direction.EAST: (0, 1),
-    Direction.SOUTH: (1, 0),
-    Direction.WEST: (0, -1),
-}
-
-
-def add_points(a: GridPoint, b: GridPoint) -> GridPoint:
-    return a[0] + b[0], a[1] + b[1]
-
-
 PIPES: dict[str, tuple[Direction, Direction]] = {
     "|": (Direction.NORTH, Direction.SOUTH),
     "-": (Direction.EAST, Direction.WEST),
@@ -79,17 +52,14 @@ STRAIGHTS = ("|", "-")
 BENDS = ("L", "J", "7", "F")
 
 
-def find_loop(grid: Grid, start: GridPoint) -> list[GridPoint]:
+def find_loop(grid: Grid, start: Index) -> list[GridPoint]:
     point = None
     heading = None
 
     # Find a valid pipe connected to the start.
     for direction in Direction:
-        neighboring_point = add_points(start, DIRECTION_OFFSETS[direction])
-        if neighboring_point not in grid:
-            continue
-
-        neighbor = grid[neighboring_point]
+        neighboring_point = start + grid.steps[direction.value]
+        neighbor = chr(grid[neighboring_point])
         if neighbor not in PIPES:
             continue
 
@@ -103,28 +73,34 @@ def find_loop(grid: Grid, start: GridPoint) -> list[GridPoint]:
     assert point is not None
     assert heading is not None
 
-    loop: list[GridPoint] = [start]
+    loop: list[GridPoint] = [grid.point(start)]
     while point != start:
-        loop.append(point)
+        loop.append(grid.point(point))
 
-        if grid[point] in BENDS:
-            pipe = PIPES[grid[point]]
+        if (tile := chr(grid[point])) in BENDS:
+            pipe = PIPES[tile]
             heading = pipe[1] if heading.opposite == pipe[0] else pipe[0]
 
-        point = add_points(point, DIRECTION_OFFSETS[heading])
+        point += grid.steps[heading.value]
 
     return loop
 
 
-def part1(input: str):
-    grid = parse_grid(input.splitlines())
-    start = find_start(grid)
-    return int(len(find_loop(grid, start)) / 2)
+@parser(YEAR, DAY, mutable=False)
+def parse(input: str) -> tuple[GridPoint, ...]:
+    "Find the loop, which both parts measure (so share, and mustn't change)."
+    grid = parse_grid(input)
+    return tuple(find_loop(grid, find_start(grid)))
+
+
+@solution(YEAR, DAY, 1)
+def part1(loop: tuple[GridPoint, ...]):
+    return int(len(loop) / 2)
 
 
-def enclosed_area(loop: list[GridPoint]) -> int:
+def enclosed_area(loop: tuple[GridPoint, ...]) -> int:
     # Copy the loop and append the start point to the end for the shoelace formula.
-    boundary = loop + [loop[0]]
+    boundary = (*loop, loop[0])
 
     # Compute the area with the shoelace formula
     area = abs(sum((x1 * y2) - (x2 * y1) for (x1, y1), (x2, y2) in pairwise(boundary)) // 2)
@@ -137,32 +113,31 @@ def enclosed_area(loop: list[GridPoint]) -> int:
     return area - ((len(boundary) - 1) // 2) + 1
 
 
-def part2(input: str):
-    grid = parse_grid(input.splitlines())
-    start = find_start(grid)
-    loop = find_loop(grid, start)
+@solution(YEAR, DAY, 2)
+def part2(loop: tuple[GridPoint, ...]):
     return enclosed_area(loop)
 
 
 class TestDay10(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.example2 = get_puzzle_input(YEAR, DAY, "example2.txt")
-        self.example3 = get_puzzle_input(YEAR, DAY, "example3.txt")
-        self.example4 = get_puzzle_input(YEAR, DAY, "example4.txt")
-        self.example5 = get_puzzle_input(YEAR, DAY, "example5.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.example2 = get_puzzle_input(YEAR, DAY, "example2.txt")
+        cls.example3 = get_puzzle_input(YEAR, DAY, "example3.txt")
+        cls.example4 = get_puzzle_input(YEAR, DAY, "example4.txt")
+        cls.example5 = get_puzzle_input(YEAR, DAY, "example5.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
-        self.assertEqual(part1(self.example), 4)
-        self.assertEqual(part1(self.example2), 8)
-        self.assertEqual(part1(self.input), 6931)
+        self.assertEqual(part1(parse(self.example)), 4)
+        self.assertEqual(part1(parse(self.example2)), 8)
+        self.assertEqual(part1(parse(self.input)), 6931)
 
     def test_part2(self):
-        self.assertEqual(part2(self.example3), 4)
-        self.assertEqual(part2(self.example4), 8)
-        self.assertEqual(part2(self.example5), 10)
-        self.assertEqual(part2(self.input), 357)
+        self.assertEqual(part2(parse(self.example3)), 4)
+        self.assertEqual(part2(parse(self.example4)), 8)
+        self.assertEqual(part2(parse(self.example5)), 10)
+        self.assertEqual(part2(parse(self.input)), 357)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+"""Generate pipe mazes with `scale` times the area of a 140 by 140 maze.
+
+The loop winds around a random spanning tree, so it has plenty of bends and
+encloses tiles between its parallel runs. Every other tile is a junk pipe or
+ground.
+"""
+import math
+import random
+
+PIPES = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+OFFSETS = {"N": (-1, 0), "E": (0, 1), "S": (1, 0), "W": (0, -1)}
+
+
+def spanning_tree(rows: int, cols: int, size: int, rng: random.Random):
+    "Grow a random tree over `size` cells of a `rows` by `cols` grid."
+    start = (rng.randrange(rows), rng.randrange(cols))
+    cells = {start}
+    edges = []
+    frontier = [(start, (start[0] + dr, start[1] + dc)) for dr, dc in OFFSETS.values()]
+    while frontier and len(cells) < size:
+        a, b = frontier.pop(rng.randrange(len(frontier)))
+        if b in cells or not (0 <= b[0] < rows and 0 <= b[1] < cols):
+            continue
+        cells.add(b)
+        edges.append((a, b))
+        frontier.extend((b, (b[0] + dr, b[1] + dc)) for dr, dc in OFFSETS.values())
+    return cells, edges
+
+
+def loop_around(cells, edges) -> dict[tuple[int, int], set[str]]:
+    "Return the directions each tile of the loop around a tree connects to."
+    connections = {}
+
+    def reroute(tile, old, new):
+        connections[tile].remove(old)
+        connections[tile].add(new)
+
+    # Each cell of the tree starts as a ring of four tiles...
+    for r, c in cells:
+        r, c = 2 * r, 2 * c
+        connections[r, c] = {"E", "S"}
+        connections[r, c + 1] = {"W", "S"}
+        connections[r + 1, c] = {"N", "E"}
+        connections[r + 1, c + 1] = {"N", "W"}
+    # ...and each edge of the tree opens up the facing sides of two rings and
+    # joins them into one.
+    for a, b in edges:
+        (r, c), _ = sorted([a, b])
+        r, c = 2 * r, 2 * c
+        if a[0] == b[0]:
+            reroute((r, c + 1), "S", "E")
+            reroute((r + 1, c + 1), "N", "E")
+            reroute((r, c + 2), "S", "W")
+            reroute((r + 1, c + 2), "N", "W")
+        else:
+            reroute((r + 1, c), "E", "S")
+            reroute((r + 1, c + 1), "W", "S")
+            reroute((r + 2, c), "E", "N")
+            reroute((r + 2, c + 1), "W", "N")
+    return connections
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = round(35 * math.sqrt(scale))
+    cells, edges = spanning_tree(side, side, side * side // 2, rng)
+
+    # Space the loop out, so there are tiles between its parallel runs.
+    loop = {}
+    for (r, c), directions in loop_around(cells, edges).items():
+        loop[2 * r, 2 * c] = PIPES[frozenset(directions)]
+        if "E" in directions:
+            loop[2 * r, 2 * c + 1] = "-"
+        if "S" in directions:
+            loop[2 * r + 1, 2 * c] = "|"
+
+    size = 4 * side
+    maze = [
+        rng.choices("|-LJ7F.", weights=(1, 1, 1, 1, 1, 1, 4), k=size)
+        for _ in range(size)
+    ]
+    for (r, c), pipe in loop.items():
+        maze[r][c] = pipe
+    r, c = rng.choice(list(loop))
+    maze[r][c] = "S"
+    # Only the loop may connect to the start.
+    for dr, dc in OFFSETS.values():
+        if (r + dr, c + dc) not in loop and 0 <= r + dr < size and 0 <= c + dc < size:
+            maze[r + dr][c + dc] = "."
+    return "".join("".join(row) + "\n" for row in maze)
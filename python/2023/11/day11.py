@@ -1,14 +1,41 @@
 #!/usr/bin/env python3
+from importlib.util import find_spec
 import itertools
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 11
 
 
-def part1(input: str, expansion_factor=2):
+def sum_of_distances_vectorized(input: str, expansion_factor: int) -> int:
+    import numpy as np
+
+    from advent import npgrid
+
+    image = npgrid.parse(input)
+    rows, cols = np.nonzero(npgrid.mask(image, "#"))
+
+    total = 0
+    for coords, axis in ((rows, 1), (cols, 0)):
+        # Shift each galaxy by the number of empty lines before it.
+        empty = np.zeros(image.shape[1 - axis], np.int64)
+        empty[npgrid.uniform_lines(image, ".", axis)] = 1
+        expanded = np.sort(coords + (expansion_factor - 1) * np.cumsum(empty)[coords])
+        # The ith smallest coordinate is added in its i pairs with smaller
+        # coordinates and subtracted in its n - i - 1 pairs with larger ones.
+        n = len(expanded)
+        total += int((expanded * (2 * np.arange(n) - n + 1)).sum())
+    return total
+
+
+@solution(YEAR, DAY, 1)
+def part1(input: str, expansion_factor=2, vectorized=False):
+    if vectorized:
+        return sum_of_distances_vectorized(input, expansion_factor)
+
     def find_empty_space(lines) -> set[int]:
         return {i for i, line in enumerate(lines) if all(c == "." for c in line)}
 
@@ -51,14 +78,16 @@ def part1(input: str, expansion_factor=2):
     # return sum(shortest_path(g1, g2) for g1, g2 in itertools.combinations(galaxies, 2))
 
 
-def part2(input: str):
-    return part1(input, expansion_factor=1_000_000)
+@solution(YEAR, DAY, 2)
+def part2(input: str, vectorized=False):
+    return part1(input, expansion_factor=1_000_000, vectorized=vectorized)
 
 
 class TestDay(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 374)
@@ -67,6 +96,12 @@ class TestDay(unittest.TestCase):
     def test_part2(self):
         self.assertEqual(part2(self.input), 611998089572)
 
+    @unittest.skipUnless(find_spec("numpy"), "NumPy is not installed")
+    def test_vectorized(self):
+        self.assertEqual(part1(self.example, vectorized=True), 374)
+        self.assertEqual(part1(self.input, vectorized=True), 10313550)
+        self.assertEqual(part2(self.input, vectorized=True), 611998089572)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,14 @@
+"Generate galaxy images with `scale` times the area of a 140 by 140 image."
+import math
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = round(140 * math.sqrt(scale))
+    # Leave some rows and columns empty, so the universe expands.
+    rows = [r for r in range(side) if rng.random() > 0.05]
+    cols = [c for c in range(side) if rng.random() > 0.05]
+    image = [["."] * side for _ in range(side)]
+    for _ in range(side * side // 45):
+        image[rng.choice(rows)][rng.choice(cols)] = "#"
+    return "".join("".join(row) + "\n" for row in image)
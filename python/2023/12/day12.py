@@ -4,6 +4,7 @@ import re
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 12
@@ -37,18 +38,21 @@ def count_arrangements(row) -> int:
     return len(results)
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     return sum(count_arrangements(row) for row in parse(input))
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     pass
 
 
 class Test(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 21)
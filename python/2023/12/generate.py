@@ -0,0 +1,23 @@
+"""Generate `scale` times 1000 rows of damaged spring records.
+
+Rows have at most 18 unknown springs, like real records.
+"""
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    lines = []
+    while len(lines) < 1000 * scale:
+        length = rng.randint(4, 20)
+        springs = "".join(rng.choice("#..") for _ in range(length))
+        groups = [len(run) for run in springs.split(".") if run]
+        if not groups:
+            continue
+        # Most rows have a handful of unknowns, and a few have a lot.
+        count = min(length, round(rng.triangular(1, 18, 3)))
+        unknowns = rng.sample(range(length), count)
+        record = list(springs)
+        for i in unknowns:
+            record[i] = "?"
+        lines.append(f"{''.join(record)} {','.join(map(str, groups))}\n")
+    return "".join(lines)
@@ -2,6 +2,7 @@
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 13
@@ -33,18 +34,21 @@ def score_block(block: str, distance_to_match: int) -> int:
     raise ValueError("no reflection found!")
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     return sum(score_block(block, 0) for block in input.split("\n\n"))
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     return sum(score_block(block, 1) for block in input.split("\n\n"))
 
 
 class TestDay13(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 405)
@@ -0,0 +1,62 @@
+"""Generate `scale` times 100 patterns of ash and rocks.
+
+Each pattern has one perfect line of reflection, and one more that a single
+smudge spoils.
+"""
+import random
+
+
+def mirrored(rows: int, cols: int, line: int, rng: random.Random) -> list[list[str]]:
+    "Return a random pattern whose rows reflect across `line`."
+    pattern = [rng.choices("#.", k=cols) for _ in range(rows)]
+    for i in range(min(line, rows - line)):
+        pattern[line + i] = list(pattern[line - 1 - i])
+    return pattern
+
+
+def reflections(pattern: list[str], smudges: int) -> list[int]:
+    "Return the lines of reflection between rows that need exactly `smudges` fixes."
+    return [
+        i
+        for i in range(1, len(pattern))
+        if sum(
+            a != b
+            for above, below in zip(reversed(pattern[:i]), pattern[i:])
+            for a, b in zip(above, below)
+        )
+        == smudges
+    ]
+
+
+def make_pattern(rng: random.Random) -> list[str]:
+    while True:
+        rows, cols = rng.choice(range(7, 18, 2)), rng.choice(range(7, 18, 2))
+        row_line = rng.randint(1, rows - 1)
+        col_line = rng.randint(1, (cols - 1) // 2)
+        # The columns up to twice the column line mirror each other, and every
+        # column mirrors its rows across the row line.
+        left = mirrored(rows, col_line, row_line, rng)
+        right = mirrored(rows, cols - 2 * col_line, row_line, rng)
+        pattern = [l + l[::-1] + r for l, r in zip(left, right)]
+        # Smudge a cell that the column line doesn't reflect.
+        reach = min(row_line, rows - row_line)
+        offset = rng.randrange(reach)
+        r = rng.choice([row_line - 1 - offset, row_line + offset])
+        c = rng.randrange(2 * col_line, cols)
+        pattern[r][c] = "#" if pattern[r][c] == "." else "."
+
+        pattern = ["".join(row) for row in pattern]
+        columns = ["".join(col) for col in zip(*pattern)]
+        if (
+            reflections(pattern, 0) == []
+            and reflections(columns, 0) == [col_line]
+            and reflections(pattern, 1) == [row_line]
+            and reflections(columns, 1) == []
+        ):
+            return pattern if rng.random() < 0.5 else columns
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    return "\n".join(
+        "".join(row + "\n" for row in make_pattern(rng)) for _ in range(100 * scale)
+    )
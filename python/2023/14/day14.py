@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 from enum import Enum
+from importlib.util import find_spec
 from pprint import pprint
 import unittest
 
-from advent import get_puzzle_input
+from advent import get_puzzle_input, metrics
+from advent.budget import budget
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 14
@@ -36,7 +39,12 @@ def total_load_on_north_support_beams(platform: list[str]):
     return total_load
 
 
-def part1(input: str):
+@solution(YEAR, DAY, 1)
+def part1(input: str, vectorized=False):
+    if vectorized:
+        from advent import npgrid
+
+        return north_load(tilt_north_vectorized(npgrid.parse(input)))
     return total_load_on_north_support_beams(input.splitlines())
 
 
@@ -101,49 +109,125 @@ def cycle(platform: Grid) -> Grid:
     return [tuple(reversed(row)) for row in platform]
 
 
+def total_load(grid: Grid) -> int:
+    "Total load of the rounded rocks on the north support beams, without tilting."
+    return sum(
+        len(grid) - r
+        for r, row in enumerate(grid)
+        for item in row
+        if item == GridItem.ROUNDED_ROCK
+    )
+
+
 def print_grid(grid: Grid) -> None:
     for line in grid:
         print("".join(".O#"[item.value] for item in line))
 
 
-def part2(input: str):
-    grid = parse_grid(input.splitlines())
+def tilt_north_vectorized(platform):
+    "Tilt a platform parsed by `advent.npgrid` north."
+    import numpy as np
+
+    rows = np.arange(platform.shape[0])[:, None]
+    cubes = platform == ord("#")
+    rounded = platform == ord("O")
+
+    # Each section starts just below the nearest cube-shaped rock above it,
+    # and its rounded rocks pile up from there in order.
+    section_start = np.maximum.accumulate(np.where(cubes, rows, -1), axis=0) + 1
+    rocks_so_far = np.cumsum(rounded, axis=0)
+    rocks_above_section = np.where(
+        section_start > 0,
+        np.take_along_axis(rocks_so_far, np.maximum(section_start - 1, 0), axis=0),
+        0,
+    )
+    new_rows = section_start + rocks_so_far - rocks_above_section - 1
+
+    tilted = np.where(cubes, ord("#"), ord(".")).astype(np.uint8)
+    r, c = np.nonzero(rounded)
+    tilted[new_rows[r, c], c] = ord("O")
+    return tilted
+
+
+def north_load(platform) -> int:
+    "Total load of the rounded rocks on a platform parsed by `advent.npgrid`."
+    rows = platform.shape[0]
+    r, _ = (platform == ord("O")).nonzero()
+    return int((rows - r).sum())
+
+
+def cycle_vectorized(platform):
+    "`cycle` for a platform parsed by `advent.npgrid`."
+    from advent import npgrid
+
+    # Tilting north then turning clockwise brings west, south and east to the
+    # top in turn.
+    for _ in range(4):
+        platform = npgrid.rotate(tilt_north_vectorized(platform))
+    return platform
+
+
+def part2_vectorized(input: str):
+    from advent import npgrid
+
+    platform = npgrid.parse(input)
     states = {}
+    history = []
     state_cycle_start = state_cycle_end = None
     cycles = 1_000_000_000
     for i in range(cycles):
-        if i % 1000 == 0:
-            print(f"{i}/{cycles}")
+        state = platform.tobytes()
+        if state in states:
+            state_cycle_start = states[state]
+            state_cycle_end = i
+            break
+
+        states[state] = i
+        history.append(platform)
+        platform = cycle_vectorized(platform)
 
+    metrics.count("spin cycles", state_cycle_end)
+    metrics.observe("cycle length", state_cycle_end - state_cycle_start)
+    period = state_cycle_end - state_cycle_start
+    # States repeat every `period` cycles from `state_cycle_start` on.
+    step = state_cycle_start + (cycles - state_cycle_start) % period
+    return north_load(history[step])
+
+
+@solution(YEAR, DAY, 2)
+def part2(input: str, vectorized=False):
+    if vectorized:
+        return part2_vectorized(input)
+
+    grid = parse_grid(input.splitlines())
+    states = {}
+    state_cycle_start = state_cycle_end = None
+    cycles = 1_000_000_000
+    for i in range(cycles):
         tuple_grid = tuple(grid)
         if tuple_grid in states:
             state_cycle_start = states[tuple_grid]
             state_cycle_end = i
-            states[tuple_grid] = i
             break
 
         states[tuple_grid] = i
         grid = cycle(grid)
 
-    state_cycle_step_after_cycles = cycles % (state_cycle_end - state_cycle_start)
-    states_by_step = {step: state for state, step in states.items()}
-    grid = states_by_step[state_cycle_step_after_cycles]
-    for step, state in states_by_step.items():
-        print(
-            step,
-            total_load_on_north_support_beams(
-                ["".join([".O#"[item.value] for item in line]) for line in state]
-            ),
-        )
-    return total_load_on_north_support_beams(
-        ["".join([".O#"[item.value] for item in line]) for line in grid]
-    )
+    metrics.count("spin cycles", state_cycle_end)
+    metrics.observe("cycle length", state_cycle_end - state_cycle_start)
+    period = state_cycle_end - state_cycle_start
+    # States repeat every `period` cycles from `state_cycle_start` on.
+    step = state_cycle_start + (cycles - state_cycle_start) % period
+    states_by_step = {i: state for state, i in states.items()}
+    return total_load(states_by_step[step])
 
 
+@budget(part1="20ms", part2="1s")
 class TestDay14(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 136)
@@ -153,6 +237,12 @@ class TestDay14(unittest.TestCase):
         self.assertEqual(part2(self.example), 64)
         # self.assertEqual(part2(self.input), None)
 
+    @unittest.skipUnless(find_spec("numpy"), "NumPy is not installed")
+    def test_vectorized(self):
+        self.assertEqual(part1(self.example, vectorized=True), 136)
+        self.assertEqual(part1(self.input, vectorized=True), 105249)
+        self.assertEqual(part2(self.example, vectorized=True), 64)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,11 @@
+"Generate platforms with `scale` times the area of a 100 by 100 platform."
+import math
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = round(100 * math.sqrt(scale))
+    return "".join(
+        "".join(rng.choices(".O#", weights=(6, 2, 1), k=side)) + "\n"
+        for _ in range(side)
+    )
@@ -4,6 +4,7 @@ import re
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 15
@@ -19,6 +20,7 @@ def hash(s: str) -> int:
     return result
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str) -> int:
     return sum(hash(step) for step in input.replace("\n", "").split(","))
 
@@ -63,15 +65,17 @@ def focusing_power(boxes):
     )
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     boxes = initialization_sequence(input)
     return focusing_power(boxes)
 
 
 class TestDay15(unittest.TestCase):
-    def setUp(self):
-        self.example = EXAMPLE
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = EXAMPLE
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_hash(self):
         self.assertEqual(hash("HASH"), 52)
@@ -0,0 +1,20 @@
+"Generate initialization sequences of `scale` times 4000 steps."
+import random
+import string
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    labels = list(
+        {
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+            for _ in range(500 * scale)
+        }
+    )
+    steps = []
+    for _ in range(4000 * scale):
+        label = rng.choice(labels)
+        if rng.random() < 0.6:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+    return ",".join(steps) + "\n"
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 from collections import defaultdict
 from copy import copy
-from operator import itemgetter
 import unittest
 
-from advent import get_puzzle_input
+from advent import get_puzzle_input, metrics
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 16
@@ -16,6 +16,7 @@ def valid_beam(grid, beam):
     )
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     grid = input.splitlines()
     energized_tiles = defaultdict(int)
@@ -26,11 +27,8 @@ def part1(input: str):
     steps = 0
     while beams:
         steps += 1
-        if steps % 100 == 0:
-            sorted_beams = sorted(beams, key=itemgetter(3), reverse=True)
-            print(
-                f"len(beams) = {len(beams)}, longest beam = {sorted_beams[0][3]}/{len(grid) * len(grid[0])}"
-            )
+        if metrics.enabled:
+            metrics.observe("beams alive", len(beams))
 
         splits = []
         for bi, beam in enumerate(beams):
@@ -105,6 +103,7 @@ def part1(input: str):
             if valid_beam(grid, beam) and tiles_visited < len(grid) * len(grid[0]):
                 beam[3] += 1
             else:
+                metrics.observe("beam length", beam[3])
                 del beams[bi]
 
             if (
@@ -117,18 +116,20 @@ def part1(input: str):
 
         beams.extend(splits)
 
-    # print(energized_tiles)
+    metrics.count("steps", steps)
     return len(energized_tiles)
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     pass
 
 
 class TestDay16(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 46)
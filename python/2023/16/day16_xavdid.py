@@ -5,40 +5,18 @@ from typing import Literal
 import unittest
 
 from advent import get_puzzle_input
+from advent.grid import Grid, Index
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 16
 
-GridPoint = tuple[int, int]
-Grid = dict[GridPoint, str]
+# Beams leave the grid when they reach the border.
+BORDER = " "
 
-def parse_grid(raw_grid: list[str]) -> Grid:
-    """
-    Returns 2-tuples of (row, col) with their value.
 
-    (0, 0) ------> (0, 9)
-      |              |
-      |              |
-      |              |
-      |              |
-      |              V
-    (9, 0) ------> (9, 9)
-    """
-    result = {}
-
-    for row, line in enumerate(raw_grid):
-        for col, c in enumerate(line):
-            result[row, col] = c
-
-    return result
-
-
-def add_points(a: GridPoint, b: GridPoint) -> GridPoint:
-    """
-    Add a pair of 2-tuples together.
-    Useful for calculating a new position from a location and an offset.
-    """
-    return a[0] + b[0], a[1] + b[1]
+def parse_grid(input: str) -> Grid:
+    return Grid.parse(input, border=BORDER)
 
 
 Rotation = Literal["CCW", "CW"]
@@ -55,65 +33,57 @@ class Direction(Enum):
         offset = 1 if towards == "CW" else -1
         return Direction((facing.value + offset) % 4)
 
-    
-ROW_COLL_OFFSETS: dict[Direction, GridPoint] = {
-    Direction.UP: (-1, 0),
-    Direction.RIGHT: (0, 1),
-    Direction.DOWN: (1, 0),
-    Direction.LEFT: (0, -1),
-}
-
 
 @dataclass(frozen=True)
 class State:
-    loc: GridPoint
+    loc: Index
     facing: Direction
 
-    @property
-    def next_loc(self) -> GridPoint:
-        return add_points(self.loc, ROW_COLL_OFFSETS[self.facing])
+    def next_loc(self, grid: Grid) -> Index:
+        return self.loc + grid.steps[self.facing.value]
 
-    def step(self) -> "State":
-        return State(self.next_loc, self.facing)
+    def step(self, grid: Grid) -> "State":
+        return State(self.next_loc(grid), self.facing)
 
-    def rotate_and_step(self, towards: Rotation) -> "State":
-        return State(self.loc, Direction.rotate(self.facing, towards)).step()
+    def rotate_and_step(self, grid: Grid, towards: Rotation) -> "State":
+        return State(self.loc, Direction.rotate(self.facing, towards)).step(grid)
 
-    def next_states(self, char: str) -> list["State"]:
-        match char:
+    def next_states(self, grid: Grid) -> list["State"]:
+        match char := chr(grid[self.loc]):
             case ".":
-                return [self.step()]
+                return [self.step(grid)]
             # Ignore the pointy end of a splitter.
             case "-" if self.facing in (Direction.LEFT, Direction.RIGHT):
-                return [self.step()]
+                return [self.step(grid)]
             case "|" if self.facing in (Direction.UP, Direction.DOWN):
-                return [self.step()]
+                return [self.step(grid)]
             # Split on splitters we didn't pass over.
             case "-" | "|":
                 return [
-                    self.rotate_and_step("CCW"),
-                    self.rotate_and_step("CW"),
+                    self.rotate_and_step(grid, "CCW"),
+                    self.rotate_and_step(grid, "CW"),
                 ]
             # Bounce off mirrors.
             case "/" if self.facing in (Direction.LEFT, Direction.RIGHT):
-                return [self.rotate_and_step("CCW")]
+                return [self.rotate_and_step(grid, "CCW")]
             case "\\" if self.facing in (Direction.LEFT, Direction.RIGHT):
-                return [self.rotate_and_step("CW")]
+                return [self.rotate_and_step(grid, "CW")]
             case "/" if self.facing in (Direction.UP, Direction.DOWN):
-                return [self.rotate_and_step("CW")]
+                return [self.rotate_and_step(grid, "CW")]
             case "\\" if self.facing in (Direction.UP, Direction.DOWN):
-                return [self.rotate_and_step("CCW")]
+                return [self.rotate_and_step(grid, "CCW")]
             case _:
                 raise ValueError(
                     f"Unable to calculate next step from {self} and {char=}"
                 )
 
     
+@solution(YEAR, DAY, 1)
 def part1(input: str) -> int:
-    grid = parse_grid(input.splitlines())
+    grid = parse_grid(input)
 
     seen: set[State] = set()
-    queue: list[State] = [State((0, 0), Direction.RIGHT)]
+    queue: list[State] = [State(grid.index(0, 0), Direction.RIGHT)]
 
     while queue:
         current = queue.pop()
@@ -121,17 +91,18 @@ def part1(input: str) -> int:
             continue
         seen.add(current)
 
-        for next_state in current.next_states(grid[current.loc]):
-            if next_state.loc in grid:
+        for next_state in current.next_states(grid):
+            if grid[next_state.loc] != grid.border:
                 queue.append(next_state)
 
     return len({state.loc for state in seen})
 
 
 class TestDay16(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 46)
@@ -0,0 +1,11 @@
+"Generate contraptions with `scale` times the area of a 110 by 110 contraption."
+import math
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = round(110 * math.sqrt(scale))
+    return "".join(
+        "".join(rng.choices(".\\/|-", weights=(40, 2, 2, 2, 2), k=side)) + "\n"
+        for _ in range(side)
+    )
@@ -1,41 +1,21 @@
 #!/usr/bin/env python3
-from dataclasses import dataclass
 from enum import IntEnum
-from heapq import heappop, heappush
-from typing import Literal
 import unittest
 
-from advent import get_puzzle_input
+from advent import get_puzzle_input, metrics, search
+from advent.budget import budget
+from advent.grid import Grid, Index
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 17
 
-GridPoint = tuple[int, int]
-Grid = dict[GridPoint, str]
+# Heat loss is always 1-9, so 0 marks the edge of the map.
+BORDER = 0
 
 
-def parse_grid(raw_grid: list[str]) -> Grid:
-    """
-    Returns 2-tuples of (row, col) with their value.
-
-    (0, 0) ------> (0, 9)
-      |              |
-      |              |
-      |              |
-      |              |
-      |              V
-    (9, 0) ------> (9, 9)
-    """
-    result = {}
-
-    for row, line in enumerate(raw_grid):
-        for col, c in enumerate(line):
-            result[row, col] = c
-
-    return result
-
-
-Rotation = Literal["CCW", "CW"]
+def parse_grid(input: str) -> Grid:
+    return Grid.parse(input, border=BORDER, digits=True)
 
 
 class Direction(IntEnum):
@@ -44,106 +24,83 @@ class Direction(IntEnum):
     DOWN = 2
     LEFT = 3
 
-    @staticmethod
-    def rotate(facing: "Direction", towards: Rotation) -> "Direction":
-        offset = 1 if towards == "CW" else -1
-        return Direction((facing.value + offset) % 4)
-
-    @staticmethod
-    def offset(facing: "Direction") -> GridPoint:
-        return _ROW_COL_OFFSETS[facing]
-
-
-_ROW_COL_OFFSETS: dict[Direction, GridPoint] = {
-    Direction.UP: (-1, 0),
-    Direction.RIGHT: (0, 1),
-    Direction.DOWN: (1, 0),
-    Direction.LEFT: (0, -1),
-}
-
-
-def add_points(a: GridPoint, b: GridPoint) -> GridPoint:
-    return a[0] + b[0], a[1] + b[1]
 
+MAX_HEAT_LOSS = 9
 
-# Position needs to be comparable to be used with heapq.
-# There are two easy ways to achieve this:
-# 1. Add `order=True` to the dataclass decorator, as shown below.
-# 2. Switch from dataclasses to NamedTuple (from typing).
-@dataclass(frozen=True, order=True)
-class Position:
-    loc: GridPoint
-    facing: Direction
 
-    @property
-    def next_loc(self) -> GridPoint:
-        return add_points(self.loc, Direction.offset(self.facing))
+def _solve(input: str, min_steps: int, max_steps: int, algorithm: str = "dial") -> int:
+    grid = parse_grid(input)
+    steps = grid.steps
 
-    def step(self) -> "Position":
-        return Position(self.next_loc, self.facing)
+    # Search states are packed into ints as (loc, facing, num_steps).
+    def pack(loc: Index, facing: int, num_steps: int) -> search.State:
+        return (loc * 4 + facing) * (max_steps + 1) + num_steps
 
-    def rotate_and_step(self, towards: Rotation) -> "Position":
-        return Position(self.loc, Direction.rotate(self.facing, towards)).step()
-
-
-State = tuple[int, Position, int]
-
-
-def _solve(input: str, min_steps: int, max_steps: int) -> int:
-    raw_grid = input.splitlines()
+    def neighbors(state: search.State):
+        rest, num_steps = divmod(state, max_steps + 1)
+        loc, facing = divmod(rest, 4)
+        if num_steps >= min_steps:
+            # Turn left or right.
+            for turned in ((facing - 1) % 4, (facing + 1) % 4):
+                next_loc = loc + steps[turned]
+                if (heat_loss := grid[next_loc]) != BORDER:
+                    yield pack(next_loc, turned, 1), heat_loss
+        if num_steps < max_steps:
+            next_loc = loc + steps[facing]
+            if (heat_loss := grid[next_loc]) != BORDER:
+                yield pack(next_loc, facing, num_steps + 1), heat_loss
 
     # Bottom-right corner of the grid.
-    target = len(raw_grid) - 1, len(raw_grid[0]) - 1
-    grid = {k: int(v) for k, v in parse_grid(raw_grid).items()}
+    target = grid.index(grid.rows - 1, grid.cols - 1)
 
-    # Start walking in both directions.
-    queue: list[State] = [
-        (0, Position((0, 0), Direction.DOWN), 0),
-        (0, Position((0, 0), Direction.RIGHT), 0),
-    ]
-    seen: set[tuple[Position, int]] = set()
+    def is_goal(state: search.State) -> bool:
+        rest, num_steps = divmod(state, max_steps + 1)
+        return rest // 4 == target and num_steps >= min_steps
 
-    while queue:
-        cost, pos, num_steps = heappop(queue)
-
-        if pos.loc == target and num_steps >= min_steps:
-            return cost
-
-        if (pos, num_steps) in seen:
-            continue
-        seen.add((pos, num_steps))
+    # Start walking in both directions.
+    start = grid.index(0, 0)
+    starts = [pack(start, Direction.DOWN, 0), pack(start, Direction.RIGHT, 0)]
 
-        if (
-            num_steps >= min_steps
-            and (left := pos.rotate_and_step("CCW")).loc in grid
-        ):
-            heappush(queue, (cost + grid[left.loc], left, 1))
+    stats = search.SearchStats()
+    match algorithm:
+        case "dial":
+            cost = search.dial(starts, neighbors, is_goal, MAX_HEAT_LOSS, stats)
+        case "dijkstra":
+            cost = search.dijkstra(starts, neighbors, is_goal, stats)
+        case "astar":
+            target_row, target_col = grid.point(target)
 
-        if (
-            num_steps >= min_steps
-            and (right := pos.rotate_and_step("CW")).loc in grid
-        ):
-            heappush(queue, (cost + grid[right.loc], right, 1))
+            def distance_to_target(state: search.State) -> int:
+                row, col = grid.point(state // (4 * (max_steps + 1)))
+                return target_row - row + target_col - col
 
-        if num_steps < max_steps and (forward := pos.step()).loc in grid:
-            heappush(queue, (cost + grid[forward.loc], forward, num_steps + 1))
+            cost = search.astar(starts, neighbors, is_goal, distance_to_target, stats)
+        case _:
+            raise ValueError(f"Unknown search algorithm: {algorithm}")
 
-    return -1
+    metrics.count("states pushed", stats.pushed)
+    metrics.count("states popped", stats.popped)
+    metrics.count("states expanded", stats.expanded)
+    return -1 if cost is None else cost
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str) -> int:
     return _solve(input, 0, 3)
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     return _solve(input, 4, 10)
 
 
+@budget(part1="2s", part2="5s")
 class TestDay17(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.example2 = get_puzzle_input(YEAR, DAY, "example2.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.example2 = get_puzzle_input(YEAR, DAY, "example2.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 102)
@@ -154,6 +111,13 @@ class TestDay17(unittest.TestCase):
         self.assertEqual(part2(self.example2), 71)
         self.assertEqual(part2(self.input), 1411)
 
+    def test_algorithms(self):
+        for algorithm in ("dial", "dijkstra", "astar"):
+            with self.subTest(algorithm=algorithm):
+                self.assertEqual(_solve(self.example, 0, 3, algorithm), 102)
+                self.assertEqual(_solve(self.example, 4, 10, algorithm), 94)
+                self.assertEqual(_solve(self.example2, 4, 10, algorithm), 71)
+
 
 if __name__ == "__main__":
     unittest.main()
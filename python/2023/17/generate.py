@@ -0,0 +1,10 @@
+"Generate heat loss maps with `scale` times the area of a 141 by 141 map."
+import math
+import random
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    side = round(141 * math.sqrt(scale))
+    return "".join(
+        "".join(rng.choices("123456789", k=side)) + "\n" for _ in range(side)
+    )
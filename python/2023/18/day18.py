@@ -4,6 +4,7 @@ from itertools import pairwise
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 18
@@ -83,6 +84,7 @@ def area(outline: list[LatticePoint]) -> int:
     )
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str):
     dig_plan = parse(input)
     outline = boundary_points(dig_plan)
@@ -99,14 +101,16 @@ def parse2(input: str):
     return [Step(*parse_line(line)) for line in input.splitlines()]
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     return area(boundary_points(parse2(input)))
 
 
 class TestDay18(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 62)
@@ -0,0 +1,118 @@
+"""Generate dig plans of about `scale` times 700 steps.
+
+The trench runs around a random spanning tree, so it never crosses itself.
+Stretching the rows and columns by random amounts keeps it that way, so the
+colour codes describe the same trench, turned and stretched much further.
+"""
+import itertools
+import random
+
+OFFSETS = {"U": (-1, 0), "R": (0, 1), "D": (1, 0), "L": (0, -1)}
+TURNS = "URDL"
+
+
+def spanning_tree(size: int, rng: random.Random):
+    "Grow a random tree of `size` cells."
+    cells = {(0, 0)}
+    edges = []
+    frontier = [((0, 0), offset) for offset in OFFSETS.values()]
+    while len(cells) < size:
+        a, (dr, dc) = frontier.pop(rng.randrange(len(frontier)))
+        b = (a[0] + dr, a[1] + dc)
+        if b in cells:
+            continue
+        cells.add(b)
+        edges.append((a, b))
+        frontier.extend((b, offset) for offset in OFFSETS.values())
+    return cells, edges
+
+
+def trench_around(cells, edges) -> list[tuple[int, int]]:
+    "Return the corners of a loop that winds around a tree, in order."
+    links = {}
+    for r, c in cells:
+        # Each cell is a ring of four points...
+        ring = [
+            (2 * r, 2 * c),
+            (2 * r, 2 * c + 1),
+            (2 * r + 1, 2 * c + 1),
+            (2 * r + 1, 2 * c),
+        ]
+        for a, b in itertools.pairwise(ring + ring[:1]):
+            links.setdefault(a, set()).add(b)
+            links.setdefault(b, set()).add(a)
+    for a, b in edges:
+        # ...and each edge replaces the facing sides of two rings with two
+        # links joining them.
+        (r1, c1), (r2, c2) = sorted([a, b])
+        if r1 == r2:
+            pairs = [
+                ((2 * r1, 2 * c1 + 1), (2 * r1, 2 * c2)),
+                ((2 * r1 + 1, 2 * c1 + 1), (2 * r1 + 1, 2 * c2)),
+            ]
+        else:
+            pairs = [
+                ((2 * r1 + 1, 2 * c1), (2 * r2, 2 * c1)),
+                ((2 * r1 + 1, 2 * c1 + 1), (2 * r2, 2 * c1 + 1)),
+            ]
+        (a1, b1), (a2, b2) = pairs
+        for x, y in ((a1, a2), (b1, b2)):
+            links[x].remove(y)
+            links[y].remove(x)
+        for x, y in pairs:
+            links[x].add(y)
+            links[y].add(x)
+
+    start = min(links)
+    path = [start, min(links[start])]
+    while path[-1] != start:
+        path.append(next(p for p in links[path[-1]] if p != path[-2]))
+    return [
+        b
+        for a, b, c in zip(path, path[1:], path[2:] + path[1:2])
+        if (b[0] - a[0], b[1] - a[1]) != (c[0] - b[0], c[1] - b[1])
+    ]
+
+
+def stretch(corners, low: int, high: int, rng: random.Random):
+    """Move every row and column of corners apart by between `low` and `high`.
+
+    Keeping them at least two apart leaves room between parallel runs of trench.
+    """
+    coordinates = []
+    for axis in (0, 1):
+        positions = sorted({corner[axis] for corner in corners})
+        placed = list(itertools.accumulate(rng.randint(low, high) for _ in positions))
+        coordinates.append(dict(zip(positions, placed)))
+    return [(coordinates[0][r], coordinates[1][c]) for r, c in corners]
+
+
+def steps(corners) -> list[tuple[str, int]]:
+    result = []
+    for (r1, c1), (r2, c2) in itertools.pairwise(corners + corners[:1]):
+        if r1 == r2:
+            result.append(("R" if c2 > c1 else "L", abs(c2 - c1)))
+        else:
+            result.append(("D" if r2 > r1 else "U", abs(r2 - r1)))
+    return result
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    cells, edges = spanning_tree(200 * scale, rng)
+    corners = trench_around(cells, edges)
+    # Turn the trench clockwise, which is how the solution measures it.
+    sides = itertools.pairwise(corners + corners[:1])
+    if sum(a[0] * b[1] - b[0] * a[1] for a, b in sides) > 0:
+        corners.reverse()
+
+    first = steps(stretch(corners, 2, 12, rng))
+    turns = rng.randrange(4)
+    # Colour codes only have five hex digits for the distance.
+    spread = max(len({corner[axis] for corner in corners}) for axis in (0, 1))
+    second = steps(stretch(corners, 1000, min(50_000, 0xFFFFF // spread), rng))
+    lines = []
+    for (direction, distance), (turned, colour_distance) in zip(first, second):
+        colour_direction = TURNS[(TURNS.index(turned) + turns) % 4]
+        code = f"{colour_distance:05x}{'RDLU'.index(colour_direction)}"
+        lines.append(f"{direction} {distance} (#{code})\n")
+    return "".join(lines)
@@ -6,6 +6,7 @@ from pprint import pprint
 import unittest
 
 from advent import get_puzzle_input
+from advent.registry import solution
 
 YEAR = 2023
 DAY = 19
@@ -78,6 +79,7 @@ def parse(input: str) -> (list[Workflow], list[Part]):
     return workflows, parts
 
 
+@solution(YEAR, DAY, 1)
 def part1(input: str) -> int:
     workflows, parts = parse(input)
     workflows = {workflow.name: workflow for workflow in workflows}
@@ -101,14 +103,16 @@ def part1(input: str) -> int:
     return sum(part.total for part in results[Result.ACCEPT])
 
 
+@solution(YEAR, DAY, 2)
 def part2(input: str):
     pass
 
 
 class TestDay19(unittest.TestCase):
-    def setUp(self):
-        self.example = get_puzzle_input(YEAR, DAY, "example.txt")
-        self.input = get_puzzle_input(YEAR, DAY)
+    @classmethod
+    def setUpClass(cls):
+        cls.example = get_puzzle_input(YEAR, DAY, "example.txt")
+        cls.input = get_puzzle_input(YEAR, DAY)
 
     def test_part1(self):
         self.assertEqual(part1(self.example), 19114)
@@ -0,0 +1,38 @@
+"""Generate `scale` times 550 workflows and 200 parts.
+
+Workflows only send parts to workflows later in the list, so every part ends
+up accepted or rejected.
+"""
+import itertools
+import random
+import string
+
+
+def generate(scale: int, rng: random.Random) -> str:
+    names = [
+        "".join(letters)
+        for size in (2, 3)
+        for letters in itertools.product(string.ascii_lowercase, repeat=size)
+        if "".join(letters) != "in"
+    ]
+    names = ["in", *rng.sample(names, 550 * scale - 1)]
+
+    def target(i: int) -> str:
+        later = names[i + 1 : i + 40]
+        return rng.choice(["A", "R", *later, *later]) if later else rng.choice("AR")
+
+    workflows = []
+    for i, name in enumerate(names):
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target(i)}"
+            for _ in range(rng.randint(1, 3))
+        ]
+        rules.append(target(i))
+        workflows.append(f"{name}{{{','.join(rules)}}}\n")
+    rng.shuffle(workflows)
+
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}\n"
+        for _ in range(200 * scale)
+    ]
+    return "".join(workflows) + "\n" + "".join(parts)
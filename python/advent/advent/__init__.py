@@ -1 +1,2 @@
-from .puzzle import get_puzzle_input
+from .puzzle import get_puzzle_input, get_puzzle_input_buffer, iter_puzzle_input
+from .stream import iter_lines
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 import argparse
+import pathlib
 import sys
 from datetime import date
 
-from .puzzle import Puzzle, Language
+from .puzzle import NEW_LANGUAGES, Language, Puzzle, PuzzleIndex, repo_root
 
 
 def get_latest_puzzle() -> tuple[int, int]:
@@ -14,6 +15,14 @@ def get_latest_puzzle() -> tuple[int, int]:
     return year, day
 
 
+def positive_float(value: str) -> float:
+    """Parse a number greater than zero, for argparse."""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: {value}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(description="Advent of Code helper tool")
     subparsers = parser.add_subparsers(
@@ -24,7 +33,7 @@ def main():
     new_cmd = subparsers.add_parser("new", help="Prepare for a new day's puzzle")
     new_cmd.add_argument(
         "language",
-        choices=[str(language) for language in Language],
+        choices=[str(language) for language in NEW_LANGUAGES],
         nargs="?",
         default="python",
         help="Programming language to use for solution implementation",
@@ -36,6 +45,251 @@ def main():
     new_cmd.add_argument(
         "day", type=int, nargs="?", default=day, help="Day the puzzle was published"
     )
+    new_cmd.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Download the puzzle input even if it is already cached",
+    )
+
+    fetch_cmd = subparsers.add_parser(
+        "fetch", help="Download many puzzle inputs concurrently"
+    )
+    fetch_cmd.add_argument(
+        "--language",
+        choices=[str(language) for language in Language],
+        default="python",
+        help="Which solutions' puzzle directories to save inputs to",
+    )
+    fetch_cmd.add_argument(
+        "--year", type=int, default=year, help="Year the puzzles were published"
+    )
+    fetch_cmd.add_argument(
+        "--days",
+        default="1-25",
+        help="Days to fetch, e.g. 1-25 or 1,3,5-7 (default: 1-25)",
+    )
+    fetch_cmd.add_argument(
+        "-j", "--jobs", type=int, default=4, help="Concurrent requests (default: 4)"
+    )
+    fetch_cmd.add_argument(
+        "--rate",
+        type=positive_float,
+        default=5,
+        help="Maximum requests started per second (default: 5)",
+    )
+    fetch_cmd.add_argument(
+        "--base-url",
+        help="Website to download from (default: $ADVENT_BASE_URL or https://adventofcode.com)",
+    )
+    fetch_cmd.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Download inputs even if they are already cached",
+    )
+
+    run_cmd = subparsers.add_parser(
+        "run", help="Run every solution in parallel and report answers and timings"
+    )
+    run_cmd.add_argument("--year", type=int, help="Only run solutions for this year")
+    run_cmd.add_argument("--day", type=int, help="Only run solutions for this day")
+    run_cmd.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    run_cmd.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Recompute every answer instead of reusing cached ones",
+    )
+    run_cmd.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Report the metrics each part records (implies recomputing answers)",
+    )
+    run_cmd.add_argument(
+        "--mem",
+        action="store_true",
+        help="Report each part's peak memory, running each in a process of its own"
+        " (implies recomputing answers)",
+    )
+    run_cmd.add_argument(
+        "--mem-limit",
+        metavar="SIZE",
+        help="Fail parts that use more than this much memory, e.g. 2G"
+        " (implies recomputing answers)",
+    )
+    run_cmd.add_argument(
+        "--input",
+        type=pathlib.Path,
+        help="Run against this input file instead of the puzzle input",
+    )
+    run_cmd.add_argument(
+        "--via-server",
+        action="store_true",
+        help="Run on the warm workers of `advent serve` instead of a new pool",
+    )
+    run_cmd.add_argument(
+        "--isolation",
+        choices=("process", "subinterpreter", "thread"),
+        default="process",
+        help="What each worker runs solutions in (default: process)",
+    )
+
+    serve_cmd = subparsers.add_parser(
+        "serve", help="Keep warm worker processes for `advent run --via-server`"
+    )
+    serve_cmd.add_argument(
+        "--socket",
+        type=pathlib.Path,
+        help="Unix socket to listen on (default: $ADVENT_SOCKET, or in the cache)",
+    )
+    serve_cmd.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+
+    watch_cmd = subparsers.add_parser(
+        "watch", help="Run a solution's parts again whenever they or the input change"
+    )
+    watch_cmd.add_argument("year", type=int, help="Year the puzzle was published")
+    watch_cmd.add_argument("day", type=int, help="Day the puzzle was published")
+    watch_cmd.add_argument(
+        "--solution",
+        help="Solution module to watch, if the day has several (e.g. day16_xavdid)",
+    )
+    watch_cmd.add_argument(
+        "--input",
+        type=pathlib.Path,
+        help="Input file to run against instead of the puzzle input",
+    )
+    watch_cmd.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Seconds between checks for changes (default: 0.5)",
+    )
+
+    bench_cmd = subparsers.add_parser(
+        "bench", help="Benchmark solutions and compare against a baseline"
+    )
+    bench_cmd.add_argument("--year", type=int, help="Only benchmark this year")
+    bench_cmd.add_argument("--day", type=int, help="Only benchmark this day")
+    bench_cmd.add_argument(
+        "-n", "--runs", type=int, default=10, help="Timed runs per part (default: 10)"
+    )
+    bench_cmd.add_argument(
+        "--warmup", type=int, default=1, help="Untimed runs per part (default: 1)"
+    )
+    bench_cmd.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        default=pathlib.Path("bench.json"),
+        help="Where to write the results (default: bench.json)",
+    )
+    bench_cmd.add_argument(
+        "--compare",
+        type=pathlib.Path,
+        metavar="BASELINE",
+        help="Results file to compare against",
+    )
+    bench_cmd.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Slowdown in median time that counts as a regression (default: 0.1)",
+    )
+
+    bench_cmd.add_argument(
+        "--scales",
+        help="Instead of the puzzle inputs, time generated inputs of these scales"
+        " and estimate how each part grows, e.g. 1,2,4",
+    )
+    bench_cmd.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for generated inputs (default: 0)",
+    )
+
+    bench_cmd.add_argument(
+        "--throughput",
+        action="store_true",
+        help="Instead of timing each part, time running them all in each isolation"
+        " mode of `advent run`",
+    )
+    bench_cmd.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Workers for --throughput (default: number of CPUs)",
+    )
+
+    bench_cmd.add_argument(
+        "--languages",
+        help="Instead of timing each part, time each day's solutions in these"
+        " languages on the same input and compare them, e.g. python,rust,go",
+    )
+
+    bench_cmd.add_argument(
+        "--startup",
+        action="store_true",
+        help="Instead of solutions, check how long `import advent` takes",
+    )
+    bench_cmd.add_argument(
+        "--budget",
+        type=float,
+        default=25,
+        metavar="MS",
+        help="Import time budget for --startup, in milliseconds (default: 25)",
+    )
+
+    gen_cmd = subparsers.add_parser(
+        "gen", help="Generate a synthetic puzzle input of a given scale"
+    )
+    gen_cmd.add_argument("year", type=int, help="Year the puzzle was published")
+    gen_cmd.add_argument("day", type=int, help="Day the puzzle was published")
+    gen_cmd.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="Size relative to a real input (default: 1)",
+    )
+    gen_cmd.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    gen_cmd.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help="Where to write the input (default: standard output)",
+    )
+
+    profile_cmd = subparsers.add_parser(
+        "profile", help="Profile a solution with cProfile and, optionally, tracemalloc"
+    )
+    profile_cmd.add_argument("year", type=int, help="Year the puzzle was published")
+    profile_cmd.add_argument("day", type=int, help="Day the puzzle was published")
+    profile_cmd.add_argument(
+        "--part", type=int, choices=(1, 2), help="Only profile this part"
+    )
+    profile_cmd.add_argument(
+        "--mem", action="store_true", help="Also report memory allocations"
+    )
+    profile_cmd.add_argument(
+        "--top", type=int, default=20, help="Number of entries to report (default: 20)"
+    )
+    profile_cmd.add_argument(
+        "--solution",
+        help="Solution module to profile, if the day has several (e.g. day16_xavdid)",
+    )
+
+    subparsers.add_parser(
+        "index", help="Write a manifest of every puzzle directory in the repo"
+    )
 
     args = parser.parse_args()
 
@@ -43,7 +297,97 @@ def main():
         match args.subcommand:
             case "new":
                 puzzle = Puzzle(args.language, args.year, args.day)
-                puzzle.new()
+                puzzle.new(refresh=args.refresh)
+                from . import website
+
+                if website.transfers:
+                    print(website.summary(each=True))
+            case "fetch":
+                from . import fetch
+
+                return fetch.main(
+                    args.language,
+                    args.year,
+                    fetch.parse_days(args.days),
+                    args.jobs,
+                    args.base_url,
+                    args.rate,
+                    args.refresh,
+                )
+            case "run":
+                from . import runner
+
+                return runner.main(
+                    args.year,
+                    args.day,
+                    args.jobs,
+                    args.use_cache,
+                    args.metrics,
+                    args.input,
+                    args.via_server,
+                    args.isolation,
+                    args.mem,
+                    runner.parse_size(args.mem_limit) if args.mem_limit else None,
+                )
+            case "serve":
+                from . import server
+
+                return server.main(args.socket, args.jobs)
+            case "watch":
+                from . import watch
+
+                return watch.main(
+                    args.year, args.day, args.solution, args.input, args.interval
+                )
+            case "bench":
+                from . import bench
+
+                if args.startup:
+                    return bench.main_startup(args.runs, args.budget)
+                if args.languages:
+                    return bench.main_languages(
+                        args.year,
+                        args.day,
+                        bench.parse_languages(args.languages),
+                        args.runs,
+                        args.warmup,
+                    )
+                if args.throughput:
+                    return bench.main_throughput(
+                        args.year, args.day, args.jobs, args.runs
+                    )
+                if args.scales:
+                    return bench.main_sweep(
+                        args.year,
+                        args.day,
+                        bench.parse_scales(args.scales),
+                        args.seed,
+                        args.runs,
+                        args.warmup,
+                    )
+                return bench.main(
+                    args.year,
+                    args.day,
+                    args.runs,
+                    args.warmup,
+                    args.output,
+                    args.compare,
+                    args.threshold,
+                )
+            case "gen":
+                from . import gen
+
+                return gen.main(args.year, args.day, args.scale, args.seed, args.output)
+            case "profile":
+                from . import profile
+
+                return profile.main(
+                    args.year, args.day, args.part, args.mem, args.top, args.solution
+                )
+            case "index":
+                index = PuzzleIndex.scan(repo_root())
+                index.save()
+                print(f"Indexed {len(index.paths)} puzzles in {index.manifest_path}")
     except Exception as e:
         print(e)
         return 1
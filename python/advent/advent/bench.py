@@ -0,0 +1,558 @@
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import json
+import math
+import os
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from . import registry
+from .budget import format_ns
+from .puzzle import Language, Puzzle, get_puzzle_input
+from .runner import (
+    ISOLATION_MODES,
+    Solution,
+    discover,
+    load_module,
+    load_part,
+    make_tasks,
+    run,
+)
+
+
+@dataclass
+class Stats:
+    "Summary statistics of repeated timings of one part, in nanoseconds."
+    runs: int
+    min_ns: int
+    median_ns: int
+    p95_ns: int
+
+    @classmethod
+    def from_samples(cls, samples: list[int]) -> "Stats":
+        samples = sorted(samples)
+        return cls(
+            runs=len(samples),
+            min_ns=samples[0],
+            median_ns=percentile(samples, 50),
+            p95_ns=percentile(samples, 95),
+        )
+
+
+@dataclass
+class Regression:
+    key: str
+    baseline_ns: int
+    current_ns: int
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns
+
+
+def parse_scales(spec: str) -> list[int]:
+    "Parse a comma-separated list of input scales, like `1,2,4`."
+    scales = sorted({int(scale) for scale in spec.split(",")})
+    if len(scales) < 2 or scales[0] < 1:
+        raise ValueError(f"Expected two or more scales of at least 1, not {spec!r}")
+    return scales
+
+
+def parse_languages(spec: str) -> list[Language]:
+    "Parse a comma-separated list of languages to compare, like `python,rust,go`."
+    languages = list(dict.fromkeys(Language(name.strip()) for name in spec.split(",")))
+    if len(languages) < 2:
+        raise ValueError(f"Expected two or more languages, not {spec!r}")
+    return languages
+
+
+def percentile(sorted_samples: list[int], p: float) -> int:
+    """Return the `p`th percentile of `sorted_samples` using the nearest-rank method."""
+    rank = max(1, -(-len(sorted_samples) * p // 100))
+    return sorted_samples[int(rank) - 1]
+
+
+def bench_key(solution: Solution, part: str) -> str:
+    return f"{solution.year}/{solution.day:02d}/{solution.name}/{part}"
+
+
+def measure(func, input, runs: int, warmup: int) -> list[int]:
+    """Call `func(input)` `warmup` times, then return the duration of `runs` more calls."""
+    for _ in range(warmup):
+        func(input)
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter_ns()
+        func(input)
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def bench(
+    solutions: list[Solution], runs: int, warmup: int
+) -> tuple[dict[str, Stats], dict[str, str]]:
+    """Time every part of every solution, one at a time.
+
+    Returns the statistics for each part that ran, and the error for each part
+    that didn't.
+    """
+    stats = {}
+    errors = {}
+    for solution in solutions:
+        for part in solution.parts:
+            key = bench_key(solution, part)
+            try:
+                func = load_part(solution, part, reuse_models=False)
+                input = get_puzzle_input(solution.year, solution.day)
+                stats[key] = Stats.from_samples(measure(func, input, runs, warmup))
+            except Exception as e:
+                errors[key] = f"{type(e).__name__}: {e}"
+    return stats, errors
+
+
+@dataclass
+class Growth:
+    "How the median time of one part grows with the scale of its input."
+    scales: list[int]
+    median_ns: list[int]
+
+    @property
+    def exponent(self) -> float:
+        "The k in time ~ scale^k, fitted on a log-log scale."
+        slope, _ = statistics.linear_regression(
+            [math.log(scale) for scale in self.scales],
+            [math.log(max(ns, 1)) for ns in self.median_ns],
+        )
+        return slope
+
+
+def sweep(
+    solutions: list[Solution], scales: list[int], seed: int, runs: int, warmup: int
+) -> tuple[dict[str, Growth], dict[str, str]]:
+    """Time every part of every solution on generated inputs of each scale.
+
+    Returns how each part that ran grew, and the error for each part that
+    didn't.
+    """
+    from . import gen
+
+    growth = {}
+    errors = {}
+    for solution in solutions:
+        for part in solution.parts:
+            key = bench_key(solution, part)
+            try:
+                func = load_part(solution, part, reuse_models=False)
+                medians = []
+                for scale in scales:
+                    input = gen.generate(solution.year, solution.day, scale, seed)
+                    samples = measure(func, input, runs, warmup)
+                    medians.append(Stats.from_samples(samples).median_ns)
+                growth[key] = Growth(scales, medians)
+            except Exception as e:
+                errors[key] = f"{type(e).__name__}: {e}"
+    return growth, errors
+
+
+def throughput(
+    solutions: list[Solution], jobs: int, runs: int
+) -> tuple[dict[str, Stats], dict[str, str]]:
+    """Time running every part of every solution in each isolation mode.
+
+    Each run starts a new pool, so the times include starting the workers and
+    sending them the parts, as they do for `advent run`. Returns the
+    statistics for each mode that ran, and the error for each mode that
+    didn't.
+    """
+    tasks = make_tasks(solutions, use_cache=False)
+    stats = {}
+    errors = {}
+    for isolation in ISOLATION_MODES:
+        samples = []
+        try:
+            for _ in range(runs):
+                start = time.perf_counter_ns()
+                run(tasks, jobs, isolation)
+                samples.append(time.perf_counter_ns() - start)
+        except Exception as e:
+            errors[isolation] = f"{type(e).__name__}: {e}"
+            continue
+        stats[isolation] = Stats.from_samples(samples)
+    return stats, errors
+
+
+def solve_all(solution: Solution) -> Callable[[str], None]:
+    """Return a function that solves every part of `solution` from the input.
+
+    Like a native program, each part parses the input every time, instead of
+    reusing a model `registry.solver` keeps.
+    """
+    module = load_module(solution)
+    parse = registry.get_parser(module)
+    funcs = [registry.get(module, part) for part in solution.parts]
+
+    def solve(input: str) -> None:
+        for func in funcs:
+            func(parse(input) if parse else input)
+
+    return solve
+
+
+def _measure_python(
+    solutions: list[Solution], input: str, runs: int, warmup: int
+) -> list[int]:
+    "Time each of a day's Python solutions, and return the samples of the fastest."
+    timings = []
+    for solution in solutions:
+        try:
+            timings.append(measure(solve_all(solution), input, runs, warmup))
+        except Exception as e:
+            error = e
+    if not timings:
+        raise error
+    return min(timings, key=statistics.median)
+
+
+def day_input(year: int, day: int, languages: list[Language]) -> str | None:
+    "Return the puzzle input from the first of `languages` that has it, if any."
+    for language in languages:
+        try:
+            return Puzzle(language, year, day).input()
+        except FileNotFoundError:
+            pass
+    return None
+
+
+def compare_languages(
+    languages: list[Language], year: int | None, day: int | None, runs: int, warmup: int
+) -> tuple[dict[str, dict[Language, Stats]], dict[str, dict[Language, str]], list[str]]:
+    """Time each day's solutions in each of `languages` on the same input.
+
+    Only days solved in two or more of them are timed. A Python solution is
+    timed solving every part, and a native one running its program, which
+    includes starting it. Returns the statistics for each day and language
+    that ran, the error for each that didn't, and the days that have no input
+    to time them on.
+    """
+    from . import native
+
+    found: dict[tuple[int, int], dict[Language, list]] = {}
+    for language in languages:
+        if language == Language.PYTHON:
+            solutions: list = discover(year, day)
+        else:
+            solutions = native.discover(language, year, day)
+        for solution in solutions:
+            puzzle = (solution.year, solution.day)
+            found.setdefault(puzzle, {}).setdefault(language, []).append(solution)
+
+    stats: dict[str, dict[Language, Stats]] = {}
+    errors: dict[str, dict[Language, str]] = {}
+    no_input = []
+    with tempfile.TemporaryDirectory(prefix="advent-bench-") as tmp:
+        workdir = pathlib.Path(tmp)
+        for (puzzle_year, puzzle_day), by_language in sorted(found.items()):
+            if len(by_language) < 2:
+                continue
+            key = f"{puzzle_year}/{puzzle_day:02d}"
+            input = day_input(puzzle_year, puzzle_day, list(by_language))
+            if input is None:
+                no_input.append(key)
+                continue
+            for language, solutions in by_language.items():
+                try:
+                    if language == Language.PYTHON:
+                        samples = _measure_python(solutions, input, runs, warmup)
+                    else:
+                        program = native.build(solutions[0], input, workdir)
+                        samples = measure(native.run, program, runs, warmup)
+                except Exception as e:
+                    errors.setdefault(key, {})[language] = f"{type(e).__name__}: {e}"
+                    continue
+                stats.setdefault(key, {})[language] = Stats.from_samples(samples)
+    return stats, errors, no_input
+
+
+def save(path: pathlib.Path, stats: dict[str, Stats], runs: int, warmup: int) -> None:
+    results = {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "runs": runs,
+        "warmup": warmup,
+        "results": {key: asdict(s) for key, s in stats.items()},
+    }
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def load(path: pathlib.Path) -> dict[str, Stats]:
+    with open(path) as f:
+        results = json.load(f)
+    return {key: Stats(**s) for key, s in results["results"].items()}
+
+
+def compare(
+    baseline: dict[str, Stats], current: dict[str, Stats], threshold: float
+) -> list[Regression]:
+    """Return the parts whose median got slower than baseline by more than `threshold`."""
+    regressions = []
+    for key, stats in current.items():
+        if key not in baseline:
+            continue
+        regression = Regression(key, baseline[key].median_ns, stats.median_ns)
+        if regression.ratio > 1 + threshold:
+            regressions.append(regression)
+    return regressions
+
+
+def _align(rows: list[list[str]], columns: int) -> str:
+    # Error messages span the timing columns, so don't size the columns by them.
+    full_rows = [row for row in rows if len(row) == columns]
+    widths = [max(len(row[i]) for row in full_rows) for i in range(columns)]
+    widths[0] = max(len(row[0]) for row in rows)
+    lines = []
+    for row in [rows[0], ["-" * w for w in widths], *rows[1:]]:
+        lines.append("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+    return "\n".join(lines)
+
+
+def format_table(
+    stats: dict[str, Stats],
+    errors: dict[str, str],
+    baseline: dict[str, Stats] | None = None,
+) -> str:
+    header = ["Part", "Min", "Median", "P95"]
+    if baseline is not None:
+        header.append("Change")
+
+    rows = []
+    for key in sorted(stats.keys() | errors.keys()):
+        if key in errors:
+            rows.append([key, f"error: {errors[key]}"])
+            continue
+        s = stats[key]
+        row = [key, format_ns(s.min_ns), format_ns(s.median_ns), format_ns(s.p95_ns)]
+        if baseline is not None:
+            if key in baseline:
+                change = s.median_ns / baseline[key].median_ns - 1
+                row.append(f"{change:+.1%}")
+            else:
+                row.append("new")
+        rows.append(row)
+    return _align([header, *rows], len(header))
+
+
+def format_growth_table(
+    growth: dict[str, Growth], errors: dict[str, str], scales: list[int]
+) -> str:
+    header = ["Part", *(f"{scale}x" for scale in scales), "Growth"]
+    rows = []
+    for key in sorted(growth.keys() | errors.keys()):
+        if key in errors:
+            rows.append([key, f"error: {errors[key]}"])
+            continue
+        g = growth[key]
+        rows.append(
+            [key, *(format_ns(ns) for ns in g.median_ns), f"~O(n^{g.exponent:.2f})"]
+        )
+    return _align([header, *rows], len(header))
+
+
+def format_throughput_table(
+    stats: dict[str, Stats], errors: dict[str, str], parts: int
+) -> str:
+    header = ["Isolation", "Min", "Median", "P95", "Parts/s"]
+    rows = []
+    for isolation in ISOLATION_MODES:
+        if isolation in errors:
+            rows.append([isolation, f"error: {errors[isolation]}"])
+        elif s := stats.get(isolation):
+            rows.append(
+                [
+                    isolation,
+                    format_ns(s.min_ns),
+                    format_ns(s.median_ns),
+                    format_ns(s.p95_ns),
+                    f"{parts / s.median_ns * 1e9:,.1f}",
+                ]
+            )
+    return _align([header, *rows], len(header))
+
+
+def format_language_table(
+    stats: dict[str, dict[Language, Stats]],
+    errors: dict[str, dict[Language, str]],
+    languages: list[Language],
+) -> str:
+    base, *others = languages
+    header = ["Day", *languages, *(f"{base}/{language}" for language in others)]
+    rows = []
+    for key in sorted(stats.keys() | errors.keys()):
+        day_stats = stats.get(key, {})
+        row = [key]
+        for language in languages:
+            if language in day_stats:
+                row.append(format_ns(day_stats[language].median_ns))
+            else:
+                row.append("error" if language in errors.get(key, {}) else "-")
+        for language in others:
+            if base in day_stats and language in day_stats:
+                ratio = day_stats[base].median_ns / day_stats[language].median_ns
+                row.append(f"{ratio:.3g}x")
+            else:
+                row.append("-")
+        rows.append(row)
+    return _align([header, *rows], len(header))
+
+
+def measure_import_time(runs: int, module: str = "advent") -> list[int]:
+    """Return how long importing `module` took in each of `runs` fresh interpreters, in µs.
+
+    Uses the cumulative time reported by `python -X importtime`, which leaves
+    out interpreter startup and `site`.
+    """
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        for line in result.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                samples.append(int(fields[1]))
+                break
+        else:
+            raise RuntimeError(f"No import time reported for {module}")
+    return samples
+
+
+def main_startup(runs: int, budget_ms: float) -> int:
+    samples = measure_import_time(runs)
+    median_ms = statistics.median(samples) / 1000
+    print(
+        f"import advent: min {min(samples) / 1000:.1f}ms,"
+        f" median {median_ms:.1f}ms over {runs} runs (budget {budget_ms:g}ms)"
+    )
+    if median_ms > budget_ms:
+        print("Over budget!")
+        return 1
+    return 0
+
+
+def main_sweep(
+    year: int | None,
+    day: int | None,
+    scales: list[int],
+    seed: int,
+    runs: int,
+    warmup: int,
+) -> int:
+    solutions = discover(year, day)
+    if not solutions:
+        print("No solutions found.")
+        return 1
+
+    growth, errors = sweep(solutions, scales, seed, runs, warmup)
+    print(format_growth_table(growth, errors, scales))
+    print(
+        "\nGrowth is the exponent k of time ~ n^k fitted to the median times,"
+        " where n is the scale of the input."
+    )
+    return 1 if errors else 0
+
+
+def main_languages(
+    year: int | None,
+    day: int | None,
+    languages: list[Language],
+    runs: int,
+    warmup: int,
+) -> int:
+    stats, errors, no_input = compare_languages(languages, year, day, runs, warmup)
+    names = ", ".join(languages)
+    if not stats and not errors:
+        if no_input:
+            print(f"No days solved in more than one of {names} have an input.txt.")
+        else:
+            print(f"No days are solved in more than one of {names}.")
+        return 1
+
+    from . import native
+
+    print(format_language_table(stats, errors, languages))
+    base = languages[0]
+    # What native times include besides solving.
+    startup = measure(native.run, native.Program(["true"], pathlib.Path()), runs, 1)
+    print(
+        f"\nTimes are medians. {base}/X is how many times faster X is than {base}."
+        "\nNative times are of running the program, which solves the parts its"
+        " main does,\nand include starting it (which takes"
+        f" {format_ns(int(statistics.median(startup)))} for `true`)."
+    )
+    if errors:
+        print("\nErrors:")
+        for key, by_language in sorted(errors.items()):
+            for language, error in by_language.items():
+                print(f"  {key} {language}: {error}")
+    if no_input:
+        print(f"\nSkipped {', '.join(no_input)}, which have no input.txt.")
+    return 1 if errors else 0
+
+
+def main_throughput(
+    year: int | None, day: int | None, jobs: int | None, runs: int
+) -> int:
+    solutions = discover(year, day)
+    if not solutions:
+        print("No solutions found.")
+        return 1
+
+    jobs = jobs or os.cpu_count() or 1
+    parts = sum(len(solution.parts) for solution in solutions)
+    stats, errors = throughput(solutions, jobs, runs)
+    print(format_throughput_table(stats, errors, parts))
+    workers = "worker" if jobs == 1 else "workers"
+    print(f"\nRan {parts} parts {runs} times in each mode with {jobs} {workers}.")
+    return 1 if errors else 0
+
+
+def main(
+    year: int | None,
+    day: int | None,
+    runs: int,
+    warmup: int,
+    output: pathlib.Path,
+    baseline_path: pathlib.Path | None,
+    threshold: float,
+) -> int:
+    solutions = discover(year, day)
+    if not solutions:
+        print("No solutions found.")
+        return 1
+
+    baseline = load(baseline_path) if baseline_path else None
+    stats, errors = bench(solutions, runs, warmup)
+    save(output, stats, runs, warmup)
+
+    print(format_table(stats, errors, baseline))
+    print(f"\nWrote results for {len(stats)} parts to {output}")
+
+    regressions = compare(baseline, stats, threshold) if baseline else []
+    if regressions:
+        print(f"\n{len(regressions)} regressions above {threshold:.0%}:")
+        for regression in regressions:
+            print(
+                f"  {regression.key}: {format_ns(regression.baseline_ns)}"
+                f" -> {format_ns(regression.current_ns)} ({regression.ratio:.2f}x)"
+            )
+    return 1 if errors or regressions else 0
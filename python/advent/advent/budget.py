@@ -0,0 +1,128 @@
+"""Time budgets for solutions, checked by their tests.
+
+Decorating a day's test case with
+
+    @budget(part1="50ms", part2="2s")
+    class TestDay(unittest.TestCase):
+        ...
+
+adds a `test_part1_budget` and a `test_part2_budget` test, which time the
+part on `self.input` and fail if its median time is over budget.
+
+Budgets are written for the machine they were set on, so they're scaled by
+how long this machine takes to run a fixed calibration workload, compared to
+how long that took on the reference machine. Set `ADVENT_BUDGET_FACTOR` to
+use a fixed factor instead (e.g. on a noisy CI runner).
+"""
+
+from collections.abc import Callable
+import functools
+import os
+import statistics
+import sys
+import time
+import unittest
+
+from .registry import PARTS, solver
+
+# How long `_calibration_workload` took on the reference machine.
+REFERENCE_NS = 39_000_000
+
+UNITS = {"ns": 1, "us": 1_000, "µs": 1_000, "ms": 1_000_000, "s": 1_000_000_000}
+
+
+def parse_duration(duration: str) -> int:
+    "Parse a duration like `50ms` or `2s` into nanoseconds."
+    # Check the longest units first, so "ms" isn't read as "s".
+    for unit in sorted(UNITS, key=len, reverse=True):
+        if duration.endswith(unit):
+            try:
+                return round(float(duration.removesuffix(unit)) * UNITS[unit])
+            except ValueError:
+                break
+    raise ValueError(f"Invalid duration {duration!r}, expected e.g. 50ms or 2s")
+
+
+def _calibration_workload() -> int:
+    # A mix of the things solutions spend their time on: loops, integer
+    # arithmetic, dict lookups and string building.
+    seen: dict[int, int] = {}
+    total = 0
+    for i in range(100_000):
+        key = (i * 7919) % 65_521
+        seen[key] = seen.get(key, 0) + 1
+        total += key & 0xFF
+    return total + len(",".join(map(str, seen)))
+
+
+@functools.cache
+def calibration_factor() -> float:
+    """How many times slower this machine is than the reference machine.
+
+    Measured once per process, as the median of a few runs of the
+    calibration workload, to match the median time a part is held to.
+    """
+    if factor := os.environ.get("ADVENT_BUDGET_FACTOR"):
+        return float(factor)
+    samples = []
+    for _ in range(5):
+        start = time.perf_counter_ns()
+        _calibration_workload()
+        samples.append(time.perf_counter_ns() - start)
+    return statistics.median(samples) / REFERENCE_NS
+
+
+def format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.3g}{unit}"
+    return f"{ns:.0f}ns"
+
+
+def _budget_test(part: str, limit_ns: int, runs: int) -> Callable:
+    def test(self: unittest.TestCase):
+        # Calibrate first, while the machine is in the same state it will
+        # time the part in.
+        factor = calibration_factor()
+        module = sys.modules[type(self).__module__]
+        func = solver(module, part, reuse_models=False)
+        input = self.input  # type: ignore[attr-defined]
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter_ns()
+            func(input)
+            samples.append(time.perf_counter_ns() - start)
+        median_ns = statistics.median(samples)
+
+        scaled_ns = limit_ns * factor
+        if median_ns > scaled_ns:
+            self.fail(
+                f"{part} took {format_ns(median_ns)} (median of {runs}), over its"
+                f" budget of {format_ns(limit_ns)} x {factor:.2f} for this machine"
+                f" = {format_ns(scaled_ns)}"
+            )
+
+    test.__name__ = f"test_{part}_budget"
+    test.__doc__ = f"{part} runs within {format_ns(limit_ns)} on the reference machine."
+    return test
+
+
+def budget(runs: int = 3, **limits: str) -> Callable[[type], type]:
+    """Add a test for each part's time budget to a `unittest.TestCase`.
+
+    The test case's `setUp` must set `self.input`, and its module must define
+    the parts.
+    """
+    for part in limits:
+        if part not in PARTS:
+            raise TypeError(f"Unknown part {part!r}, expected one of {PARTS}")
+    limits_ns = {part: parse_duration(limit) for part, limit in limits.items()}
+
+    def decorate(cls: type) -> type:
+        for part, limit_ns in limits_ns.items():
+            test = _budget_test(part, limit_ns, runs)
+            test.__qualname__ = f"{cls.__qualname__}.{test.__name__}"
+            setattr(cls, test.__name__, test)
+        return cls
+
+    return decorate
@@ -0,0 +1,90 @@
+from array import array
+from collections.abc import Iterator
+import mmap
+import os
+import pathlib
+
+
+class InputBuffer:
+    """Read-only, memory-mapped view of a puzzle input file.
+
+    `data` is a `memoryview` over the whole file, and lines are returned as
+    slices of it, so nothing is decoded or copied unless you ask for it (e.g.
+    with `bytes(line)` or `str(line, "ascii")`). The offsets of each line are
+    only computed the first time a line is looked up by index.
+
+    Slices must be released before the buffer is closed, otherwise `close`
+    raises `BufferError`.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self.data = memoryview(self._mmap)
+            else:
+                # Empty files can't be memory-mapped.
+                self._mmap = None
+                self.data = memoryview(b"")
+        self._offsets: array | None = None
+
+    @property
+    def line_offsets(self) -> array:
+        """Offset of the start of each line, followed by one past the end of the last line.
+
+        Line `i` spans `data[offsets[i]:offsets[i + 1] - 1]`.
+        """
+        if self._offsets is None:
+            data = self._mmap if self._mmap is not None else b""
+            offsets = array("Q", [0])
+            pos = data.find(b"\n")
+            while pos != -1:
+                offsets.append(pos + 1)
+                pos = data.find(b"\n", pos + 1)
+            if offsets[-1] != len(data):
+                # The last line has no trailing newline.
+                offsets.append(len(data) + 1)
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self.line_offsets) - 1
+
+    def __getitem__(self, i: int) -> memoryview:
+        "Return line `i`, without its newline."
+        offsets = self.line_offsets
+        if i < 0:
+            i += len(offsets) - 1
+        if not 0 <= i < len(offsets) - 1:
+            raise IndexError("line index out of range")
+        return self.data[offsets[i] : offsets[i + 1] - 1]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        offsets = self.line_offsets
+        data = self.data
+        for i in range(len(offsets) - 1):
+            yield data[offsets[i] : offsets[i + 1] - 1]
+
+    def records(self) -> Iterator[memoryview]:
+        "Yield each blank-line-separated record, without its trailing newline."
+        data = self._mmap if self._mmap is not None else b""
+        start = 0
+        while (end := data.find(b"\n\n", start)) != -1:
+            yield self.data[start:end]
+            start = end + 2
+        end = len(data)
+        if data[-1:] == b"\n":
+            end -= 1
+        if start < end:
+            yield self.data[start:end]
+
+    def close(self) -> None:
+        self.data.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> "InputBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
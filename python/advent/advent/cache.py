@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+
+
+def cache_dir() -> pathlib.Path:
+    """Return the directory `advent` uses for its persistent caches.
+
+    Defaults to `$XDG_CACHE_HOME/advent` (or `~/.cache/advent`), and can be
+    overridden with the `ADVENT_CACHE_DIR` environment variable.
+    """
+    if path := os.environ.get("ADVENT_CACHE_DIR"):
+        return pathlib.Path(path)
+    base = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(base) / "advent"
+
+
+def content_hash(data: bytes) -> str:
+    """Return the hex SHA-256 digest of `data`."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: pathlib.Path) -> str:
+    """Return the hex SHA-256 digest of the contents of the file at `path`."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def atomic_write(path: pathlib.Path, data: bytes) -> None:
+    """Write `data` to `path` so readers never see a partially written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class InputStore:
+    """Content-addressed store of puzzle inputs.
+
+    Inputs are stored once under `objects/` by the SHA-256 of their contents.
+    Each (year, day) has a small JSON entry pointing at the digest of its
+    input, which is verified on every read.
+    """
+
+    def __init__(self, root: pathlib.Path | None = None):
+        self.root = (root or cache_dir()) / "inputs"
+
+    def _entry_path(self, year: int, day: int) -> pathlib.Path:
+        return self.root / str(year) / f"{day:02d}.json"
+
+    def _object_path(self, digest: str) -> pathlib.Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def entry(self, year: int, day: int) -> dict | None:
+        """Return the metadata stored for (year, day), if any."""
+        try:
+            with open(self._entry_path(year, day)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def get(self, year: int, day: int) -> str | None:
+        """Return the stored input for (year, day), or None if it is missing or corrupt."""
+        if (entry := self.entry(year, day)) is None:
+            return None
+        try:
+            data = self._object_path(entry["sha256"]).read_bytes()
+        except (KeyError, FileNotFoundError):
+            return None
+        if content_hash(data) != entry["sha256"]:
+            return None
+        return data.decode()
+
+    def put(
+        self, year: int, day: int, puzzle_input: str, **validators: str | None
+    ) -> str:
+        """Store the input for (year, day) and return its digest.
+
+        Any HTTP cache validators (`etag`, `last_modified`) are stored alongside
+        it, so it can be revalidated with a conditional request later.
+        """
+        data = puzzle_input.encode()
+        digest = content_hash(data)
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            atomic_write(object_path, data)
+        entry = {"sha256": digest}
+        entry.update((k, v) for k, v in validators.items() if v is not None)
+        atomic_write(self._entry_path(year, day), json.dumps(entry).encode())
+        return digest
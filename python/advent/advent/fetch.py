@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import time
+
+from .cache import InputStore
+from .puzzle import Puzzle
+from . import website
+from .website import BASE_URL, HTTPClient, fetch_puzzle_input
+
+
+@dataclass
+class FetchResult:
+    "The outcome of fetching one day's puzzle input."
+    day: int
+    source: str = "network"
+    status: int | None = None
+    bytes: int = 0
+    seconds: float = 0.0
+    saved: bool = False
+    error: str | None = None
+
+
+def parse_days(spec: str) -> list[int]:
+    """Parse a list of days like `1-5,7,9-10`."""
+    days = set()
+    for part in spec.split(","):
+        first, _, last = part.partition("-")
+        days.update(range(int(first), int(last or first) + 1))
+    if not all(1 <= day <= 25 for day in days):
+        raise ValueError(f"Days must be between 1 and 25: {spec}")
+    return sorted(days)
+
+
+def fetch_day(
+    client: HTTPClient, store: InputStore, puzzle: Puzzle, refresh: bool
+) -> FetchResult:
+    result = FetchResult(puzzle.day)
+    try:
+        puzzle_input, transfer = fetch_puzzle_input(
+            puzzle.year, puzzle.day, refresh, client, store
+        )
+        if transfer is None:
+            result.source = "cache"
+        else:
+            result.status = transfer.status
+            result.seconds = transfer.seconds
+            result.bytes = transfer.bytes
+        # Only fill in inputs for puzzles that have been started.
+        if puzzle.inputs_dir.exists():
+            result.saved = puzzle.save_input(puzzle_input)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def format_table(results: list[FetchResult]) -> str:
+    header = ("Day", "Source", "Status", "Bytes", "Time", "Saved")
+    rows = []
+    for result in results:
+        if result.error:
+            rows.append((f"{result.day:02d}", f"error: {result.error}"))
+            continue
+        rows.append(
+            (
+                f"{result.day:02d}",
+                result.source,
+                str(result.status or ""),
+                str(result.bytes or ""),
+                f"{result.seconds * 1000:.0f}ms" if result.status else "",
+                "yes" if result.saved else "",
+            )
+        )
+
+    full_rows = [row for row in [header, *rows] if len(row) == len(header)]
+    widths = [max(len(row[i]) for row in full_rows) for i in range(len(header))]
+    lines = []
+    for row in [header, tuple("-" * w for w in widths), *rows]:
+        lines.append("  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
+    return "\n".join(lines)
+
+
+def main(
+    language: str,
+    year: int,
+    days: list[int],
+    jobs: int,
+    base_url: str | None,
+    rate: float,
+    refresh: bool,
+) -> int:
+    store = InputStore()
+    puzzles = [Puzzle(language, year, day) for day in days]
+    start = time.perf_counter()
+    with (
+        HTTPClient(base_url or BASE_URL, size=jobs, min_interval=1 / rate) as client,
+        ThreadPoolExecutor(max_workers=jobs) as executor,
+    ):
+        results = list(
+            executor.map(lambda p: fetch_day(client, store, p, refresh), puzzles)
+        )
+    elapsed = time.perf_counter() - start
+
+    print(format_table(results))
+    print(
+        f"\nFetched {len(results)} inputs in {elapsed:.2f}s,"
+        f" with {website.summary()}."
+    )
+    return 1 if any(result.error for result in results) else 0
@@ -0,0 +1,66 @@
+"""Synthetic puzzle inputs.
+
+A puzzle directory can have a `generate.py` next to its solutions that
+defines
+
+    def generate(scale: int, rng: random.Random) -> str
+
+returning an input of about `scale` times the size of a real one. Inputs
+only depend on the scale and the seed of `rng`, so they can be regenerated
+instead of checked in.
+"""
+
+from collections.abc import Callable
+import importlib.util
+import pathlib
+import random
+import sys
+
+from .puzzle import get_puzzles_path_for_language
+
+GENERATOR_FILENAME = "generate.py"
+
+Generator = Callable[[int, random.Random], str]
+
+
+def generator_path(year: int, day: int) -> pathlib.Path:
+    day_dir = get_puzzles_path_for_language("python") / str(year) / f"{day:02d}"
+    return day_dir / GENERATOR_FILENAME
+
+
+def load_generator(year: int, day: int) -> Generator:
+    "Import the `generate` function of a puzzle, reusing it if it was already imported."
+    name = f"_advent_{year}_{day:02d}_generate"
+    if name not in sys.modules:
+        path = generator_path(year, day)
+        if not path.exists():
+            raise RuntimeError(f"No input generator for {year} day {day}")
+        spec = importlib.util.spec_from_file_location(name, path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return sys.modules[name].generate
+
+
+def generate(year: int, day: int, scale: int = 1, seed: int = 0) -> str:
+    "Generate an input for a puzzle, the same one every time for the same arguments."
+    if scale < 1:
+        raise ValueError(f"Scale must be at least 1, not {scale}")
+    return load_generator(year, day)(scale, random.Random(seed))
+
+
+def main(
+    year: int, day: int, scale: int, seed: int, output: pathlib.Path | None
+) -> int:
+    input = generate(year, day, scale, seed)
+    if output is None:
+        sys.stdout.write(input)
+    else:
+        output.write_text(input)
+        print(f"Wrote {len(input)} bytes to {output}", file=sys.stderr)
+    return 0
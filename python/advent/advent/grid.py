@@ -0,0 +1,162 @@
+from collections.abc import Iterator
+
+# Flat index of a cell in a `Grid`.
+Index = int
+
+
+class Grid:
+    """A rectangular grid of small integers stored in a flat `bytearray`.
+
+    Cells are addressed by a flat index,
+
+        offset + row * row_stride + col * col_stride
+
+    so moving one step in any direction is a single addition, and the
+    `steps` are the offsets for moving up, right, down and left.
+
+    A grid can be surrounded by a one-cell `border` of a sentinel value. Every
+    in-bounds cell then has four neighbours in `data`, so searches can probe
+    `index + step` without a bounds check and stop when they find the
+    sentinel.
+
+    (0, 0) ------> (0, 9)
+      |              |
+      |              |
+      |              V
+    (9, 0) ------> (9, 9)
+    """
+
+    def __init__(
+        self,
+        data: bytearray,
+        rows: int,
+        cols: int,
+        row_stride: int,
+        col_stride: int = 1,
+        offset: int = 0,
+        border: int | None = None,
+    ):
+        self.data = data
+        self.rows = rows
+        self.cols = cols
+        self.row_stride = row_stride
+        self.col_stride = col_stride
+        self.offset = offset
+        self.border = border
+
+    @classmethod
+    def parse(
+        cls, text: str, border: int | str | None = None, digits: bool = False
+    ) -> "Grid":
+        """Parse a grid of characters, one row per line.
+
+        With `digits`, each cell holds the value of its digit rather than its
+        character code. If `border` is given, the grid is surrounded by cells
+        of that value.
+        """
+        lines = [line.encode() for line in text.splitlines() if line]
+        rows, cols = len(lines), len(lines[0])
+        if any(len(line) != cols for line in lines):
+            raise ValueError("Grid rows must all be the same length")
+        if digits:
+            lines = [bytes(c - 48 for c in line) for line in lines]
+        if isinstance(border, str):
+            border = ord(border)
+        if border is None:
+            return cls(bytearray(b"".join(lines)), rows, cols, cols)
+
+        stride = cols + 2
+        edge = bytes([border])
+        data = bytearray(edge * stride)
+        for line in lines:
+            data += edge + line + edge
+        data += edge * stride
+        return cls(data, rows, cols, stride, 1, stride + 1, border)
+
+    @property
+    def steps(self) -> tuple[int, int, int, int]:
+        "Offsets that move one cell up, right, down and left."
+        return (-self.row_stride, self.col_stride, self.row_stride, -self.col_stride)
+
+    def index(self, row: int, col: int) -> Index:
+        return self.offset + row * self.row_stride + col * self.col_stride
+
+    def point(self, index: Index) -> tuple[int, int]:
+        "Return the (row, col) of a flat index."
+        k = index - self.offset
+        if self.row_stride >= self.col_stride:
+            row, col = divmod(k, self.row_stride)
+            return row, col // self.col_stride
+        col, row = divmod(k, self.col_stride)
+        return row // self.row_stride, col
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def neighbors(self, index: Index) -> Iterator[Index]:
+        "Yield the in-bounds cells up, right, down and left of `index`."
+        row, col = self.point(index)
+        if row > 0:
+            yield index - self.row_stride
+        if col < self.cols - 1:
+            yield index + self.col_stride
+        if row < self.rows - 1:
+            yield index + self.row_stride
+        if col > 0:
+            yield index - self.col_stride
+
+    def indices(self) -> Iterator[Index]:
+        "Yield the index of every cell, row by row."
+        for row in range(self.rows):
+            start = self.index(row, 0)
+            stop = start + self.cols * self.col_stride
+            yield from range(start, stop, self.col_stride)
+
+    def find(self, value: int | str) -> Index:
+        "Return the index of the first cell holding `value`."
+        if isinstance(value, str):
+            value = ord(value)
+        for index in self.indices():
+            if self.data[index] == value:
+                return index
+        raise ValueError(f"{value!r} is not in the grid")
+
+    def transpose(self) -> "Grid":
+        "Return a view of the grid with rows and columns swapped, sharing its data."
+        return Grid(
+            self.data,
+            self.cols,
+            self.rows,
+            self.col_stride,
+            self.row_stride,
+            self.offset,
+            self.border,
+        )
+
+    def copy(self) -> "Grid":
+        return Grid(
+            bytearray(self.data),
+            self.rows,
+            self.cols,
+            self.row_stride,
+            self.col_stride,
+            self.offset,
+            self.border,
+        )
+
+    def row(self, row: int) -> bytes:
+        start = self.index(row, 0)
+        stop = start + self.cols * self.col_stride
+        return bytes(self.data[start : stop : self.col_stride])
+
+    def __getitem__(self, index: Index) -> int:
+        return self.data[index]
+
+    def __setitem__(self, index: Index, value: int) -> None:
+        self.data[index] = value
+
+    def __len__(self) -> int:
+        return self.rows * self.cols
+
+    def __str__(self) -> str:
+        return "\n".join(self.row(row).decode("latin-1") for row in range(self.rows))
@@ -0,0 +1,181 @@
+"""Counters, histograms and timers for the hot paths of solutions.
+
+Metrics are off unless `ADVENT_METRICS` is set (or `advent run --metrics`
+turns them on), and then recording one returns straight away:
+
+    from advent import metrics
+
+    metrics.count("states expanded")
+    metrics.observe("beams alive", len(beams))
+    with metrics.timer("parse"):
+        ...
+
+Inside a tight loop, even a call that returns straight away adds up, so
+either check `metrics.enabled` first, or tally into a local and record the
+total once after the loop.
+
+When metrics are turned on by the environment, whatever was recorded is
+reported to stderr when the process exits. `advent run --metrics` reports
+them for each part instead.
+"""
+
+import atexit
+from collections import defaultdict
+from collections.abc import Iterator
+import contextlib
+from dataclasses import dataclass, field
+import math
+import os
+import sys
+import time
+
+enabled = os.environ.get("ADVENT_METRICS", "") not in ("", "0")
+
+
+@dataclass
+class Histogram:
+    """A summary of observed values.
+
+    Values are tallied in power-of-two buckets, so percentiles are only
+    known to within a factor of two.
+    """
+
+    count: int = 0
+    total: float = 0
+    min: float = math.inf
+    max: float = -math.inf
+    # Number of values v with 2**(e-1) <= |v| < 2**e, by e.
+    buckets: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.buckets[math.frexp(value)[1]] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
+    def percentile(self, p: float) -> float:
+        "Return an upper bound on the `p`th percentile, or the max if that's smaller."
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for exponent in sorted(self.buckets):
+            seen += self.buckets[exponent]
+            if seen >= rank:
+                return min(math.ldexp(1, exponent), self.max)
+        return self.max
+
+
+@dataclass
+class Snapshot:
+    "The metrics recorded since the last reset."
+    counters: dict[str, int] = field(default_factory=dict)
+    histograms: dict[str, Histogram] = field(default_factory=dict)
+    # Durations in seconds.
+    timers: dict[str, Histogram] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.counters or self.histograms or self.timers)
+
+
+_current = Snapshot()
+
+
+def enable(on: bool = True) -> None:
+    global enabled
+    enabled = on
+
+
+def count(name: str, n: int = 1) -> None:
+    "Add `n` to a counter."
+    if not enabled:
+        return
+    _current.counters[name] = _current.counters.get(name, 0) + n
+
+
+def observe(name: str, value: float) -> None:
+    "Add a value to a histogram."
+    if not enabled:
+        return
+    if (histogram := _current.histograms.get(name)) is None:
+        histogram = _current.histograms[name] = Histogram()
+    histogram.add(value)
+
+
+@contextlib.contextmanager
+def _timer(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if (histogram := _current.timers.get(name)) is None:
+            histogram = _current.timers[name] = Histogram()
+        histogram.add(time.perf_counter() - start)
+
+
+_null_timer = contextlib.nullcontext()
+
+
+def timer(name: str) -> contextlib.AbstractContextManager:
+    "Time a block of code, adding its duration to a timer."
+    return _timer(name) if enabled else _null_timer
+
+
+def snapshot() -> Snapshot:
+    return _current
+
+
+def reset() -> Snapshot:
+    "Start recording afresh, returning what was recorded so far."
+    global _current
+    previous, _current = _current, Snapshot()
+    return previous
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g}{unit}"
+    return f"{seconds * 1e9:.0f}ns"
+
+
+def _format_number(value: float) -> str:
+    return f"{value:,}" if isinstance(value, int) else f"{value:,.4g}"
+
+
+def format_report(snapshot: Snapshot, indent: str = "") -> str:
+    rows = []
+    for name, value in sorted(snapshot.counters.items()):
+        rows.append((name, _format_number(value)))
+    for histograms, fmt in (
+        (snapshot.histograms, _format_number),
+        (snapshot.timers, _format_seconds),
+    ):
+        for name, h in sorted(histograms.items()):
+            summary = [f"n={h.count:,}"]
+            if histograms is snapshot.timers:
+                summary.append(f"total={fmt(h.total)}")
+            summary.extend(
+                [
+                    f"mean={fmt(h.mean)}",
+                    f"p50<={fmt(h.percentile(50))}",
+                    f"p95<={fmt(h.percentile(95))}",
+                    f"max={fmt(h.max)}",
+                ]
+            )
+            rows.append((name, "  ".join(summary)))
+
+    width = max((len(name) for name, _ in rows), default=0)
+    return "\n".join(f"{indent}{name.ljust(width)}  {value}" for name, value in rows)
+
+
+def _report_at_exit() -> None:
+    if _current:
+        print(f"Metrics:\n{format_report(_current, '  ')}", file=sys.stderr)
+
+
+if enabled:
+    atexit.register(_report_at_exit)
@@ -0,0 +1,122 @@
+"""Build and run the Rust and Go solutions, to time them against the Python ones.
+
+Solutions are built in a scratch directory, so building them doesn't touch the
+checkout. A Rust crate is copied there with the input in `src/input.txt`,
+since its `main` embeds it with `include_str!`. A Go module is built into a
+directory holding the input, and run there, since its `main` reads
+`input.txt`. Builds are offline, so a crate whose dependencies haven't been
+downloaded fails to build, like any other build error.
+"""
+
+from dataclasses import dataclass
+import os
+import pathlib
+import re
+import shutil
+import subprocess
+import tomllib
+
+from .puzzle import Language, PuzzleIndex, puzzle_index, repo_root
+
+# The file that makes a puzzle directory a solution in each language.
+_MANIFESTS = {Language.RUST: "Cargo.toml", Language.GO: "go.mod"}
+
+# Files a Rust solution embeds, like `include_str!("example.txt")`.
+_INCLUDE_STR = re.compile(r'include_str!\("([^"]+)"\)')
+
+
+@dataclass(frozen=True, order=True)
+class NativeSolution:
+    "A solution in a compiled language, for a specific puzzle."
+    language: Language
+    year: int
+    day: int
+    path: pathlib.Path
+
+
+@dataclass
+class Program:
+    "A built solution, and the directory to run it in."
+    argv: list[str]
+    cwd: pathlib.Path
+
+
+def discover(
+    language: Language, year: int | None = None, day: int | None = None
+) -> list[NativeSolution]:
+    "Find every solution in `language`, where the puzzle index says they are."
+    paths = PuzzleIndex.scan(repo_root()).paths | puzzle_index().paths
+    solutions = []
+    for (path_language, path_year, path_day), path in paths.items():
+        if path_language != language or not (path / _MANIFESTS[language]).exists():
+            continue
+        if year is not None and path_year != year:
+            continue
+        if day is not None and path_day != day:
+            continue
+        solutions.append(NativeSolution(language, path_year, path_day, path))
+    return sorted(solutions)
+
+
+def _check_call(
+    argv: list[str], cwd: pathlib.Path, env: dict[str, str] | None = None
+) -> None:
+    result = subprocess.run(
+        argv,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        # Compilers report the first error first and sum up at the end.
+        errors = [line for line in lines if line.startswith("error")]
+        message = (errors or lines or [f"exited with {result.returncode}"])[0]
+        if not message.startswith(f"{argv[0]}:"):
+            message = f"{argv[0]}: {message}"
+        raise RuntimeError(message)
+
+
+def _build_rust(solution: NativeSolution, input: str, workdir: pathlib.Path) -> Program:
+    crate = workdir / f"rust-{solution.year}-{solution.day:02d}"
+    shutil.copytree(
+        solution.path, crate, ignore=shutil.ignore_patterns("target", ".vscode")
+    )
+    src = crate / "src"
+    for name in set(_INCLUDE_STR.findall((src / "main.rs").read_text())):
+        # Examples are only used by the tests, which aren't built, but
+        # `include_str!` needs them to exist.
+        (src / name).touch()
+    (src / "input.txt").write_text(input)
+    _check_call(["cargo", "build", "--release", "--offline", "--quiet"], crate)
+    with open(crate / "Cargo.toml", "rb") as f:
+        name = tomllib.load(f)["package"]["name"]
+    return Program([str(crate / "target" / "release" / name)], crate)
+
+
+def _build_go(solution: NativeSolution, input: str, workdir: pathlib.Path) -> Program:
+    rundir = workdir / f"go-{solution.year}-{solution.day:02d}"
+    rundir.mkdir()
+    (rundir / "input.txt").write_text(input)
+    binary = rundir / "solution"
+    # Use the Go that's installed, and only modules that are already here.
+    env = os.environ | {"GOTOOLCHAIN": "local", "GOPROXY": "off", "GOWORK": "off"}
+    _check_call(["go", "build", "-o", str(binary), "."], solution.path, env)
+    return Program([str(binary)], rundir)
+
+
+def build(solution: NativeSolution, input: str, workdir: pathlib.Path) -> Program:
+    """Build `solution` in `workdir` to solve `input`, and return the program."""
+    match solution.language:
+        case Language.RUST:
+            return _build_rust(solution, input, workdir)
+        case Language.GO:
+            return _build_go(solution, input, workdir)
+    raise ValueError(f"Can't build {solution.language} solutions")
+
+
+def run(program: Program) -> None:
+    "Run a built solution, raising an error if it fails."
+    _check_call(program.argv, program.cwd)
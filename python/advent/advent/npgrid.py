@@ -0,0 +1,100 @@
+"""Whole-grid operations on NumPy arrays.
+
+This module needs the optional NumPy dependency:
+
+    pip install -e './advent[numpy]'
+"""
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "advent.npgrid requires NumPy; install it with `pip install -e './advent[numpy]'`"
+    ) from e
+
+
+def parse(text: str, digits: bool = False) -> np.ndarray:
+    """Parse a grid of characters, one row per line, into a 2D `uint8` array.
+
+    With `digits`, each cell holds the value of its digit rather than its
+    character code.
+    """
+    data = text.encode()
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    cols = data.index(b"\n")
+    try:
+        grid = np.frombuffer(data, np.uint8).reshape(-1, cols + 1)[:, :cols]
+    except ValueError:
+        raise ValueError("Grid rows must all be the same length") from None
+    return grid - ord("0") if digits else grid.copy()
+
+
+def mask(grid: np.ndarray, value: int | str) -> np.ndarray:
+    "Return a boolean array of the cells holding `value`."
+    return grid == (ord(value) if isinstance(value, str) else value)
+
+
+def uniform_lines(grid: np.ndarray, value: int | str, axis: int = 1) -> np.ndarray:
+    "Return the indices of the rows (or with `axis=0`, columns) only holding `value`."
+    return np.flatnonzero(mask(grid, value).all(axis=axis))
+
+
+def neighbor_min(grid: np.ndarray, fill: int | None = None) -> np.ndarray:
+    """Return the smallest of the up to four orthogonal neighbours of each cell.
+
+    Cells off the edge of the grid count as `fill`, which defaults to the
+    largest value of the grid's dtype.
+    """
+    if fill is None:
+        fill = np.iinfo(grid.dtype).max
+    padded = np.pad(grid, 1, constant_values=fill)
+    return np.minimum.reduce(
+        [padded[:-2, 1:-1], padded[2:, 1:-1], padded[1:-1, :-2], padded[1:-1, 2:]]
+    )
+
+
+def cummax_before(grid: np.ndarray, axis: int, reverse: bool = False) -> np.ndarray:
+    """Return the largest value strictly before each cell along `axis`.
+
+    With `reverse`, cells are scanned from the end of the axis instead. Cells
+    with nothing before them get -1.
+    """
+    grid = grid.astype(np.int16)
+    if reverse:
+        grid = np.flip(grid, axis)
+    shifted = np.full_like(grid, -1)
+    body = [slice(None)] * grid.ndim
+    body[axis] = slice(1, None)
+    head = [slice(None)] * grid.ndim
+    head[axis] = slice(None, -1)
+    shifted[tuple(body)] = np.maximum.accumulate(grid, axis=axis)[tuple(head)]
+    return np.flip(shifted, axis) if reverse else shifted
+
+
+def rotate(grid: np.ndarray, turns: int = 1) -> np.ndarray:
+    "Rotate the grid clockwise by `turns` quarter turns."
+    return np.rot90(grid, -turns)
+
+
+def view_distance(grid: np.ndarray, axis: int, reverse: bool = False) -> np.ndarray:
+    """Return how many cells each cell sees back along `axis`.
+
+    A cell sees up to and including the first cell at least as high as
+    itself, or else to the edge of the grid. With `reverse`, cells look
+    towards the end of the axis instead.
+    """
+    if reverse:
+        grid = np.flip(grid, axis)
+    grid = np.moveaxis(grid, axis, -1)
+    index = np.arange(grid.shape[-1])
+    distance = np.zeros(grid.shape, dtype=np.int64)
+    for height in np.unique(grid):
+        # The last cell at least this high before each cell, or the first cell.
+        blocking = np.maximum.accumulate(np.where(grid >= height, index, 0), axis=-1)
+        before = np.zeros_like(blocking)
+        before[..., 1:] = blocking[..., :-1]
+        cells = grid == height
+        distance[cells] = (index - before)[cells]
+    distance = np.moveaxis(distance, -1, axis)
+    return np.flip(distance, axis) if reverse else distance
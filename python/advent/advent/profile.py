@@ -0,0 +1,119 @@
+import cProfile
+import pathlib
+import pstats
+import sys
+import tracemalloc
+
+from .puzzle import get_puzzle_input
+from .runner import Solution, discover, load_part
+
+
+def find_solution(year: int, day: int, name: str | None = None) -> Solution:
+    """Return the solution for a day, preferring `dayNN.py` when there are several."""
+    solutions = discover(year, day)
+    if name is not None:
+        solutions = [solution for solution in solutions if solution.name == name]
+    if not solutions:
+        raise RuntimeError(f"No solution found for {year} day {day}")
+    preferred = f"day{day:02d}"
+    return next((s for s in solutions if s.name == preferred), solutions[0])
+
+
+def output_path(solution: Solution, part: str, suffix: str) -> pathlib.Path:
+    return solution.path.with_name(f"{solution.name}.{part}{suffix}")
+
+
+def profile_cpu(solution: Solution, part: str, top: int) -> pathlib.Path:
+    """Run a part under cProfile, save the stats and print the top functions."""
+    func = load_part(solution, part, reuse_models=False)
+    input = get_puzzle_input(solution.year, solution.day)
+
+    profiler = cProfile.Profile()
+    profiler.runcall(func, input)
+
+    path = output_path(solution, part, ".pstats")
+    profiler.dump_stats(path)
+    pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return path
+
+
+class _PeakSnapshotter:
+    """Profile hook that snapshots traced allocations whenever memory use peaks.
+
+    Snapshots are taken as functions in the solution return, while their
+    locals are still alive, so the report shows what was allocated at the
+    peak rather than what was left over at the end.
+    """
+
+    # Only take a new snapshot once memory use grows by this factor.
+    GROWTH = 1.1
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.size = 0
+        self.snapshot: tracemalloc.Snapshot | None = None
+
+    def __call__(self, frame, event, arg):
+        if event != "return" or frame.f_code.co_filename != self.filename:
+            return
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.size * self.GROWTH:
+            self.size = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+
+def profile_memory(solution: Solution, part: str, top: int) -> pathlib.Path:
+    """Run a part under tracemalloc and write a report of its top allocation sites."""
+    func = load_part(solution, part, reuse_models=False)
+    input = get_puzzle_input(solution.year, solution.day)
+
+    snapshotter = _PeakSnapshotter(str(solution.path))
+    tracemalloc.start()
+    sys.setprofile(snapshotter)
+    try:
+        func(input)
+    finally:
+        sys.setprofile(None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    lines = [
+        f"{solution.year} day {solution.day} {solution.name} {part}",
+        f"Peak traced memory: {peak / 1024:.1f} KiB",
+    ]
+    if snapshotter.snapshot is not None:
+        # Leave out allocations made by the profiling machinery itself.
+        snapshot = snapshotter.snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        lines.append(
+            f"Top {top} allocation sites at {snapshotter.size / 1024:.1f} KiB:"
+        )
+        for stat in snapshot.statistics("lineno")[:top]:
+            lines.append(f"  {stat}")
+    report = "\n".join(lines)
+
+    path = output_path(solution, part, ".alloc.txt")
+    path.write_text(report + "\n")
+    print(report)
+    return path
+
+
+def main(
+    year: int, day: int, part: int | None, mem: bool, top: int, name: str | None
+) -> int:
+    solution = find_solution(year, day, name)
+    parts = [f"part{part}"] if part else solution.parts
+    for part_name in parts:
+        if part_name not in solution.parts:
+            raise RuntimeError(f"{solution.path} has no {part_name}")
+        print(f"Profiling {solution.path} {part_name}")
+        path = profile_cpu(solution, part_name, top)
+        print(f"Wrote {path}")
+        if mem:
+            path = profile_memory(solution, part_name, top)
+            print(f"Wrote {path}")
+    return 0
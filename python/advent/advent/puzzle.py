@@ -1,14 +1,37 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import StrEnum, auto
+from functools import cache
+import json
+import os
 import pathlib
-import shutil
-import subprocess
+import re
 
-from .website import download_puzzle_input
+from .buffer import InputBuffer
+from .stream import DEFAULT_CHUNK_SIZE, read_lines, split_records
 
+# Solutions import this module (via `advent`) every time they run, so anything
+# only needed to create puzzles or download their inputs (subprocess, shutil,
+# hashing, HTTP, .env discovery) is imported where it is used instead.
+
+
+ROOT_ENV_VAR = "ADVENT_ROOT"
+MANIFEST_FILENAME = ".advent-index.json"
+
+
+def _find_repo_root() -> pathlib.Path:
+    if root := os.environ.get(ROOT_ENV_VAR):
+        return pathlib.Path(root).resolve()
+
+    # Walk up from this package (for editable installs) and from the working
+    # directory, looking for the top of the Git checkout.
+    for start in (pathlib.Path(__file__).resolve().parent, pathlib.Path.cwd()):
+        for path in (start, *start.parents):
+            if (path / ".git").exists():
+                return path
+
+    import subprocess
 
-def repo_root():
-    """Return the path to the root of the Git repository containing this file."""
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -22,14 +45,97 @@ def repo_root():
     return pathlib.Path(result.stdout.decode("utf-8").strip())
 
 
+@cache
+def repo_root() -> pathlib.Path:
+    """Return the path to the root of the Git repository containing this file.
+
+    The root is resolved once per process. Set `ADVENT_ROOT` to override it.
+    """
+    return _find_repo_root()
+
+
 def get_puzzles_path_for_language(language: str) -> pathlib.Path:
     """Return the path to the subdirectory of solutions to challenges written in `language`."""
     return repo_root() / language
 
 
+PuzzleKey = tuple[str, int, int]
+
+
+class PuzzleIndex:
+    """Map of (language, year, day) to puzzle directories.
+
+    The index is loaded once per process from an optional manifest at the repo
+    root (see `advent index`). Puzzles missing from the manifest fall back to
+    the standard directory layout.
+    """
+
+    def __init__(self, root: pathlib.Path, paths: dict[PuzzleKey, pathlib.Path]):
+        self.root = root
+        self.paths = paths
+
+    @property
+    def manifest_path(self) -> pathlib.Path:
+        return self.root / MANIFEST_FILENAME
+
+    @classmethod
+    def load(cls, root: pathlib.Path) -> "PuzzleIndex":
+        try:
+            with open(root / MANIFEST_FILENAME) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return cls(root, {})
+        paths = {
+            (entry["language"], entry["year"], entry["day"]): root / entry["path"]
+            for entry in manifest
+        }
+        return cls(root, paths)
+
+    @classmethod
+    def scan(cls, root: pathlib.Path) -> "PuzzleIndex":
+        """Build an index of every puzzle directory in the repo."""
+        paths = {}
+        for language in Language:
+            for year_dir in (root / language).glob("[0-9][0-9][0-9][0-9]"):
+                for day_dir in year_dir.iterdir():
+                    if match := re.fullmatch(r"(?:day-)?(\d\d)", day_dir.name):
+                        key = (str(language), int(year_dir.name), int(match[1]))
+                        paths[key] = day_dir
+        return cls(root, paths)
+
+    def save(self) -> None:
+        manifest = [
+            {
+                "language": language,
+                "year": year,
+                "day": day,
+                "path": str(path.relative_to(self.root)),
+            }
+            for (language, year, day), path in sorted(self.paths.items())
+        ]
+        with open(self.manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+            f.write("\n")
+
+    def get(self, language: str, year: int, day: int) -> pathlib.Path | None:
+        return self.paths.get((str(language), year, day))
+
+
+@cache
+def puzzle_index() -> PuzzleIndex:
+    """Return the process-wide puzzle path index."""
+    return PuzzleIndex.load(repo_root())
+
+
 class Language(StrEnum):
     PYTHON = auto()
     RUST = auto()
+    GO = auto()
+
+
+# Languages that `Puzzle.new` can scaffold a solution in. Go solutions are
+# only benchmarked.
+NEW_LANGUAGES = (Language.PYTHON, Language.RUST)
 
 
 @dataclass
@@ -42,6 +148,8 @@ class Puzzle:
     @property
     def path(self):
         "Path to the subdirectory containing the solution for a specific puzzle in a specific language."
+        if path := puzzle_index().get(self.language, self.year, self.day):
+            return path
         if self.language == Language.RUST:
             day = f"day-{self.day:02d}"
         else:
@@ -64,22 +172,44 @@ class Puzzle:
         with open(self.inputs_dir / filename) as f:
             return f.read()
 
+    def input_buffer(self, filename=INPUT_FILENAME) -> InputBuffer:
+        "Memory-map a file in the puzzle's inputs directory."
+        return InputBuffer(self.inputs_dir / filename)
+
+    def iter_input(
+        self,
+        filename=INPUT_FILENAME,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        records: bool = False,
+    ) -> Iterator[str]:
+        "Stream the lines (or blank-line-separated records) of a file in the puzzle's inputs directory."
+        lines = read_lines(self.inputs_dir / filename, chunk_size)
+        return split_records(lines) if records else lines
+
     def _setup_python(self):
+        from string import Template
+
+        from .gen import GENERATOR_FILENAME
+
         # Create puzzle directory.
         self.path.mkdir(parents=True)
 
-        # Copy template file, substituting the current year and day.
-        with open(get_puzzles_path_for_language("python") / "template.py") as f:
-            template = f.read()
-            template = template.replace("YEAR = 2023", f"YEAR = {self.year}")
-            template = template.replace("DAY = 1", f"DAY = {self.day}")
-            template = template.replace("TestDay", f"TestDay{self.day}")
-            solution_src = self.path / f"day{self.day:02d}.py"
-            with open(solution_src, "w") as f:
-                f.write(template)
-            solution_src.chmod(0o755)
+        # Fill in the templates for a solution and an input generator with the
+        # year and day.
+        templates_path = get_puzzles_path_for_language("python")
+        solution_src = self.path / f"day{self.day:02d}.py"
+        for template_name, path in (
+            ("template.py.tmpl", solution_src),
+            ("generate.py.tmpl", self.path / GENERATOR_FILENAME),
+        ):
+            template = Template((templates_path / template_name).read_text())
+            path.write_text(template.substitute(year=self.year, day=self.day))
+        solution_src.chmod(0o755)
 
     def _setup_rust(self):
+        import shutil
+        import subprocess
+
         # Create parent directory (`rust/<year>`).
         try:
             self.path.parent.mkdir(parents=True)
@@ -104,12 +234,32 @@ class Puzzle:
             self.path / "src" / "main.rs"
         )
 
-    def _download_puzzle_input(self):
-        puzzle_input = download_puzzle_input(self.year, self.day)
-        with open(self.inputs_dir / self.INPUT_FILENAME, "w") as f:
+    def save_input(self, puzzle_input: str) -> bool:
+        """Write the puzzle input to the inputs directory, unless it is already there.
+
+        Returns True if the file was written.
+        """
+        from .cache import content_hash, file_hash
+
+        path = self.inputs_dir / self.INPUT_FILENAME
+        if path.exists() and file_hash(path) == content_hash(puzzle_input.encode()):
+            return False
+        with open(path, "w") as f:
             f.write(puzzle_input)
+        return True
+
+    def _download_puzzle_input(self, refresh: bool = False) -> str:
+        from .website import download_puzzle_input
+
+        return download_puzzle_input(self.year, self.day, refresh=refresh)
+
+    def new(self, refresh: bool = False):
+        from concurrent.futures import ThreadPoolExecutor
+        import shutil
+
+        if self.language not in NEW_LANGUAGES:
+            raise RuntimeError(f"Unsupported language: {self.language}")
 
-    def new(self):
         puzzles_path = get_puzzles_path_for_language(self.language)
         if not puzzles_path.exists():
             response = input(f"Puzzles path {puzzles_path} does not exist, create it? (y/n) ")
@@ -122,19 +272,44 @@ class Puzzle:
             response = input(f"Puzzle directory {self.path} already exists, replace it? (y/n) ")
             if response.lower() == "y":
                 shutil.rmtree(self.path)
+            else:
+                return
 
-        if self.language == Language.PYTHON:
-            self._setup_python()
-        elif self.language == Language.RUST:
-            self._setup_rust()
-        else:
-            raise RuntimeError(f"Unsupported language: {self.language}")
+        # Download the input while the puzzle directory is set up, and save it
+        # there once both are done.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            download = executor.submit(self._download_puzzle_input, refresh)
+            if self.language == Language.PYTHON:
+                self._setup_python()
+            else:
+                self._setup_rust()
+            self.save_input(download.result())
 
-        self._download_puzzle_input()
-        
 
 def get_puzzle_input(year: int, day: int, filename=Puzzle.INPUT_FILENAME) -> str:
     """Helper function for Python solutions that gets the puzzle input for the given year and day."""
     puzzle = Puzzle(Language.PYTHON, year, day)
     return puzzle.input(filename)
 
+
+def get_puzzle_input_buffer(
+    year: int, day: int, filename=Puzzle.INPUT_FILENAME
+) -> InputBuffer:
+    """Like `get_puzzle_input`, but returns a read-only memory-mapped `InputBuffer`."""
+    puzzle = Puzzle(Language.PYTHON, year, day)
+    return puzzle.input_buffer(filename)
+
+
+def iter_puzzle_input(
+    year: int,
+    day: int,
+    filename=Puzzle.INPUT_FILENAME,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    records: bool = False,
+) -> Iterator[str]:
+    """Like `get_puzzle_input`, but yields the input a line at a time.
+
+    With `records=True`, yields blank-line-separated records instead.
+    """
+    puzzle = Puzzle(Language.PYTHON, year, day)
+    return puzzle.iter_input(filename, chunk_size, records)
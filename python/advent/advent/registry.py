@@ -0,0 +1,305 @@
+"""A registry of the functions that solve each part of a puzzle.
+
+Solution modules register each part with the `solution` decorator:
+
+    from advent.registry import solution
+
+    @solution(2023, 17, 1)
+    def part1(input: str) -> int:
+        ...
+
+A registered function takes the puzzle input as a string and returns the
+answer. Tools find registered parts with `scan`, which reads a module's
+source rather than importing it, so listing every solution doesn't run any
+of them. The function itself is looked up with `get` once its module has been
+imported.
+
+When both parts start by parsing the input the same way, a module can
+register the parser instead, and its parts then take the parsed model:
+
+    @parser(2022, 5)
+    def parse(input: str) -> tuple[Crates, Moves]:
+        ...
+
+    @solution(2022, 5, 1)
+    def part1(model: tuple[Crates, Moves]) -> str:
+        ...
+
+`solver` returns a function that solves a part from the input either way.
+By default each part parses the input itself, so a part that changes its
+model (like `Crates.rearrange`) can't change what the other part sees. Parts
+that only read their model can share it instead, with
+`@parser(2023, 10, mutable=False)`: then each input is parsed once and the
+model is kept for the other part.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+import pathlib
+from types import ModuleType
+from typing import TYPE_CHECKING, TypeVar
+import warnings
+
+# Every solution imports this module, but only tools scan source.
+if TYPE_CHECKING:
+    import ast
+
+PARTS = ("part1", "part2")
+# Registered in place of a part by a module's parser.
+PARSE = "parse"
+
+# How many parsed models to keep, most recently used first.
+MODEL_CACHE_SIZE = 4
+
+F = TypeVar("F", bound=Callable)
+
+
+@dataclass(frozen=True, order=True)
+class Registration:
+    "A part (or parser) registered by a solution module, as found by `scan`."
+    year: int
+    day: int
+    part: str
+    function: str
+
+
+# Registered functions, by module name and part.
+_registry: dict[tuple[str, str], Callable] = {}
+# Parsers whose models the parts only read, so can share.
+_read_only: set[Callable] = set()
+
+
+def solution(year: int, day: int, part: int) -> Callable[[F], F]:
+    "Register the decorated function as the solution to a part of a puzzle."
+    if f"part{part}" not in PARTS:
+        raise ValueError(f"Unknown part {part!r}, expected 1 or 2")
+
+    def register(func: F) -> F:
+        _registry[func.__module__, f"part{part}"] = func
+        return func
+
+    return register
+
+
+def parser(year: int, day: int, mutable: bool = True) -> Callable[[F], F]:
+    """Register the decorated function as the parser that a puzzle's parts share.
+
+    Unless `mutable` is False, each part parses the input itself, so it can
+    change its model without the other part seeing it. `mutable=False` is a
+    promise that isn't checked: the parts share one model, and must not change
+    it, so it's best returned frozen (as a tuple, say, rather than a list).
+    """
+
+    def register(func: F) -> F:
+        _registry[func.__module__, PARSE] = func
+        if mutable:
+            _read_only.discard(func)
+        else:
+            _read_only.add(func)
+        return func
+
+    return register
+
+
+def get(module: ModuleType, part: str) -> Callable:
+    "Return the function `module` registered for `part`."
+    try:
+        return _registry[module.__name__, part]
+    except KeyError:
+        raise RuntimeError(f"{module.__file__} doesn't register {part}") from None
+
+
+def get_parser(module: ModuleType) -> Callable | None:
+    "Return the parser `module` registered, if any."
+    return _registry.get((module.__name__, PARSE))
+
+
+def shares_model(parse: Callable) -> bool:
+    "Return True if the parts of `parse`'s puzzle only read the model, so can share it."
+    return parse in _read_only
+
+
+# Parsed read-only models, by parser and input.
+_models: OrderedDict[tuple[Callable, str], object] = OrderedDict()
+
+
+def parse_once(parse: Callable, input: str) -> object:
+    "Return what `parse` makes of `input`, parsing it only the first time."
+    key = (parse, input)
+    if key in _models:
+        _models.move_to_end(key)
+        return _models[key]
+    model = _models[key] = parse(input)
+    while len(_models) > MODEL_CACHE_SIZE:
+        _models.popitem(last=False)
+    return model
+
+
+def solver(
+    module: ModuleType, part: str, reuse_models: bool = True
+) -> Callable[[str], object]:
+    """Return a function that solves `part` from the puzzle input.
+
+    A read-only model is parsed once per input and shared between parts.
+    Any other model is parsed again for each call, which is cheaper than
+    copying it. Tools that time or profile parts pass `reuse_models=False`,
+    so every call parses the input, and what they measure includes parsing.
+    """
+    func = get(module, part)
+    if (parse := get_parser(module)) is None:
+        return func
+    if reuse_models and shares_model(parse):
+        return lambda input: func(parse_once(parse, input))
+    return lambda input: func(parse(input))
+
+
+# Calls a module may make while it's imported, since they only build values.
+_SAFE_CALLS = {
+    *("dict", "frozenset", "int", "list", "range", "set", "str", "tuple"),
+    *("namedtuple", "collections.namedtuple", "re.compile"),
+    *("find_spec", "importlib.util.find_spec"),
+}
+# Methods that only read the value they're called on, like `WORDS.split()`.
+_SAFE_METHODS = {"items", "keys", "values", "split", "splitlines"}
+
+
+def _callee(func: "ast.expr") -> str | None:
+    "Return the dotted name a call is made through, like `re.compile`."
+    import ast
+
+    match func:
+        case ast.Name(id=name):
+            return name
+        case ast.Attribute(value=value, attr=attr):
+            base = _callee(value)
+            return base and f"{base}.{attr}"
+    return None
+
+
+def _is_safe_value(node: "ast.AST") -> bool:
+    "Return True if evaluating `node` makes no calls but those known to be safe."
+    import ast
+
+    for call in ast.walk(node):
+        if not isinstance(call, ast.Call):
+            continue
+        if _callee(call.func) in _SAFE_CALLS:
+            continue
+        if isinstance(call.func, ast.Attribute) and call.func.attr in _SAFE_METHODS:
+            continue
+        return False
+    return True
+
+
+def _is_import_safe(tree: "ast.Module") -> bool:
+    """Return True if importing the module only defines things.
+
+    A module that does anything else at import time, like reading its input
+    and printing answers, would run when it's imported, so its registrations
+    are ignored (with a warning). That includes assigning the result of a
+    call, like `INPUT = get_puzzle_input(2023, 10)`, unless it only builds a
+    value, like `re.compile(...)`.
+    """
+    import ast
+
+    for node in tree.body:
+        match node:
+            case ast.Import() | ast.ImportFrom():
+                pass
+            case ast.FunctionDef() | ast.AsyncFunctionDef() | ast.ClassDef():
+                pass
+            case ast.Assign(value=value) | ast.AnnAssign(value=value):
+                if value is not None and not _is_safe_value(value):
+                    return False
+            case ast.TypeAlias():
+                pass
+            case ast.Expr(value=ast.Constant()):
+                pass  # Docstring
+            case ast.If(test=ast.Compare(left=ast.Name(id="__name__"))):
+                pass
+            case _:
+                return False
+    return True
+
+
+def _int_constants(tree: "ast.Module") -> dict[str, int]:
+    "Return the module-level names assigned int literals, like `YEAR = 2023`."
+    import ast
+
+    constants = {}
+    for node in tree.body:
+        match node:
+            case ast.Assign(
+                targets=[ast.Name(id=name)], value=ast.Constant(value=int() as value)
+            ):
+                constants[name] = value
+    return constants
+
+
+def scan_source(source: str, filename: str = "<unknown>") -> list[Registration]:
+    """Return the parts (and parser) a module's source registers, without running it.
+
+    Only registrations whose arguments are int literals, or module-level names
+    assigned them, can be found. A module that isn't safe to import registers
+    nothing, with a warning if it tries to.
+    """
+    import ast
+
+    tree = ast.parse(source, filename=filename)
+    safe = _is_import_safe(tree)
+    constants = _int_constants(tree)
+
+    def value(arg: "ast.expr") -> int | None:
+        match arg:
+            case ast.Constant(value=int() as value):
+                return value
+            case ast.Name(id=name):
+                return constants.get(name)
+        return None
+
+    registrations = []
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            match decorator:
+                case ast.Call(
+                    func=ast.Name(id="solution" | "parser")
+                    | ast.Attribute(attr="solution" | "parser")
+                ) if not safe:
+                    warnings.warn(
+                        f"{filename}: skipped, since importing it does more than"
+                        " define things"
+                    )
+                    return []
+                case ast.Call(
+                    func=ast.Name(id="solution") | ast.Attribute(attr="solution"),
+                    args=[_, _, _] as args,
+                ):
+                    year, day, part = (value(arg) for arg in args)
+                    if year is None or day is None or f"part{part}" not in PARTS:
+                        raise SyntaxError(
+                            f"{filename}:{decorator.lineno}: can't tell which part"
+                            f" {node.name} solves"
+                        )
+                    registrations.append(
+                        Registration(year, day, f"part{part}", node.name)
+                    )
+                case ast.Call(
+                    func=ast.Name(id="parser") | ast.Attribute(attr="parser"),
+                    args=[_, _] as args,
+                ):
+                    year, day = (value(arg) for arg in args)
+                    if year is None or day is None:
+                        raise SyntaxError(
+                            f"{filename}:{decorator.lineno}: can't tell which puzzle"
+                            f" {node.name} parses"
+                        )
+                    registrations.append(Registration(year, day, PARSE, node.name))
+    return sorted(registrations)
+
+
+def scan(path: pathlib.Path) -> list[Registration]:
+    "Return the parts registered by the module at `path`, without running it."
+    return scan_source(path.read_text(), str(path))
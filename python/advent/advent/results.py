@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+import functools
+import hashlib
+import json
+import os
+import pathlib
+
+from .cache import atomic_write, cache_dir
+
+DEFAULT_MAX_ENTRIES = 4096
+
+# The `advent` package, which every solution imports.
+_PACKAGE_DIR = pathlib.Path(__file__).parent
+
+
+def tree_digest(directory: pathlib.Path) -> bytes:
+    """Return a digest of every Python module under `directory`, and their paths."""
+    h = hashlib.sha256()
+    for path in sorted(directory.rglob("*.py")):
+        h.update(path.relative_to(directory).as_posix().encode() + b"\0")
+        h.update(hashlib.sha256(path.read_bytes()).digest())
+    return h.digest()
+
+
+@functools.cache
+def package_digest() -> bytes:
+    """Return a digest of the `advent` package, as imported by this process."""
+    return tree_digest(_PACKAGE_DIR)
+
+
+def solution_source(path: pathlib.Path) -> bytes:
+    """Return what an answer from the solution module at `path` depends on.
+
+    That's the module and the modules beside it (which it may import), and the
+    `advent` package. The module's name tells its answers from those of the
+    other modules beside it.
+    """
+    name = path.name.encode() + b"\0"
+    return name + package_digest() + tree_digest(path.parent)
+
+
+@dataclass
+class CachedResult:
+    answer: object
+    seconds: float
+
+
+class ResultCache:
+    """Persistent cache of answers, keyed by solution source and puzzle input.
+
+    An entry is only reused while neither the solution's source (see
+    `solution_source`) nor the input has changed. The cache holds at most
+    `max_entries` answers (or `$ADVENT_RESULT_CACHE_SIZE`), evicting the least
+    recently used first.
+    Only answers that round-trip through JSON are cached.
+    """
+
+    def __init__(self, root: pathlib.Path | None = None, max_entries: int | None = None):
+        self.root = (root or cache_dir()) / "results"
+        if max_entries is None:
+            max_entries = int(
+                os.environ.get("ADVENT_RESULT_CACHE_SIZE", DEFAULT_MAX_ENTRIES)
+            )
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(source: bytes, input: bytes, part: str) -> str:
+        h = hashlib.sha256()
+        for data in (source, input):
+            h.update(hashlib.sha256(data).digest())
+        h.update(part.encode())
+        return h.hexdigest()
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CachedResult | None:
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        # Entries are evicted by modification time, so touch them on use.
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted since it was read.
+            return None
+        return CachedResult(entry["answer"], entry["seconds"])
+
+    def put(self, key: str, answer: object, seconds: float) -> bool:
+        """Cache an answer, returning False if it can't be stored as JSON."""
+        try:
+            data = json.dumps({"answer": answer, "seconds": seconds})
+        except TypeError:
+            return False
+        if json.loads(data)["answer"] != answer:
+            return False
+        atomic_write(self._path(key), data.encode())
+        return True
+
+    def evict(self) -> int:
+        """Remove the least recently used entries beyond `max_entries`, returning how many."""
+        entries = list(self.root.glob("*/*.json"))
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return 0
+        entries.sort(key=lambda path: path.stat().st_mtime)
+        for path in entries[:excess]:
+            path.unlink(missing_ok=True)
+        return excess
@@ -0,0 +1,510 @@
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+import concurrent.futures
+from dataclasses import dataclass, field
+import importlib.util
+import os
+import pathlib
+import pickle
+import resource
+import sys
+import tempfile
+import threading
+import time
+from types import ModuleType
+
+from . import metrics, registry
+from .gen import GENERATOR_FILENAME
+from .metrics import Snapshot
+from .puzzle import get_puzzle_input, get_puzzles_path_for_language
+from .results import ResultCache, solution_source
+
+# How `run` keeps solutions apart. Threads share module globals and metrics,
+# so only suit solutions that keep their state local.
+ISOLATION_MODES = ("process", "subinterpreter", "thread")
+
+SIZE_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+@dataclass(frozen=True, order=True)
+class Solution:
+    """A Python solution module for a specific puzzle.
+
+    A module that can't be scanned has no parts, and the `error` scanning it
+    raised.
+    """
+    year: int
+    day: int
+    path: pathlib.Path
+    parts: tuple[str, ...]
+    error: str | None = field(default=None, compare=False)
+
+    @property
+    def name(self) -> str:
+        return self.path.stem
+
+
+@dataclass
+class MemoryUsage:
+    "How much memory running a part took, in bytes."
+    peak_rss: int
+    traced_peak: int
+
+
+@dataclass
+class Result:
+    "The outcome of running one part of a solution."
+    solution: Solution
+    part: str
+    answer: object = None
+    seconds: float = 0.0
+    error: str | None = None
+    cached: bool = False
+    metrics: Snapshot | None = None
+    memory: MemoryUsage | None = None
+
+
+def parse_size(size: str) -> int:
+    "Parse a size like `512M` or `2G` into bytes."
+    unit = size[-1:].upper()
+    if unit in SIZE_UNITS:
+        try:
+            return round(float(size[:-1]) * SIZE_UNITS[unit])
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid size {size!r}, expected e.g. 512M or 2G")
+
+
+def format_size(n: int) -> str:
+    for unit in ("G", "M", "K"):
+        if n >= SIZE_UNITS[unit]:
+            return f"{n / SIZE_UNITS[unit]:.1f} {unit}iB"
+    return f"{n} B"
+
+
+def _peak_rss() -> int:
+    "Return the most memory this process has had resident, in bytes."
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _limit_memory(limit: int) -> None:
+    "Make allocations beyond `limit` bytes of address space fail with MemoryError."
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def discover(year: int | None = None, day: int | None = None) -> list[Solution]:
+    """Find every solution module under `python/<year>/<day>/`.
+
+    Modules are scanned for the parts they register, without importing them.
+    A module that can't be scanned is returned with its error, and no parts.
+    """
+    solutions = []
+    root = get_puzzles_path_for_language("python")
+    for year_dir in root.glob("[0-9][0-9][0-9][0-9]"):
+        if year is not None and int(year_dir.name) != year:
+            continue
+        for day_dir in year_dir.glob("[0-9][0-9]"):
+            if day is not None and int(day_dir.name) != day:
+                continue
+            for path in day_dir.glob("*.py"):
+                if path.name.startswith("test_") or path.name == GENERATOR_FILENAME:
+                    continue
+                try:
+                    registrations = registry.scan(path)
+                except SyntaxError as e:
+                    solutions.append(
+                        Solution(
+                            int(year_dir.name),
+                            int(day_dir.name),
+                            path,
+                            (),
+                            error=f"{type(e).__name__}: {e}",
+                        )
+                    )
+                    continue
+                parts: dict[tuple[int, int], list[str]] = {}
+                for r in registrations:
+                    if r.part in registry.PARTS:
+                        parts.setdefault((r.year, r.day), []).append(r.part)
+                for (puzzle_year, puzzle_day), names in parts.items():
+                    solutions.append(
+                        Solution(puzzle_year, puzzle_day, path, tuple(names))
+                    )
+    return sorted(solutions)
+
+
+# Modification times of solution modules when they were imported, by name.
+_import_mtimes: dict[str, int] = {}
+# Parts of the same solution may be run by several threads at once.
+_import_lock = threading.RLock()
+
+
+def load_module(solution: Solution) -> ModuleType:
+    """Import a solution module by path, reusing it if it was already imported.
+
+    A module whose source changed since it was imported is imported again, so
+    long-lived processes (like the workers of `advent serve`) pick up edits.
+    """
+    name = f"_advent_{solution.year}_{solution.day:02d}_{solution.name}"
+    mtime = solution.path.stat().st_mtime_ns
+    with _import_lock:
+        if name in sys.modules and _import_mtimes.get(name) == mtime:
+            return sys.modules[name]
+        spec = importlib.util.spec_from_file_location(name, solution.path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+        _import_mtimes[name] = mtime
+        return module
+
+
+def load_part(solution: Solution, part: str, reuse_models: bool = True) -> Callable:
+    "Import a solution module and return a function that solves `part` from the input."
+    return registry.solver(load_module(solution), part, reuse_models)
+
+
+def run_part(
+    solution: Solution,
+    part: str,
+    use_cache: bool = True,
+    collect_metrics: bool = False,
+    input_path: pathlib.Path | None = None,
+    measure_memory: bool = False,
+    memory_limit: int | None = None,
+) -> Result:
+    """Run one part of a solution against its puzzle input, or `input_path`.
+
+    Unless `use_cache` is False, the answer is looked up in the result cache
+    first, and stored there after it's computed. With `collect_metrics`, the
+    part always runs, and the metrics it records are returned with it.
+
+    With `measure_memory`, the part always runs (under tracemalloc, which
+    slows it down, so its answer isn't cached), and the peak memory it traced
+    and the peak RSS of the process are returned with it. With `memory_limit`,
+    the part fails if the process's address space would grow past that many
+    bytes. Both are meant for a process that runs only this part, since the
+    peak RSS is the whole process's and the limit outlives the part.
+    """
+    result = Result(solution, part)
+    try:
+        if input_path is None:
+            input = get_puzzle_input(solution.year, solution.day)
+        else:
+            input = input_path.read_text()
+        if use_cache:
+            results = ResultCache()
+            key = results.key(solution_source(solution.path), input.encode(), part)
+            recompute = collect_metrics or measure_memory or memory_limit is not None
+            if not recompute and (hit := results.get(key)) is not None:
+                result.answer, result.seconds = hit.answer, hit.seconds
+                result.cached = True
+                return result
+        func = load_part(solution, part)
+        was_enabled = metrics.enabled
+        if collect_metrics:
+            metrics.enable()
+            metrics.reset()
+        if memory_limit is not None:
+            _limit_memory(memory_limit)
+        if measure_memory:
+            # Imported here because subinterpreters can't load it, and only
+            # processes measure memory.
+            import tracemalloc
+
+            tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            result.answer = func(input)
+            result.seconds = time.perf_counter() - start
+        finally:
+            if collect_metrics:
+                result.metrics = metrics.reset()
+                # Workers are reused, so leave metrics as they were.
+                metrics.enable(was_enabled)
+            if measure_memory:
+                _, traced_peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                result.memory = MemoryUsage(_peak_rss(), traced_peak)
+        if use_cache and not measure_memory:
+            results.put(key, result.answer, result.seconds)
+    except Exception as e:
+        if isinstance(e, MemoryError) and memory_limit is not None:
+            e = MemoryError(f"Over the limit of {format_size(memory_limit)}")
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+# The arguments of `run_part`.
+Task = tuple[Solution, str, bool, bool, pathlib.Path | None, bool, int | None]
+
+
+def make_tasks(
+    solutions: list[Solution],
+    use_cache: bool = True,
+    collect_metrics: bool = False,
+    input_path: pathlib.Path | None = None,
+    measure_memory: bool = False,
+    memory_limit: int | None = None,
+) -> list[Task]:
+    return [
+        (
+            solution,
+            part,
+            use_cache,
+            collect_metrics,
+            input_path,
+            measure_memory,
+            memory_limit,
+        )
+        for solution in solutions
+        for part in solution.parts
+    ]
+
+
+# Runs a pickled call in a subinterpreter, pickling its result to a file.
+_SUBINTERPRETER_CALL = """\
+import pickle
+func, args = pickle.loads(call)
+with open(result_path, "wb") as f:
+    pickle.dump(func(*args), f)
+"""
+
+
+class _SubinterpreterPoolExecutor(ThreadPoolExecutor):
+    """A pool of threads that each run calls in their own subinterpreter.
+
+    For Pythons without `concurrent.futures.InterpreterPoolExecutor` (added in
+    3.14). Each subinterpreter has its own GIL and its own copy of every
+    module, and calls and their results are pickled, as they are for a process
+    pool.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        try:
+            import _interpreters
+        except ImportError:
+            raise RuntimeError(
+                "Subinterpreter isolation needs Python 3.13 or later"
+            ) from None
+        super().__init__(max_workers)
+        self._api = _interpreters
+        self._local = threading.local()
+        self._created: list[int] = []
+
+    def _interpreter(self) -> int:
+        "Return this thread's subinterpreter, creating it on first use."
+        if (interp := getattr(self._local, "interp", None)) is None:
+            interp = self._local.interp = self._api.create()
+            self._created.append(interp)
+            # Import solutions from wherever this interpreter does.
+            path = os.pathsep.join(sys.path)
+            code = "import os, sys; sys.path[:] = path.split(os.pathsep)"
+            self._api.exec(interp, code, shared={"path": path})
+        return interp
+
+    def _call(self, call: bytes):
+        fd, result_path = tempfile.mkstemp(prefix="advent-")
+        os.close(fd)
+        try:
+            error = self._api.exec(
+                self._interpreter(),
+                _SUBINTERPRETER_CALL,
+                shared={"call": call, "result_path": result_path},
+            )
+            if error is not None:
+                raise RuntimeError(f"In subinterpreter: {error.formatted}")
+            with open(result_path, "rb") as f:
+                return pickle.load(f)
+        finally:
+            os.unlink(result_path)
+
+    def submit(self, fn, /, *args, **kwargs):
+        assert not kwargs
+        return super().submit(self._call, pickle.dumps((fn, args)))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        super().shutdown(wait, cancel_futures=cancel_futures)
+        while self._created:
+            self._api.destroy(self._created.pop())
+
+
+def _set_path(path: list[str]) -> None:
+    sys.path[:] = path
+
+
+def make_executor(
+    isolation: str, jobs: int | None = None, fresh_workers: bool = False
+) -> Executor:
+    """Return a pool of `jobs` workers that keep solutions apart as `isolation` says.
+
+    With `fresh_workers`, each task is run in a new process of its own.
+    """
+    if fresh_workers and isolation != "process":
+        raise ValueError(f"Only processes can be fresh for each task, not {isolation}s")
+    match isolation:
+        case "process":
+            if fresh_workers:
+                return ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1)
+            return ProcessPoolExecutor(max_workers=jobs)
+        case "subinterpreter":
+            if hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+                return concurrent.futures.InterpreterPoolExecutor(
+                    max_workers=jobs, initializer=_set_path, initargs=(sys.path,)
+                )
+            return _SubinterpreterPoolExecutor(max_workers=jobs)
+        case "thread":
+            return ThreadPoolExecutor(max_workers=jobs)
+    raise ValueError(f"Unknown isolation mode: {isolation}")
+
+
+def run(
+    tasks: list[Task], jobs: int | None = None, isolation: str = "process"
+) -> list[Result]:
+    """Run every task in a pool of workers, isolated from each other by `isolation`.
+
+    Tasks that measure or limit memory are each run in a process of their own.
+    """
+    if isolation == "thread" and any(task[3] for task in tasks):
+        raise ValueError("Threads share metrics, so can't collect them per part")
+    fresh_workers = any(task[5] or task[6] is not None for task in tasks)
+    if fresh_workers and isolation != "process":
+        raise ValueError("Memory can only be measured or limited per process")
+    results = []
+    with make_executor(isolation, jobs, fresh_workers) as executor:
+        futures = [executor.submit(run_part, *task) for task in tasks]
+        for future in as_completed(futures):
+            results.append(future.result())
+    results.sort(key=lambda result: (result.solution, result.part))
+    return results
+
+
+def format_table(results: list[Result]) -> str:
+    header = ("Year", "Day", "Solution", "Part", "Answer", "Time")
+    with_memory = any(result.memory for result in results)
+    if with_memory:
+        header += ("Peak RSS", "Traced peak")
+    rows = []
+    for result in results:
+        if result.error:
+            answer = f"error: {result.error}"
+        else:
+            answer = str(result.answer)
+        row = (
+            str(result.solution.year),
+            f"{result.solution.day:02d}",
+            result.solution.name,
+            result.part.removeprefix("part"),
+            answer,
+            f"{result.seconds:.3f}s" + (" (cached)" if result.cached else ""),
+        )
+        if with_memory:
+            if memory := result.memory:
+                row += (format_size(memory.peak_rss), format_size(memory.traced_peak))
+            else:
+                row += ("", "")
+        rows.append(row)
+
+    # Multi-line answers (e.g. text rendered on a CRT) continue on the lines
+    # below their row, so only the first line counts towards column widths.
+    def first_line(cell: str) -> str:
+        return cell.partition("\n")[0]
+
+    widths = [
+        max(len(first_line(row[i])) for row in [header, *rows])
+        for i in range(len(header))
+    ]
+    answer_column = header.index("Answer")
+    indent = " " * (sum(widths[:answer_column]) + 2 * answer_column)
+
+    def format_row(row):
+        line = "  ".join(first_line(cell).ljust(w) for cell, w in zip(row, widths))
+        lines = [line.rstrip()]
+        lines.extend(indent + extra for extra in row[answer_column].splitlines()[1:])
+        return "\n".join(lines)
+
+    lines = [format_row(header), format_row(tuple("-" * w for w in widths))]
+    lines.extend(format_row(row) for row in rows)
+    return "\n".join(lines)
+
+
+def format_metrics(results: list[Result]) -> str:
+    "Report the metrics each part recorded, if any."
+    sections = []
+    for result in results:
+        if result.metrics:
+            solution = result.solution
+            key = f"{solution.year}/{solution.day:02d}/{solution.name}/{result.part}"
+            sections.append(f"{key}\n{metrics.format_report(result.metrics, '  ')}")
+    return "\n\n".join(sections)
+
+
+def main(
+    year: int | None,
+    day: int | None,
+    jobs: int | None,
+    use_cache: bool = True,
+    collect_metrics: bool = False,
+    input_path: pathlib.Path | None = None,
+    via_server: bool = False,
+    isolation: str = "process",
+    measure_memory: bool = False,
+    memory_limit: int | None = None,
+) -> int:
+    if via_server and (measure_memory or memory_limit is not None):
+        # Its workers are reused, and would keep the limit.
+        raise ValueError("The server can't measure or limit memory per part")
+    solutions = discover(year, day)
+    if not solutions:
+        print("No solutions found.")
+        return 1
+
+    # Metrics turned on by the environment are reported per part too.
+    collect_metrics = collect_metrics or metrics.enabled
+    if input_path is not None:
+        # Workers, like the server's, may run in another directory.
+        input_path = input_path.resolve()
+    tasks = make_tasks(
+        solutions, use_cache, collect_metrics, input_path, measure_memory, memory_limit
+    )
+    # Modules that couldn't be scanned have nothing to run, but are reported.
+    unscanned = [
+        Result(solution, "", error=solution.error)
+        for solution in solutions
+        if solution.error is not None
+    ]
+    start = time.perf_counter()
+    if via_server:
+        from . import server
+
+        results = server.run_remote(tasks)
+        how = f"via the server at {server.socket_path()}"
+    else:
+        jobs = jobs or os.cpu_count()
+        results = run(tasks, jobs, isolation)
+        workers = {"process": "processes"}.get(isolation, f"{isolation}s")
+        how = f"with {jobs} {isolation if jobs == 1 else workers}"
+    elapsed = time.perf_counter() - start
+    if use_cache:
+        ResultCache().evict()
+
+    print(format_table(unscanned + results))
+    if collect_metrics and (report := format_metrics(results)):
+        print(f"\nMetrics:\n\n{report}")
+    cached = sum(result.cached for result in results)
+    print(f"\nRan {len(results)} parts ({cached} cached) in {elapsed:.2f}s {how}.")
+    return 1 if unscanned or any(result.error for result in results) else 0
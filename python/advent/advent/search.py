@@ -0,0 +1,137 @@
+"""Shortest paths over implicit graphs.
+
+States are plain ints, so callers pack whatever a state needs (a grid
+index, a heading, a step count...) into one number. That keeps the priority
+queues free of objects to allocate and compare. A graph is described by a
+`neighbors` function returning `(state, cost)` pairs, and an `is_goal`
+predicate. Each search returns the cost of the cheapest path from any of the
+start states to a goal, or None if no goal is reachable.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from math import inf
+
+State = int
+Neighbors = Callable[[State], Iterable[tuple[State, int]]]
+Goal = Callable[[State], bool]
+Heuristic = Callable[[State], int]
+
+
+@dataclass
+class SearchStats:
+    "How much work a search did."
+    pushed: int = 0
+    popped: int = 0
+    # States whose neighbours were visited.
+    expanded: int = 0
+
+
+def dijkstra(
+    starts: Iterable[State],
+    neighbors: Neighbors,
+    is_goal: Goal,
+    stats: SearchStats | None = None,
+) -> int | None:
+    return astar(starts, neighbors, is_goal, None, stats)
+
+
+def astar(
+    starts: Iterable[State],
+    neighbors: Neighbors,
+    is_goal: Goal,
+    heuristic: Heuristic | None,
+    stats: SearchStats | None = None,
+) -> int | None:
+    """A* search, which is Dijkstra's algorithm without a `heuristic`.
+
+    The heuristic must never overestimate the cost to reach a goal.
+    """
+    h = heuristic or (lambda state: 0)
+    best: dict[State, int] = {}
+    queue: list[tuple[int, int, State]] = []
+    for start in starts:
+        best[start] = 0
+        queue.append((h(start), 0, start))
+    queue.sort()
+    pushed = len(queue)
+    popped = expanded = 0
+
+    result = None
+    while queue:
+        _, cost, state = heappop(queue)
+        popped += 1
+        if cost > best[state]:
+            continue  # Already reached more cheaply.
+        if is_goal(state):
+            result = cost
+            break
+        expanded += 1
+        for next_state, step_cost in neighbors(state):
+            next_cost = cost + step_cost
+            if next_cost < best.get(next_state, inf):
+                best[next_state] = next_cost
+                heappush(queue, (next_cost + h(next_state), next_cost, next_state))
+                pushed += 1
+
+    if stats is not None:
+        stats.pushed += pushed
+        stats.popped += popped
+        stats.expanded += expanded
+    return result
+
+
+def dial(
+    starts: Iterable[State],
+    neighbors: Neighbors,
+    is_goal: Goal,
+    max_cost: int,
+    stats: SearchStats | None = None,
+) -> int | None:
+    """Dijkstra's algorithm with a bucket queue, for small integer step costs.
+
+    Every step must cost between 0 and `max_cost`, so only `max_cost + 1`
+    buckets are ever in use, and they're reused in a circle. Pushing and
+    popping are O(1) instead of O(log n). A step costing anything else
+    raises ValueError.
+    """
+    size = max_cost + 1
+    buckets: list[list[State]] = [[] for _ in range(size)]
+    best: dict[State, int] = {}
+    for start in starts:
+        best[start] = 0
+        buckets[0].append(start)
+    pending = pushed = len(buckets[0])
+    popped = expanded = 0
+
+    result = None
+    cost = 0
+    while pending and result is None:
+        bucket = buckets[cost % size]
+        while bucket:
+            state = bucket.pop()
+            pending -= 1
+            popped += 1
+            if best[state] != cost:
+                continue  # Already reached more cheaply.
+            if is_goal(state):
+                result = cost
+                break
+            expanded += 1
+            for next_state, step_cost in neighbors(state):
+                if not 0 <= step_cost <= max_cost:
+                    raise ValueError(f"step cost {step_cost} is outside 0..{max_cost}")
+                next_cost = cost + step_cost
+                if next_cost < best.get(next_state, inf):
+                    best[next_state] = next_cost
+                    buckets[next_cost % size].append(next_state)
+                    pending += 1
+                    pushed += 1
+        cost += 1
+
+    if stats is not None:
+        stats.pushed += pushed
+        stats.popped += popped
+        stats.expanded += expanded
+    return result
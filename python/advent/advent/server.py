@@ -0,0 +1,113 @@
+"""A server that keeps warm worker processes for running solutions.
+
+`advent serve` starts a pool of worker processes that have already imported
+`advent` and every solution, and listens on a Unix socket. `advent run
+--via-server` sends it the parts to run instead of starting its own pool, so
+a run doesn't pay for interpreter startup and imports. Workers import a
+solution again when its source changes, so edits show up on the next run.
+
+Requests and results are pickled, so the socket is only accessible to its
+owner.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.connection import Client, Connection, Listener
+import os
+import pathlib
+import signal
+import threading
+
+from .cache import cache_dir
+from .runner import Result, Task, discover, load_module, run_part
+
+SOCKET_FILENAME = "serve.sock"
+
+
+def socket_path() -> pathlib.Path:
+    "Return where the server listens, `$ADVENT_SOCKET` or a file in the cache."
+    if path := os.environ.get("ADVENT_SOCKET"):
+        return pathlib.Path(path)
+    return cache_dir() / SOCKET_FILENAME
+
+
+def _warm_up() -> None:
+    "Import every solution, so the first request doesn't have to."
+    # Ctrl-C is for the server, which shuts the workers down itself.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for solution in discover():
+        try:
+            load_module(solution)
+        except Exception:
+            pass  # It'll fail again, with a proper error, when it's run.
+
+
+def _ready(_: int) -> int:
+    return os.getpid()
+
+
+def _handle(conn: Connection, executor: ProcessPoolExecutor) -> None:
+    """Run the tasks of one request, sending back each result as it finishes.
+
+    A request is a list of `Task`s, and the response is a `Result` for each
+    task followed by None.
+    """
+    with conn:
+        try:
+            tasks: list[Task] = conn.recv()
+        except EOFError:
+            return
+        futures = [executor.submit(run_part, *task) for task in tasks]
+        for future in as_completed(futures):
+            conn.send(future.result())
+        conn.send(None)
+
+
+def serve(path: pathlib.Path, jobs: int | None) -> None:
+    """Listen on `path` until interrupted."""
+    jobs = jobs or os.cpu_count() or 1
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_warm_up) as executor:
+        # Start the workers now, rather than on the first request.
+        list(executor.map(_ready, range(jobs)))
+        old_umask = os.umask(0o177)
+        try:
+            listener = Listener(str(path), family="AF_UNIX")
+        finally:
+            os.umask(old_umask)
+        workers = "worker" if jobs == 1 else "workers"
+        print(f"Serving on {path} with {jobs} warm {workers}. Press Ctrl-C to stop.")
+        try:
+            with listener:
+                while True:
+                    conn = listener.accept()
+                    threading.Thread(
+                        target=_handle, args=(conn, executor), daemon=True
+                    ).start()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def run_remote(tasks: list[Task], path: pathlib.Path | None = None) -> list[Result]:
+    """Run tasks on the server listening on `path`, returning their results."""
+    path = path or socket_path()
+    try:
+        conn = Client(str(path), family="AF_UNIX")
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise RuntimeError(
+            f"No server is listening on {path}; start one with `advent serve`"
+        ) from None
+    results = []
+    with conn:
+        conn.send(tasks)
+        while (result := conn.recv()) is not None:
+            results.append(result)
+    results.sort(key=lambda result: (result.solution, result.part))
+    return results
+
+
+def main(path: pathlib.Path | None, jobs: int | None) -> int:
+    serve(path or socket_path(), jobs)
+    return 0
@@ -0,0 +1,42 @@
+from collections.abc import Iterable, Iterator
+import io
+import pathlib
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def read_lines(
+    path: pathlib.Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Yield each line of the file at `path`, without its newline.
+
+    The file is read `chunk_size` bytes at a time, so memory use doesn't grow
+    with the size of the file.
+    """
+    with open(path, buffering=chunk_size) as f:
+        for line in f:
+            yield line.removesuffix("\n")
+
+
+def split_records(lines: Iterable[str]) -> Iterator[str]:
+    """Group lines into blank-line-separated records, yielding each as a string."""
+    record: list[str] = []
+    for line in lines:
+        if line:
+            record.append(line)
+        elif record:
+            yield "\n".join(record)
+            record = []
+    if record:
+        yield "\n".join(record)
+
+
+def iter_lines(input: str | Iterable[str]) -> Iterator[str]:
+    """Iterate over the lines of `input`, which may be a string or an iterable of lines.
+
+    This lets solutions accept either a whole input (like the examples in
+    their tests) or a stream from `iter_puzzle_input`.
+    """
+    if isinstance(input, str):
+        return (line.removesuffix("\n") for line in io.StringIO(input))
+    return iter(input)
@@ -0,0 +1,205 @@
+"""Run a solution's parts again whenever they change.
+
+`advent watch` polls the solution module and its input, and when either
+changes it runs again only the parts that could have changed. A part is
+fingerprinted by its own code and by the code of every module-level name it
+uses, directly or through other functions, so editing `part2` (or a helper
+only `part2` uses) doesn't run `part1` again, and editing the tests doesn't
+run anything. The input is read once and kept until its file changes, and if
+the solution registers a parser whose parts only read its model, so is the
+parsed input, until the parser changes.
+"""
+
+import ast
+from collections.abc import Iterator
+import datetime
+import hashlib
+import pathlib
+import time
+import traceback
+
+from .profile import find_solution
+from . import registry
+from .puzzle import Language, Puzzle
+from .runner import Solution, load_module
+
+POLL_INTERVAL = 0.5
+
+
+def _defined_names(node: ast.stmt) -> list[str]:
+    "Return the module-level names a statement defines."
+    match node:
+        case ast.FunctionDef() | ast.AsyncFunctionDef() | ast.ClassDef():
+            return [node.name]
+        case ast.Assign() | ast.AnnAssign() | ast.AugAssign():
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            return [
+                name.id
+                for target in targets
+                for name in ast.walk(target)
+                if isinstance(name, ast.Name)
+            ]
+        case ast.TypeAlias():
+            return [node.name.id]
+        case ast.Import() | ast.ImportFrom():
+            return [
+                alias.asname or alias.name.partition(".")[0] for alias in node.names
+            ]
+    return []
+
+
+def _used_names(node: ast.AST) -> Iterator[str]:
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            yield child.id
+
+
+def fingerprint_parts(source: str) -> dict[str, str]:
+    """Return a fingerprint of each part's code and the code it depends on.
+
+    Fingerprints are taken from the syntax tree, so they don't change with
+    comments or formatting.
+    """
+    tree = ast.parse(source)
+    functions = {r.part: r.function for r in registry.scan_source(source)}
+    definitions: dict[str, list[ast.stmt]] = {}
+    for node in tree.body:
+        for name in _defined_names(node):
+            definitions.setdefault(name, []).append(node)
+
+    fingerprints = {}
+    for part, function in functions.items():
+        # Everything the part can reach, in source order.
+        seen: set[str] = set()
+        pending = [function]
+        while pending:
+            name = pending.pop()
+            if name in seen or name not in definitions:
+                continue
+            seen.add(name)
+            for node in definitions[name]:
+                pending.extend(_used_names(node))
+        reachable = {id(node) for name in seen for node in definitions[name]}
+        digest = hashlib.sha256()
+        for node in tree.body:
+            if id(node) in reachable:
+                digest.update(ast.dump(node).encode())
+        fingerprints[part] = digest.hexdigest()
+    return fingerprints
+
+
+def _mtime(path: pathlib.Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _log(message: str) -> None:
+    print(f"[{datetime.datetime.now():%H:%M:%S}] {message}", flush=True)
+
+
+def _report(part: str, answer: object, seconds: float) -> None:
+    if "\n" in (text := str(answer)):
+        text = "\n" + text
+    _log(f"{part} = {text} ({seconds:.3f}s)")
+
+
+def watch(
+    solution: Solution,
+    input_path: pathlib.Path | None = None,
+    interval: float = POLL_INTERVAL,
+) -> None:
+    """Run the solution's parts as they change, until interrupted."""
+    if input_path is None:
+        puzzle = Puzzle(Language.PYTHON, solution.year, solution.day)
+        input_path = puzzle.inputs_dir / Puzzle.INPUT_FILENAME
+    source_mtime = input_mtime = None
+    # Fingerprints of the parts as they were last run successfully.
+    fingerprints: dict[str, str] = {}
+    input = None
+    # The input as parsed by the solution's parser, if it registers one, and
+    # the fingerprint of the parser that parsed it.
+    model = parsed_by = None
+
+    print(
+        f"Watching {solution.path.name} and {input_path.name} every {interval}s."
+        " Press Ctrl-C to stop.",
+        flush=True,
+    )
+    while True:
+        changed = []
+        if (mtime := _mtime(input_path)) != input_mtime:
+            input_mtime = mtime
+            model = parsed_by = None
+            if mtime is None:
+                input = None
+                _log(f"Waiting for {input_path}")
+            else:
+                input = input_path.read_text()
+                changed.append(input_path.name)
+                fingerprints.clear()  # Every part needs running again.
+        if (mtime := _mtime(solution.path)) != source_mtime:
+            source_mtime = mtime
+            changed.append(solution.path.name)
+
+        if changed and input is not None and source_mtime is not None:
+            try:
+                current = fingerprint_parts(solution.path.read_text())
+            except SyntaxError as e:
+                # Keep what was run before, for when it's fixed.
+                _log(f"{solution.path.name}: {e}")
+                time.sleep(interval)
+                continue
+            parser = current.pop(registry.PARSE, None)
+            if parser != parsed_by:
+                # The parts are given a new model, so they all run again.
+                model = parsed_by = None
+                fingerprints.clear()
+            stale = [p for p, fp in current.items() if fingerprints.get(p) != fp]
+            if stale:
+                unchanged = sorted(set(current) - set(stale))
+                note = f" ({', '.join(unchanged)} unchanged)" if unchanged else ""
+                _log(f"{' and '.join(changed)} changed{note}")
+            for part in stale:
+                try:
+                    module = load_module(solution)
+                    parse = registry.get_parser(module)
+                    shared = parse is not None and registry.shares_model(parse)
+                    if shared and parsed_by is None:
+                        start = time.perf_counter()
+                        model = parse(input)
+                        parsed_by = parser
+                        seconds = time.perf_counter() - start
+                        _log(f"Parsed {input_path.name} ({seconds:.3f}s)")
+                    func = registry.get(module, part)
+                    start = time.perf_counter()
+                    if shared:
+                        answer = func(model)
+                    else:
+                        # A part that may change its model parses its own.
+                        answer = func(parse(input) if parse else input)
+                    seconds = time.perf_counter() - start
+                except Exception:
+                    _log(f"{part} failed:")
+                    traceback.print_exc()
+                    fingerprints.pop(part, None)
+                    continue
+                _report(part, answer, seconds)
+                fingerprints[part] = current[part]
+
+        time.sleep(interval)
+
+
+def main(
+    year: int,
+    day: int,
+    name: str | None,
+    input_path: pathlib.Path | None,
+    interval: float,
+) -> int:
+    try:
+        watch(find_solution(year, day, name), input_path, interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
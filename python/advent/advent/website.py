@@ -1,20 +1,36 @@
-import os
-import urllib.error
-import urllib.request
+from dataclasses import dataclass
 from functools import cache
+import http.client
+import os
+import queue
+import threading
+import time
+import urllib.parse
+
+from . import metrics
+from .cache import InputStore
 
-import dotenv
+BASE_URL = os.environ.get("ADVENT_BASE_URL", "https://adventofcode.com")
+INPUT_PATH = "/{}/day/{}/input"
 
 
-dotenv_path = dotenv.find_dotenv(usecwd=True)
-dotenv.load_dotenv(dotenv_path)
+@cache
+def session_headers() -> dict[str, str]:
+    """Return the headers that authenticate requests to the Advent of Code website.
+
+    The session ID is read from the `SESSION_ID` environment variable, which
+    may be set in a `.env` file. Finding and loading the `.env` file is put
+    off until the first request that needs it.
+    """
+    import dotenv
 
-URL = "https://adventofcode.com/{}/day/{}/input"
-SESSION_ID = os.environ.get("SESSION_ID", "")
-HEADERS = {
-    "User-Agent": "Python",
-    "Cookie": f"session={SESSION_ID}",
-}
+    dotenv_path = dotenv.find_dotenv(usecwd=True)
+    dotenv.load_dotenv(dotenv_path)
+    session_id = os.environ.get("SESSION_ID", "")
+    return {
+        "User-Agent": "Python",
+        "Cookie": f"session={session_id}",
+    }
 
 
 class PuzzleNotFoundError(Exception):
@@ -25,8 +41,20 @@ class InvalidSessionIDError(Exception):
     """Exception raised when an invalid session ID is provided."""
 
 
-def handle_error(error: urllib.error.HTTPError) -> None:
-    match error.code:
+class DownloadError(Exception):
+    """Exception raised when the website returns any other unsuccessful response."""
+
+
+@dataclass
+class Response:
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+    seconds: float
+
+
+def handle_error(response: Response) -> None:
+    match response.status:
         case 404:
             raise PuzzleNotFoundError(
                 "Puzzle input for the given year and day not found."
@@ -34,15 +62,203 @@ def handle_error(error: urllib.error.HTTPError) -> None:
         case 400:
             raise InvalidSessionIDError("Session ID has expired or is invalid.")
         case _:
+            raise DownloadError(f"Unexpected response: HTTP {response.status}")
+
+
+class HTTPClient:
+    """A small pool of persistent HTTP(S) connections to one site.
+
+    Connections are kept alive and reused between requests, so only the first
+    request on each pays for a TCP and TLS handshake. The client is safe to
+    share between threads: up to `size` requests run at once, and request
+    starts are spaced at least `min_interval` seconds apart. Connection errors
+    and 5xx/429 responses are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        size: int = 1,
+        timeout: float = 30,
+        min_interval: float = 0,
+        retries: int = 3,
+        backoff: float = 0.5,
+    ):
+        url = urllib.parse.urlsplit(base_url)
+        if url.scheme == "https":
+            self._connection_class = http.client.HTTPSConnection
+        elif url.scheme == "http":
+            self._connection_class = http.client.HTTPConnection
+        else:
+            raise ValueError(f"Unsupported URL: {base_url}")
+        self.host = url.netloc
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.retries = retries
+        self.backoff = backoff
+
+        # Connections are opened lazily, up to `size` of them.
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(None)
+        self._rate_lock = threading.Lock()
+        self._next_start = 0.0
+
+    def _wait_turn(self) -> None:
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def _request(self, path: str, headers: dict[str, str]) -> Response:
+        conn = self._idle.get()
+        if conn is None:
+            conn = self._connection_class(self.host, timeout=self.timeout)
+        try:
+            start = time.perf_counter()
+            conn.request("GET", self.prefix + path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            seconds = time.perf_counter() - start
+        except BaseException:
+            conn.close()
             raise
+        finally:
+            self._idle.put(conn)
+        return Response(response.status, response.headers, body, seconds)
+
+    def get(self, path: str, headers: dict[str, str]) -> Response:
+        attempt = 0
+        while True:
+            self._wait_turn()
+            try:
+                response = self._request(path, headers)
+                transient = response.status >= 500 or response.status == 429
+                if not transient or attempt >= self.retries:
+                    return response
+            except (OSError, http.client.HTTPException):
+                if attempt >= self.retries:
+                    raise
+            time.sleep(self.backoff * 2**attempt)
+            attempt += 1
+
+    def close(self) -> None:
+        while not self._idle.empty():
+            if (conn := self._idle.get_nowait()) is not None:
+                conn.close()
+
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 @cache
-def download_puzzle_input(year: int, day: int) -> str:
-    req = urllib.request.Request(URL.format(year, day), headers=HEADERS)
-    try:
-        response = urllib.request.urlopen(req)
-    except urllib.error.HTTPError as err:
-        handle_error(err)
-    data = response.read().decode()
+def default_client() -> HTTPClient:
+    return HTTPClient()
+
+
+@dataclass
+class Transfer:
+    "Timing and size of one request for a puzzle input."
+    year: int
+    day: int
+    status: int
+    bytes: int
+    seconds: float
+
+    def __str__(self):
+        outcome = "not modified" if self.status == 304 else f"HTTP {self.status}"
+        return (
+            f"{self.year} day {self.day}: {outcome},"
+            f" {self.bytes} bytes in {self.seconds * 1000:.0f}ms"
+        )
+
+
+# Every transfer made by this process, oldest first.
+transfers: list[Transfer] = []
+# Inputs are fetched from several threads at once.
+_transfers_lock = threading.Lock()
+
+
+def _record(transfer: Transfer) -> None:
+    with _transfers_lock:
+        transfers.append(transfer)
+        metrics.count("input transfers")
+        metrics.count("input bytes transferred", transfer.bytes)
+        if transfer.status == 304:
+            metrics.count("inputs not modified")
+
+
+def summary(each: bool = False) -> str:
+    """Sum up the transfers made by this process, after listing them with `each`."""
+    total = f"{len(transfers)} transfer{'' if len(transfers) == 1 else 's'}"
+    if not_modified := sum(transfer.status == 304 for transfer in transfers):
+        total += f" ({not_modified} not modified)"
+    total += f", {sum(transfer.bytes for transfer in transfers)} bytes"
+    lines = [str(transfer) for transfer in transfers] if each else []
+    return "\n".join([*lines, total])
+
+
+def fetch_puzzle_input(
+    year: int,
+    day: int,
+    refresh: bool = False,
+    client: HTTPClient | None = None,
+    store: InputStore | None = None,
+) -> tuple[str, Transfer | None]:
+    """Get the puzzle input for the given year and day, and how it was transferred.
+
+    Inputs are read from the persistent input store when possible. With
+    `refresh`, a stored input is revalidated with a conditional request, which
+    only transfers the input again if it changed. The transfer is None if the
+    input came straight from the store.
+    """
+    store = store or InputStore()
+    cached = store.get(year, day)
+    if cached is not None and not refresh:
+        return cached, None
+
+    headers = dict(session_headers())
+    if cached is not None and (entry := store.entry(year, day)):
+        if etag := entry.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := entry.get("last_modified"):
+            headers["If-Modified-Since"] = last_modified
+
+    client = client or default_client()
+    response = client.get(INPUT_PATH.format(year, day), headers)
+    transfer = Transfer(year, day, response.status, len(response.body), response.seconds)
+    _record(transfer)
+
+    if response.status == 304 and cached is not None:
+        return cached, transfer
+    if response.status != 200:
+        handle_error(response)
+
+    data = response.body.decode()
+    store.put(
+        year,
+        day,
+        data,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    return data, transfer
+
+
+def download_puzzle_input(
+    year: int, day: int, refresh: bool = False, client: HTTPClient | None = None
+) -> str:
+    """Get the puzzle input for the given year and day.
+
+    Inputs are read from the persistent input store when possible, and only
+    downloaded (and stored) if they are missing, or if `refresh` is True and
+    they changed.
+    """
+    data, _ = fetch_puzzle_input(year, day, refresh, client)
     return data
@@ -0,0 +1,62 @@
+import pathlib
+import tempfile
+import unittest
+
+from advent.buffer import InputBuffer
+
+
+class TestInputBuffer(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = pathlib.Path(tmp.name) / "input.txt"
+
+    def buffer(self, data: bytes) -> InputBuffer:
+        self.path.write_bytes(data)
+        buffer = InputBuffer(self.path)
+        self.addCleanup(buffer.close)
+        return buffer
+
+    def test_lines(self):
+        buffer = self.buffer(b"ab\n\ncd\n")
+        self.assertEqual([bytes(line) for line in buffer], [b"ab", b"", b"cd"])
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(bytes(buffer[2]), b"cd")
+        self.assertEqual(bytes(buffer[-3]), b"ab")
+        self.assertEqual(list(buffer.line_offsets), [0, 3, 4, 7])
+
+    def test_no_trailing_newline(self):
+        buffer = self.buffer(b"ab\ncd")
+        self.assertEqual([bytes(line) for line in buffer], [b"ab", b"cd"])
+        self.assertEqual(bytes(buffer[-1]), b"cd")
+
+    def test_out_of_range(self):
+        buffer = self.buffer(b"ab\n")
+        with self.assertRaises(IndexError):
+            buffer[1]
+        with self.assertRaises(IndexError):
+            buffer[-2]
+
+    def test_empty(self):
+        buffer = self.buffer(b"")
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(list(buffer), [])
+        self.assertEqual(list(buffer.records()), [])
+
+    def test_records(self):
+        buffer = self.buffer(b"a\nb\n\nc\n")
+        self.assertEqual([bytes(r) for r in buffer.records()], [b"a\nb", b"c"])
+        buffer = self.buffer(b"a\n\nb")
+        self.assertEqual([bytes(r) for r in buffer.records()], [b"a", b"b"])
+
+    def test_close_with_slices(self):
+        self.path.write_bytes(b"ab\n")
+        with InputBuffer(self.path) as buffer:
+            line = buffer[0]
+            with self.assertRaises(BufferError):
+                buffer.close()
+            line.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
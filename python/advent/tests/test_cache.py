@@ -0,0 +1,76 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from advent.cache import InputStore, atomic_write, cache_dir, content_hash, file_hash
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = pathlib.Path(tmp.name)
+
+    def test_cache_dir(self):
+        with mock.patch.dict(os.environ, {"ADVENT_CACHE_DIR": "/tmp/a"}):
+            self.assertEqual(cache_dir(), pathlib.Path("/tmp/a"))
+        env = {"ADVENT_CACHE_DIR": "", "XDG_CACHE_HOME": "/tmp/xdg"}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(cache_dir(), pathlib.Path("/tmp/xdg/advent"))
+
+    def test_hashes(self):
+        path = self.root / "input.txt"
+        path.write_bytes(b"1\n2\n")
+        self.assertEqual(file_hash(path), content_hash(b"1\n2\n"))
+        self.assertNotEqual(file_hash(path), content_hash(b"1\n2"))
+
+    def test_atomic_write(self):
+        path = self.root / "a" / "b.json"
+        atomic_write(path, b"{}")
+        atomic_write(path, b"[]")
+        self.assertEqual(path.read_bytes(), b"[]")
+        # No temporary files are left behind.
+        self.assertEqual(list(path.parent.iterdir()), [path])
+
+
+class TestInputStore(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = InputStore(pathlib.Path(tmp.name))
+
+    def test_put_and_get(self):
+        self.assertIsNone(self.store.get(2023, 1))
+        digest = self.store.put(2023, 1, "1\n2\n", etag='"abc"', last_modified=None)
+        self.assertEqual(digest, content_hash(b"1\n2\n"))
+        self.assertEqual(self.store.get(2023, 1), "1\n2\n")
+        self.assertEqual(self.store.entry(2023, 1), {"sha256": digest, "etag": '"abc"'})
+        self.assertIsNone(self.store.get(2023, 2))
+
+    def test_same_input_stored_once(self):
+        self.store.put(2022, 1, "same")
+        self.store.put(2023, 1, "same")
+        objects = list((self.store.root / "objects").glob("*/*"))
+        self.assertEqual(len(objects), 1)
+
+    def test_corrupt_input(self):
+        digest = self.store.put(2023, 1, "1\n2\n")
+        self.store._object_path(digest).write_text("3\n")
+        self.assertIsNone(self.store.get(2023, 1))
+
+    def test_missing_input(self):
+        digest = self.store.put(2023, 1, "1\n2\n")
+        self.store._object_path(digest).unlink()
+        self.assertIsNone(self.store.get(2023, 1))
+
+    def test_corrupt_entry(self):
+        self.store.put(2023, 1, "1\n2\n")
+        self.store._entry_path(2023, 1).write_text("{")
+        self.assertIsNone(self.store.entry(2023, 1))
+        self.assertIsNone(self.store.get(2023, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
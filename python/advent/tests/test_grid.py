@@ -0,0 +1,80 @@
+import unittest
+
+from advent.grid import Grid
+
+EXAMPLE = """\
+abc
+def
+"""
+
+
+class TestGrid(unittest.TestCase):
+    def test_parse(self):
+        grid = Grid.parse(EXAMPLE)
+        self.assertEqual((grid.rows, grid.cols, len(grid)), (2, 3, 6))
+        self.assertEqual(grid.steps, (-3, 1, 3, -1))
+        self.assertEqual(str(grid), EXAMPLE.strip())
+        self.assertEqual(grid[grid.index(1, 2)], ord("f"))
+
+    def test_parse_digits(self):
+        grid = Grid.parse("19\n05\n", digits=True)
+        self.assertEqual(list(grid.data), [1, 9, 0, 5])
+
+    def test_parse_uneven_rows(self):
+        with self.assertRaises(ValueError):
+            Grid.parse("abc\nde\n")
+
+    def test_index_and_point(self):
+        for grid in (Grid.parse(EXAMPLE), Grid.parse(EXAMPLE, border="#")):
+            for row in range(grid.rows):
+                for col in range(grid.cols):
+                    self.assertEqual(grid.point(grid.index(row, col)), (row, col))
+
+    def test_border(self):
+        grid = Grid.parse(EXAMPLE, border="#")
+        self.assertEqual((grid.row_stride, grid.offset), (5, 6))
+        self.assertEqual(len(grid.data), 4 * 5)
+        self.assertEqual(str(grid), EXAMPLE.strip())
+        # Every step off the edge of the grid lands on the border.
+        corner = grid.index(0, 0)
+        up, right, down, left = (grid[corner + step] for step in grid.steps)
+        self.assertEqual((up, left), (ord("#"), ord("#")))
+        self.assertEqual((right, down), (ord("b"), ord("d")))
+
+    def test_neighbors(self):
+        grid = Grid.parse(EXAMPLE, border=0)
+        neighbors = grid.neighbors(grid.index(0, 0))
+        self.assertEqual([grid.point(index) for index in neighbors], [(0, 1), (1, 0)])
+        neighbors = grid.neighbors(grid.index(1, 1))
+        self.assertEqual(
+            [grid.point(index) for index in neighbors], [(0, 1), (1, 2), (1, 0)]
+        )
+
+    def test_find(self):
+        grid = Grid.parse(EXAMPLE, border="#")
+        self.assertEqual(grid.point(grid.find("e")), (1, 1))
+        with self.assertRaises(ValueError):
+            grid.find("#")  # Only in the border.
+
+    def test_transpose(self):
+        grid = Grid.parse(EXAMPLE, border="#")
+        transposed = grid.transpose()
+        self.assertEqual((transposed.rows, transposed.cols), (3, 2))
+        self.assertEqual(str(transposed), "ad\nbe\ncf")
+        self.assertEqual(transposed.steps, (-1, 5, 1, -5))
+        self.assertEqual(transposed.point(transposed.index(2, 1)), (2, 1))
+        self.assertEqual(list(transposed.indices()), [6, 11, 7, 12, 8, 13])
+        # A view shares its data with the grid.
+        transposed[transposed.index(2, 0)] = ord("z")
+        self.assertEqual(grid.row(0), b"abz")
+
+    def test_copy(self):
+        grid = Grid.parse(EXAMPLE)
+        copy = grid.copy()
+        copy[0] = ord("z")
+        self.assertEqual(grid.row(0), b"abc")
+        self.assertEqual(copy.row(0), b"zbc")
+
+
+if __name__ == "__main__":
+    unittest.main()
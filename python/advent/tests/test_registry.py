@@ -0,0 +1,244 @@
+from types import ModuleType
+import unittest
+import warnings
+
+from advent import registry
+from advent.registry import PARSE, Registration, parser, scan_source, solution, solver
+
+
+class TestScanSource(unittest.TestCase):
+    def test_literals_and_constants(self):
+        source = """
+from advent.registry import parser, solution
+
+YEAR = 2023
+DAY = 9
+
+@parser(YEAR, DAY, mutable=False)
+def parse(input):
+    ...
+
+@solution(YEAR, DAY, 2)
+def part2(seqs):
+    ...
+
+@solution(2023, 9, 1)
+def part1(seqs):
+    ...
+"""
+        self.assertEqual(
+            scan_source(source),
+            [
+                Registration(2023, 9, PARSE, "parse"),
+                Registration(2023, 9, "part1", "part1"),
+                Registration(2023, 9, "part2", "part2"),
+            ],
+        )
+
+    def test_attribute(self):
+        source = """
+from advent import registry
+
+@registry.solution(2022, 5, 1)
+def part1(input):
+    ...
+"""
+        self.assertEqual(scan_source(source), [Registration(2022, 5, "part1", "part1")])
+
+    def test_main_guard_and_docstring(self):
+        source = '''
+"""Day 1."""
+from advent.registry import solution
+
+@solution(2021, 1, 1)
+def part1(input):
+    ...
+
+if __name__ == "__main__":
+    print(part1(input()))
+'''
+        self.assertEqual(scan_source(source), [Registration(2021, 1, "part1", "part1")])
+
+    def test_only_module_level_functions(self):
+        source = """
+from advent.registry import solution
+
+class Day:
+    @solution(2021, 1, 1)
+    def part1(self, input):
+        ...
+"""
+        self.assertEqual(scan_source(source), [])
+
+    def test_not_literal(self):
+        source = """
+from advent.registry import solution
+
+@solution(2023, 9, PART)
+def part1(input):
+    ...
+"""
+        with self.assertRaisesRegex(SyntaxError, "day09.py:4: can't tell which part"):
+            scan_source(source, "day09.py")
+
+    def test_unknown_part(self):
+        source = """
+from advent.registry import solution
+
+@solution(2023, 9, 3)
+def part3(input):
+    ...
+"""
+        with self.assertRaises(SyntaxError):
+            scan_source(source)
+
+    def test_syntax_error(self):
+        with self.assertRaises(SyntaxError):
+            scan_source("def part1(:\n")
+
+    def test_import_unsafe(self):
+        source = """
+from advent.registry import solution
+
+@solution(2023, 9, PART)
+def part1(input):
+    ...
+
+print(part1(open("input.txt").read()))
+"""
+        # It's skipped before its arguments are even looked at.
+        with self.assertWarnsRegex(UserWarning, "day09.py: skipped"):
+            self.assertEqual(scan_source(source, "day09.py"), [])
+
+    def test_import_unsafe_assignment(self):
+        source = """
+from advent import get_puzzle_input
+from advent.registry import solution
+
+INPUT = get_puzzle_input(2023, 10)
+
+@solution(2023, 10, 1)
+def part1(input):
+    ...
+"""
+        with self.assertWarnsRegex(UserWarning, "day10.py: skipped"):
+            self.assertEqual(scan_source(source, "day10.py"), [])
+
+    def test_import_safe_assignments(self):
+        source = """
+from collections import namedtuple
+import re
+from advent.registry import solution
+
+Move = namedtuple("Move", "count src dst")
+PATTERN = re.compile(r"\\d+")
+DIGITS = {frozenset("cf"): 1}
+WORDS = "one two".split()
+
+@solution(2022, 5, 1)
+def part1(input):
+    ...
+"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(
+                scan_source(source), [Registration(2022, 5, "part1", "part1")]
+            )
+
+    def test_import_unsafe_without_registrations(self):
+        source = """
+def part1(input):
+    ...
+
+print(part1(open("input.txt").read()))
+"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(scan_source(source), [])
+
+
+class TestSolver(unittest.TestCase):
+    def setUp(self):
+        self.module = ModuleType("advent_test_registry_module")
+        self.module.__file__ = "advent_test_registry_module.py"
+        self.addCleanup(self.unregister)
+        self.parsed = []
+
+    def unregister(self):
+        for part in (*registry.PARTS, PARSE):
+            registry._registry.pop((self.module.__name__, part), None)
+        registry._models.clear()
+
+    def register(self, mutable: bool) -> None:
+        def parse(input):
+            self.parsed.append(input)
+            return [int(line) for line in input.split()]
+
+        def part1(numbers):
+            numbers.sort()
+            return numbers[0]
+
+        def part2(numbers):
+            return numbers[0]
+
+        for func in (parse, part1, part2):
+            func.__module__ = self.module.__name__
+        parser(2023, 1, mutable)(parse)
+        solution(2023, 1, 1)(part1)
+        solution(2023, 1, 2)(part2)
+
+    def test_without_parser(self):
+        def part1(input):
+            return input.upper()
+
+        part1.__module__ = self.module.__name__
+        solution(2023, 1, 1)(part1)
+        self.assertIs(solver(self.module, "part1"), part1)
+
+    def test_unregistered(self):
+        with self.assertRaisesRegex(RuntimeError, "doesn't register part2"):
+            solver(self.module, "part2")
+
+    def test_unknown_part(self):
+        with self.assertRaises(ValueError):
+            solution(2023, 1, 3)
+
+    def test_mutable_model(self):
+        self.register(mutable=True)
+        self.assertEqual(solver(self.module, "part1")("3 1 2"), 1)
+        # Sorting part 1's model didn't change part 2's.
+        self.assertEqual(solver(self.module, "part2")("3 1 2"), 3)
+        # Each part parsed the input itself.
+        self.assertEqual(self.parsed, ["3 1 2", "3 1 2"])
+
+    def test_shared_model(self):
+        self.register(mutable=False)
+        self.assertEqual(solver(self.module, "part2")("3 1 2"), 3)
+        self.assertEqual(solver(self.module, "part2")("3 1 2"), 3)
+        self.assertEqual(solver(self.module, "part2")("4 5"), 4)
+        self.assertEqual(self.parsed, ["3 1 2", "4 5"])
+        # Unless each call should include parsing.
+        solver(self.module, "part2", reuse_models=False)("4 5")
+        self.assertEqual(self.parsed, ["3 1 2", "4 5", "4 5"])
+
+    def test_model_cache_size(self):
+        self.register(mutable=False)
+        part2 = solver(self.module, "part2")
+        inputs = [str(i) for i in range(registry.MODEL_CACHE_SIZE + 1)]
+        for input in inputs:
+            part2(input)
+        # The first input was evicted, and the rest are still kept.
+        part2(inputs[0])
+        part2(inputs[-1])
+        self.assertEqual(self.parsed, [*inputs, inputs[0]])
+
+    def test_registering_again(self):
+        self.register(mutable=False)
+        self.register(mutable=True)
+        solver(self.module, "part2")("1")
+        solver(self.module, "part2")("1")
+        self.assertEqual(self.parsed, ["1", "1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
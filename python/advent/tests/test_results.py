@@ -0,0 +1,100 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from advent.results import ResultCache, solution_source
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = pathlib.Path(tmp.name)
+        self.results = ResultCache(self.root, max_entries=2)
+
+    def test_key(self):
+        key = ResultCache.key(b"source", b"input", "part1")
+        self.assertEqual(key, ResultCache.key(b"source", b"input", "part1"))
+        self.assertNotEqual(key, ResultCache.key(b"source", b"input", "part2"))
+        self.assertNotEqual(key, ResultCache.key(b"source", b"input!", "part1"))
+        self.assertNotEqual(key, ResultCache.key(b"source!", b"input", "part1"))
+        # Source and input don't run into each other.
+        self.assertNotEqual(key, ResultCache.key(b"sourcein", b"put", "part1"))
+
+    def test_put_and_get(self):
+        key = ResultCache.key(b"source", b"input", "part1")
+        self.assertIsNone(self.results.get(key))
+        self.assertTrue(self.results.put(key, "CMZ", 0.5))
+        hit = self.results.get(key)
+        self.assertEqual((hit.answer, hit.seconds), ("CMZ", 0.5))
+
+    def test_only_json_answers(self):
+        key = ResultCache.key(b"source", b"input", "part1")
+        self.assertFalse(self.results.put(key, {1, 2}, 0.5))
+        # Tuples would come back as lists.
+        self.assertFalse(self.results.put(key, (1, 2), 0.5))
+        self.assertIsNone(self.results.get(key))
+
+    def test_evict(self):
+        keys = [ResultCache.key(b"source", b"input", str(i)) for i in range(4)]
+        for i, key in enumerate(keys):
+            self.results.put(key, i, 0.0)
+            os.utime(self.results._path(key), (i, i))
+        # Getting an answer makes it the most recently used.
+        self.results.get(keys[0])
+        self.assertEqual(self.results.evict(), 2)
+        self.assertEqual(self.results.evict(), 0)
+        kept = [key for key in keys if self.results.get(key) is not None]
+        self.assertEqual(kept, [keys[0], keys[3]])
+
+    def test_evicted_while_getting(self):
+        key = ResultCache.key(b"source", b"input", "part1")
+        self.results.put(key, 1, 0.0)
+        with mock.patch("advent.results.os.utime", side_effect=FileNotFoundError):
+            self.assertIsNone(self.results.get(key))
+
+    def test_corrupt_entry(self):
+        key = ResultCache.key(b"source", b"input", "part1")
+        self.results.put(key, 1, 0.0)
+        self.results._path(key).write_text("{")
+        self.assertIsNone(self.results.get(key))
+
+
+class TestSolutionSource(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.day = pathlib.Path(tmp.name) / "2023" / "12"
+        (self.day / "backtracking").mkdir(parents=True)
+        self.solution = self.day / "day12.py"
+        self.solution.write_text("from backtracking import backtrack\n")
+        self.helper = self.day / "backtracking" / "backtrack.py"
+        self.helper.write_text("finished = False\n")
+
+    def test_changes_with_the_solution(self):
+        source = solution_source(self.solution)
+        self.assertEqual(solution_source(self.solution), source)
+        self.solution.write_text("from backtracking import backtrack as b\n")
+        self.assertNotEqual(solution_source(self.solution), source)
+
+    def test_changes_with_modules_it_may_import(self):
+        source = solution_source(self.solution)
+        self.helper.write_text("finished = True\n")
+        self.assertNotEqual(solution_source(self.solution), source)
+
+    def test_ignores_other_files(self):
+        source = solution_source(self.solution)
+        (self.day / "input.txt").write_text("1\n")
+        (self.day / "day12.part1.pstats").write_bytes(b"\0")
+        self.assertEqual(solution_source(self.solution), source)
+
+    def test_differs_by_module(self):
+        other = self.day / "day12_other.py"
+        other.write_text("")
+        self.assertNotEqual(solution_source(other), solution_source(self.solution))
+
+
+if __name__ == "__main__":
+    unittest.main()
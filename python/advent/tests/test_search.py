@@ -0,0 +1,130 @@
+import random
+import unittest
+
+from advent.grid import Grid
+from advent.search import SearchStats, astar, dial, dijkstra
+
+
+def random_costs(rng: random.Random, rows: int, cols: int) -> Grid:
+    "A grid of step costs from 1 to 9, with walls (0s) in between and around it."
+    text = "\n".join(
+        "".join(rng.choice("123456789000") for _ in range(cols)) for _ in range(rows)
+    )
+    return Grid.parse(text, border=0, digits=True)
+
+
+class TestSearch(unittest.TestCase):
+    def test_agree(self):
+        rng = random.Random(1)
+        reachable = 0
+        for _ in range(100):
+            grid = random_costs(rng, rng.randint(1, 12), rng.randint(1, 12))
+            start = grid.index(0, 0)
+            goal = grid.index(grid.rows - 1, grid.cols - 1)
+            goal_row, goal_col = grid.point(goal)
+
+            def neighbors(state):
+                for step in grid.steps:
+                    if cost := grid[state + step]:
+                        yield state + step, cost
+
+            def is_goal(state):
+                return state == goal
+
+            # Every step costs at least 1, so this never overestimates.
+            def manhattan(state):
+                row, col = grid.point(state)
+                return abs(goal_row - row) + abs(goal_col - col)
+
+            with self.subTest(grid=str(grid)):
+                cost = dijkstra([start], neighbors, is_goal)
+                self.assertEqual(astar([start], neighbors, is_goal, manhattan), cost)
+                self.assertEqual(dial([start], neighbors, is_goal, 9), cost)
+                reachable += cost is not None
+        # Some grids are walled off, but not all of them.
+        self.assertTrue(10 < reachable < 100)
+
+    def test_known_path(self):
+        # The cheapest path goes around the 9s.
+        grid = Grid.parse("0111\n9991\n1111\n1999\n1111", border="#", digits=True)
+        goal = grid.index(4, 3)
+
+        def neighbors(state):
+            return [
+                (state + step, grid[state + step])
+                for step in grid.steps
+                if grid[state + step] != grid.border
+            ]
+
+        def is_goal(state):
+            return state == goal
+
+        start = grid.index(0, 0)
+        self.assertEqual(dijkstra([start], neighbors, is_goal), 13)
+        self.assertEqual(dial([start], neighbors, is_goal, 9), 13)
+
+    def test_several_starts(self):
+        # States are positions on a line, and steps go right.
+        def neighbors(state):
+            return [(state + 1, 2)] if state < 10 else []
+
+        def is_goal(state):
+            return state == 10
+
+        self.assertEqual(dijkstra([0, 7], neighbors, is_goal), 6)
+        self.assertEqual(dial([0, 7], neighbors, is_goal, 2), 6)
+        self.assertEqual(dijkstra([10], neighbors, is_goal), 0)
+
+    def test_free_steps(self):
+        # Even steps are free, odd ones cost 1.
+        def neighbors(state):
+            return [(state + 1, state % 2)] if state < 10 else []
+
+        def is_goal(state):
+            return state == 10
+
+        self.assertEqual(dijkstra([0], neighbors, is_goal), 5)
+        self.assertEqual(dial([0], neighbors, is_goal, 1), 5)
+
+    def test_unreachable(self):
+        def neighbors(state):
+            return [(state + 1, 1)] if state < 5 else []
+
+        def is_goal(state):
+            return state == 10
+
+        self.assertIsNone(dijkstra([0], neighbors, is_goal))
+        self.assertIsNone(dial([0], neighbors, is_goal, 1))
+
+    def test_dial_step_cost_out_of_range(self):
+        def is_goal(state):
+            return state == 10
+
+        for step_cost in (-1, 3):
+            with self.subTest(step_cost=step_cost):
+
+                def neighbors(state):
+                    return [(state + 1, step_cost)] if state < 10 else []
+
+                with self.assertRaisesRegex(ValueError, "outside 0..2"):
+                    dial([0], neighbors, is_goal, 2)
+
+    def test_stats(self):
+        def neighbors(state):
+            return [(state + 1, 1), (state + 2, 3)] if state < 10 else []
+
+        def is_goal(state):
+            return state == 10
+
+        stats = SearchStats()
+        self.assertEqual(dijkstra([0], neighbors, is_goal, stats), 10)
+        self.assertEqual(stats.expanded, 10)
+        self.assertGreaterEqual(stats.pushed, stats.popped)
+        self.assertGreater(stats.popped, stats.expanded)
+        # Stats add up over searches.
+        dial([0], neighbors, is_goal, 3, stats)
+        self.assertEqual(stats.expanded, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
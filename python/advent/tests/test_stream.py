@@ -0,0 +1,30 @@
+import pathlib
+import tempfile
+import unittest
+
+from advent.stream import iter_lines, read_lines, split_records
+
+
+class TestStream(unittest.TestCase):
+    def test_read_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = pathlib.Path(tmp) / "input.txt"
+            path.write_text("a" * 100 + "\nb\n\nc")
+            # Lines longer than a chunk are still read whole.
+            lines = list(read_lines(path, chunk_size=16))
+        self.assertEqual(lines, ["a" * 100, "b", "", "c"])
+
+    def test_split_records(self):
+        lines = ["", "a", "b", "", "", "c", ""]
+        self.assertEqual(list(split_records(lines)), ["a\nb", "c"])
+        self.assertEqual(list(split_records([])), [])
+
+    def test_iter_lines(self):
+        self.assertEqual(list(iter_lines("a\nb\n")), ["a", "b"])
+        self.assertEqual(list(iter_lines("a\n\nb")), ["a", "", "b"])
+        lines = iter(["a", "b"])
+        self.assertIs(iter_lines(lines), lines)
+
+
+if __name__ == "__main__":
+    unittest.main()